@@ -0,0 +1,234 @@
+"""
+Stand-in for an Eve API, good enough for benchmarking the clients: one
+in-memory resource with item/collection GETs, ``$in`` lookups, pagination,
+conditional GETs, bulk POST and If-Match PATCH/DELETE, and gzip responses.
+Latency, errors and 403s can be injected.
+"""
+import gzip
+import json
+import random
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+
+
+class EveStore:
+    def __init__(self):
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    def insert(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).strftime(DATE_FORMAT)
+        document = {
+            **payload,
+            "_id": payload.get("_id") or uuid.uuid4().hex[:24],
+            "_etag": uuid.uuid4().hex,
+            "_created": now,
+            "_updated": now,
+        }
+        with self.lock:
+            self.documents[document["_id"]] = document
+        return document
+
+    def seed(self, count: int, size: int = 10) -> List[str]:
+        return [self.insert({f"field{i}": i for i in range(size)})["_id"] for _ in range(count)]
+
+
+class EveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "EveServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: Optional[Any] = None, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body).encode() if body is not None else b""
+        headers = dict(headers or {})
+        if self.server.compress and len(data) >= 1024 and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def _route(self):
+        """Return (resource id or None) or reply with an injected failure."""
+        server = self.server
+        if server.latency:
+            sleep(server.latency)
+        if server.error_rate and random.random() < server.error_rate:
+            self._body()
+            self._reply(503, {"_status": "ERR"})
+            return False, None
+        if self.command != "GET" and server.forbidden_rate and random.random() < server.forbidden_rate:
+            self._body()
+            self._reply(403, {"_status": "ERR"})
+            return False, None
+
+        path = urlparse(self.path).path.strip("/").split("/")
+        return True, path[1] if len(path) > 1 else None
+
+    @staticmethod
+    def _projection(query: Dict[str, List[str]]) -> Optional[List[str]]:
+        if "projection" not in query:
+            return None
+        return [field for field, include in json.loads(query["projection"][0]).items() if include]
+
+    @staticmethod
+    def _project(document: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        if not fields:
+            return document
+        # Eve always returns the meta fields
+        return {key: value for key, value in document.items() if key in fields or key.startswith("_")}
+
+    def do_GET(self):
+        ok, resource_id = self._route()
+        if not ok:
+            return
+        store = self.server.store
+
+        if resource_id == "status":
+            return self._reply(200, {"status": "ok"})
+
+        if resource_id is not None:
+            document = store.documents.get(resource_id)
+            if document is None:
+                return self._reply(404, {"_status": "ERR"})
+            if self.headers.get("If-None-Match") == document["_etag"]:
+                return self._reply(304)
+            fields = self._projection(parse_qs(urlparse(self.path).query))
+            return self._reply(200, self._project(document, fields), {"ETag": document["_etag"]})
+
+        query = parse_qs(urlparse(self.path).query)
+        fields = self._projection(query)
+        where = json.loads(query.get("where", ["{}"])[0])
+        page = int(query.get("page", ["1"])[0])
+        max_results = min(int(query.get("max_results", [self.server.page_size])[0]), self.server.max_page_size)
+
+        ids = where.get("_id", {}).get("$in") if isinstance(where.get("_id"), dict) else None
+        if ids is not None:
+            items = [store.documents[_id] for _id in ids if _id in store.documents]
+        else:
+            with store.lock:
+                items = list(store.documents.values())
+
+        start = (page - 1) * max_results
+        body: Dict[str, Any] = {
+            "_items": [self._project(item, fields) for item in items[start:start + max_results]],
+            "_meta": {"page": page, "max_results": max_results, "total": len(items)},
+            "_links": {},
+        }
+        if start + max_results < len(items):
+            body["_links"]["next"] = {"href": f"{self.path.split('?')[0]}?page={page + 1}"}
+        self._reply(200, body)
+
+    def do_POST(self):
+        ok, _ = self._route()
+        if not ok:
+            return
+        payload = self._body()
+        store = self.server.store
+
+        if isinstance(payload, list):
+            items = [store.insert(document) for document in payload]
+            body = {
+                "_status": "OK",
+                "_items": [{"_id": d["_id"], "_etag": d["_etag"], "_status": "OK"} for d in items],
+            }
+            return self._reply(201, body)
+
+        document = store.insert(payload)
+        self._reply(201, {"_id": document["_id"], "_etag": document["_etag"], "_status": "OK"})
+
+    def _conditional(self, resource_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        document = self.server.store.documents.get(resource_id) if resource_id else None
+        if document is None:
+            self._reply(404, {"_status": "ERR"})
+            return None
+        if self.headers.get("If-Match") != document["_etag"]:
+            self._reply(412, {"_status": "ERR"})
+            return None
+        return document
+
+    def do_PATCH(self):
+        ok, resource_id = self._route()
+        if not ok:
+            return
+        payload = self._body() or {}
+        store = self.server.store
+
+        with store.lock:
+            document = self._conditional(resource_id)
+            if document is None:
+                return
+            document.update(payload)
+            document["_etag"] = uuid.uuid4().hex
+            document["_updated"] = datetime.now(timezone.utc).strftime(DATE_FORMAT)
+        self._reply(200, {"_id": resource_id, "_etag": document["_etag"], "_status": "OK"})
+
+    def do_DELETE(self):
+        ok, resource_id = self._route()
+        if not ok:
+            return
+        store = self.server.store
+
+        with store.lock:
+            if self._conditional(resource_id) is None:
+                return
+            del store.documents[resource_id]
+        self._reply(204)
+
+
+class EveServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        page_size: int = 25,
+        max_page_size: int = 1000,
+        error_rate: float = 0.0,
+        forbidden_rate: float = 0.0,
+        compress: bool = False,
+    ):
+        super().__init__((host, port), EveHandler)
+        self.store = EveStore()
+        self.latency = latency
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.forbidden_rate = forbidden_rate
+        self.compress = compress
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/things"
+
+    def start(self) -> "EveServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="eve-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
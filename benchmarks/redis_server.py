@@ -0,0 +1,127 @@
+"""
+Stand-in for a standalone Redis master speaking RESP2, covering the commands
+used by the clients: ROLE, strings (with EX/PX/NX), MGET, DEL, EXISTS, EXPIRE and
+hashes. Expirations are accepted and ignored.
+"""
+import socketserver
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class RedisStore:
+    def __init__(self):
+        self.data: Dict[bytes, Any] = {}
+        self.lock = threading.Lock()
+
+
+def _encode(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, Exception):
+        return b"-ERR %s\r\n" % str(value).encode()
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode(item) for item in value)
+    raise TypeError(type(value))
+
+
+class RedisHandler(socketserver.StreamRequestHandler):
+    server: "RedisServer"
+    disable_nagle_algorithm = True
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            try:
+                reply = self.server.execute(command[0].lower().decode(), command[1:])
+            except Exception as e:
+                reply = e
+            self.wfile.write(_encode(reply))
+
+
+class RedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), RedisHandler)
+        self.store = RedisStore()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        host, port = self.server_address[:2]
+        return {"host": host, "port": port, "socket_timeout": 1}
+
+    def start(self) -> "RedisServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="redis-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def execute(self, name: str, args: List[bytes]) -> Any:
+        data = self.store.data
+        with self.store.lock:
+            if name == "ping":
+                return "PONG"
+            if name in ("client", "select"):
+                return "OK"
+            if name == "info":
+                return b"# Replication\r\nrole:master\r\n"
+            if name == "role":
+                return [b"master", 0, []]
+            if name == "get":
+                return data.get(args[0])
+            if name == "set":
+                options = [arg.lower() for arg in args[2:]]
+                if b"nx" in options and args[0] in data:
+                    return None
+                data[args[0]] = args[1]
+                return "OK"
+            if name == "mget":
+                return [data.get(key) if isinstance(data.get(key), bytes) else None for key in args]
+            if name == "del":
+                return sum(1 for key in args if data.pop(key, None) is not None)
+            if name == "exists":
+                return sum(1 for key in args if key in data)
+            if name == "expire":
+                return int(args[0] in data)
+            if name == "hset":
+                hash_ = data.setdefault(args[0], {})
+                added = 0
+                for field, value in zip(args[1::2], args[2::2]):
+                    added += field not in hash_
+                    hash_[field] = value
+                return added
+            if name == "hget":
+                return data.get(args[0], {}).get(args[1])
+            if name == "hgetall":
+                return [item for pair in data.get(args[0], {}).items() for item in pair]
+            if name == "hdel":
+                hash_ = data.get(args[0], {})
+                return sum(1 for field in args[1:] if hash_.pop(field, None) is not None)
+        return Exception(f"unknown command '{name}'")
@@ -0,0 +1,221 @@
+"""
+Benchmark the main client paths against local stand-in Eve and Redis servers.
+
+    python -m benchmarks.run --iterations 500 --output results.json
+    python -m benchmarks.run --only eve_get redis_get --latency 0.002
+
+Every scenario reports throughput, p50/p99 latency in milliseconds and the
+peak memory allocated during a shorter extra pass under tracemalloc. Results are printed as a
+table and, with ``--output``, written as JSON for comparing versions.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from rest_clients.eve_rest import EveApiRest
+from rest_clients.redis_client import RedisClient
+from rest_clients.write_behind import WriteBehindBuffer
+from .eve_server import EveServer
+from .redis_server import RedisServer
+
+
+MEMORY_ITERATIONS = 20
+
+
+class StaticAuth:
+    def __init__(self):
+        self.refreshes = 0
+
+    def get_token(self) -> str:
+        return f"Bearer token-{self.refreshes}"
+
+    def update_token(self):
+        self.refreshes += 1
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(operation: Callable[[int], Any], indexes: range, concurrency: int) -> List[Tuple[float, bool]]:
+    def timed(i: int) -> Tuple[float, bool]:
+        started = perf_counter()
+        try:
+            operation(i)
+            return perf_counter() - started, True
+        except Exception:
+            return perf_counter() - started, False
+
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(timed, indexes))
+    return [timed(i) for i in indexes]
+
+
+def measure(name: str, operation: Callable[[int], Any], iterations: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Time ``operation(i)`` for ``iterations`` values of i on ``concurrency``
+    threads, then run a shorter pass under tracemalloc for peak memory
+    (tracing slows everything down, so it is kept out of the timings).
+    """
+    started = perf_counter()
+    outcomes = run(operation, range(iterations), concurrency)
+    elapsed = perf_counter() - started
+
+    tracemalloc.start()
+    run(operation, range(iterations, iterations + min(iterations, MEMORY_ITERATIONS)), concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [latency for latency, _ in outcomes]
+    return {
+        "name": name,
+        "iterations": iterations,
+        "concurrency": concurrency,
+        "errors": sum(1 for _, ok in outcomes if not ok),
+        "elapsed_s": elapsed,
+        "throughput_ops": iterations / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def eve_scenarios(client: EveApiRest, server: EveServer, args) -> Dict[str, Callable[[int], Any]]:
+    ids = server.store.seed(args.documents)
+    # every write/delete call gets its own document, memory pass included
+    write_ids = server.store.seed(args.iterations + MEMORY_ITERATIONS)
+    delete_ids = server.store.seed(args.iterations + MEMORY_ITERATIONS)
+    lookup = args.lookup_size
+    # flushed by hand, once per call
+    buffer = WriteBehindBuffer(client, start=False)
+
+    def patch_write_behind(i: int):
+        for j in range(lookup):
+            buffer.patch(write_ids[i], {"bench": i, f"field{j % 10}": j})
+        buffer.flush()
+
+    return {
+        "eve_status": lambda i: client.status(),
+        "eve_get": lambda i: client.get(ids[i % len(ids)]),
+        "eve_get_projection": lambda i: client.get(ids[i % len(ids)], projection=["field0", "field1"]),
+        "eve_get_items_by_id": lambda i: client.get_items_by_id(
+            [ids[(i * lookup + j) % len(ids)] for j in range(lookup)]
+        ),
+        "eve_get_columns_by_id": lambda i: client.get_columns_by_id(
+            [ids[(i * lookup + j) % len(ids)] for j in range(lookup)],
+            ["field0", "field1"],
+            types={"field0": "q", "field1": "q"},
+        ),
+        "eve_iter_items": lambda i: sum(1 for _ in client.iter_items(max_results=args.page_size)),
+        "eve_iter_items_stream": lambda i: sum(1 for _ in client.iter_items(max_results=args.page_size, stream=True)),
+        "eve_post": lambda i: client.post({"bench": i}),
+        "eve_post_many": lambda i: client.post_many([{"bench": i, "n": j} for j in range(lookup)]),
+        "eve_patch": lambda i: client.patch(write_ids[i], {"bench": i}),
+        "eve_patch_write_behind": patch_write_behind,
+        "eve_delete": lambda i: client.delete(delete_ids[i]),
+    }
+
+
+def redis_scenarios(client: RedisClient, args) -> Dict[str, Callable[[int], Any]]:
+    keys = [f"bench:{i}" for i in range(args.documents)]
+    client.set_many({key: b"x" * 64 for key in keys})
+
+    return {
+        "redis_get": lambda i: client.get_value(keys[i % len(keys)]),
+        "redis_set": lambda i: client.set_value(f"bench:set:{i}", b"x" * 64, ex=60),
+        "redis_get_many": lambda i: client.get_many(keys[:args.lookup_size]),
+        "redis_set_many": lambda i: client.set_many({f"bench:many:{i}:{j}": j for j in range(args.lookup_size)}),
+        "redis_hash_set": lambda i: client.hash_set_multiple(f"bench:hash:{i}", {"a": 1, "b": 2, "c": 3}),
+        "redis_hash_get_all": lambda i: client.hash_get_all(f"bench:hash:{i}"),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def parse_args(argv: List[str]):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--documents", type=int, default=1000, help="documents/keys seeded before running")
+    parser.add_argument("--lookup-size", type=int, default=50, help="ids per bulk lookup, keys per batch")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every Eve response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of Eve requests failing with 503")
+    parser.add_argument("--forbidden-rate", type=float, default=0.0, help="fraction of Eve writes failing with 403")
+    parser.add_argument("--gzip", action="store_true", help="gzip Eve responses larger than 1 KB")
+    parser.add_argument("--only", nargs="*", help="scenario names to run (default: all)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> Dict[str, Any]:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    eve_server = EveServer(
+        latency=args.latency,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        forbidden_rate=args.forbidden_rate,
+        compress=args.gzip,
+    ).start()
+    redis_server = RedisServer().start()
+
+    eve = EveApiRest(eve_server.url, pool_maxsize=max(10, args.concurrency))
+    eve.auth_handler = StaticAuth()
+    redis = RedisClient(redis_server.config)
+
+    results = []
+    try:
+        scenarios = {**eve_scenarios(eve, eve_server, args), **redis_scenarios(redis, args)}
+        for name, operation in scenarios.items():
+            if args.only and name not in args.only:
+                continue
+            results.append(measure(name, operation, args.iterations, args.concurrency))
+    finally:
+        eve.close()
+        redis.close()
+        eve_server.stop()
+        redis_server.stop()
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": vars(args),
+        "results": results,
+    }
+
+    print(f"{'scenario':<22}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KB':>10}{'errors':>8}")
+    for result in results:
+        print(
+            f"{result['name']:<22}{result['throughput_ops']:>10.1f}{result['p50_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['peak_memory_kb']:>10.1f}{result['errors']:>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
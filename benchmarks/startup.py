@@ -0,0 +1,93 @@
+"""
+Measure process startup: the time for a fresh interpreter to import the
+package and build clients, which is what short-lived jobs and serverless
+cold starts pay on every run.
+
+    python -m benchmarks.startup --runs 20 --output startup.json
+
+Each snippet runs ``--runs`` times in a new process; the interpreter's own
+startup (``python -c pass``) is reported as a baseline.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Dict, List
+
+from .redis_server import RedisServer
+from .run import git_revision, percentile
+
+
+SNIPPETS = {
+    "baseline": "pass",
+    "import_package": "import rest_clients",
+    "import_eve": "from rest_clients import EveApiRest",
+    "import_redis": "from rest_clients import RedisClient",
+    "eve_client": "from rest_clients import EveApiRest; EveApiRest('http://127.0.0.1:1/things')",
+    "redis_client": "from rest_clients import RedisClient; RedisClient({config})",
+    "redis_client_lazy": "from rest_clients import RedisClient; RedisClient({lazy_config})",
+}
+
+
+def time_snippet(code: str, runs: int) -> Dict[str, Any]:
+    samples = []
+    for _ in range(runs):
+        started = perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        samples.append(perf_counter() - started)
+    return {
+        "runs": runs,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def parse_args(argv: List[str]):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--only", nargs="*", help="snippet names to run (default: all)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> Dict[str, Any]:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    redis_server = RedisServer().start()
+    config = redis_server.config
+
+    results = {}
+    try:
+        for name, code in SNIPPETS.items():
+            if args.only and name not in args.only:
+                continue
+            code = code.format(config=repr(config), lazy_config=repr({**config, "lazy_connect": True}))
+            results[name] = time_snippet(code, args.runs)
+    finally:
+        redis_server.stop()
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": vars(args),
+        "results": results,
+    }
+
+    print(f"{'snippet':<22}{'p50 ms':>10}{'min ms':>10}{'max ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<22}{result['p50_ms']:>10.1f}{result['min_ms']:>10.1f}{result['max_ms']:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
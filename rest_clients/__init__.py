@@ -1 +1,33 @@
-from rest_clients.eve_rest import EveApiRest  # noqa
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from rest_clients.eve_rest import EveApiRest  # noqa
+
+# public name -> submodule, imported on first access so that importing the
+# package does not pull in requests/redis/httpx until they are needed
+_LAZY_ATTRIBUTES = {
+    "EveApiRest": "rest_clients.eve_rest",
+    "EveClient": "rest_clients.eve_client",
+    "AsyncEveApiRest": "rest_clients.async_eve_rest",
+    "RestClient": "rest_clients._generic_rest",
+    "RedisClient": "rest_clients.redis_client",
+    "AsyncRedisClient": "rest_clients.async_redis_client",
+    "ApiRestException": "rest_clients.exceptions",
+    "MissingConfigurationException": "rest_clients.exceptions",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,19 @@
 import logging
-from requests import Session
+import threading
+from time import perf_counter, sleep
+from urllib.parse import urlparse
+from requests import PreparedRequest, RequestException, Session
 from requests.adapters import HTTPAdapter
-from typing import Optional
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
 from urllib3 import Retry
+from .coalesce import SingleFlight
 from .exceptions import MissingConfigurationException
+from .metrics import COMPRESSION_BUCKETS, NULL_METRICS, NullMetrics
+from .retry import CircuitBreaker, RetryPolicy
+
+if TYPE_CHECKING:
+    from .rate_limit import DistributedRateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -11,53 +21,310 @@ logger = logging.getLogger(__name__)
 
 class RestClient:
     DEFAULT_TIMEOUT = 5
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
     BASE_HEADERS = {
         "Cache-Control": "no-cache",
     }
 
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        status_forcelist: Optional[tuple] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: bool = False,
+        metrics: Optional[NullMetrics] = None,
+        accept_encoding: Optional[str] = None,
+        rate_limiter: Optional["DistributedRateLimiter"] = None,
+    ):
         if not url:
             raise MissingConfigurationException("Missing required parameter 'url'")
         self.url = url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = status_forcelist
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        # shared limit consulted before every request, slowed down by 429/5xx
+        self.rate_limiter = rate_limiter
+        self.single_flight = SingleFlight() if single_flight else None
+        # by default every encoding urllib3 can decode here (br/zstd only when installed)
+        self.accept_encoding = accept_encoding or DEFAULT_ACCEPT_ENCODING
+        self._sessions: Dict[int, Session] = {}
+        self._session_lock = threading.Lock()
+        self.metrics = metrics or NULL_METRICS
+        # one label per client, not per document url
+        self.resource = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1] or "/"
+        self.metrics.add_collector(self._collect_pool_metrics)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @staticmethod
     def _retry_session(
         retries: int = 3,
         backoff_factor: float = 0.3,
-        status_forcelist: tuple = (404, 500, 501, 502, 503, 504, 505),
+        status_forcelist: tuple = (),
         session: Optional[Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ) -> Session:
+        """
+        Pooled session whose adapter only retries failed connections (the
+        request never reached the server). Retries on error statuses belong
+        to :class:`RetryPolicy`, the retry budget and the circuit breaker;
+        a non-empty ``status_forcelist`` adds transport-level status retries
+        that bypass them.
+        """
         session = session or Session()
 
         retry = Retry(
             total=retries,
-            read=retries,
             connect=retries,
+            read=0,
+            status=retries if status_forcelist else 0,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
             raise_on_status=False,
         )
 
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def _build_session(self, retries: int) -> Session:
+        options = {
+            "retries": retries,
+            "backoff_factor": self.backoff_factor,
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+        }
+        if self.status_forcelist is not None:
+            options["status_forcelist"] = self.status_forcelist
+        session = self._retry_session(**options)
+        session.headers["Accept-Encoding"] = self.accept_encoding
+        return session
+
+    def _pooled_session(self, retries: Optional[int] = None) -> Session:
+        """
+        Long-lived pooled session shared by every request of this client.
+        One session is kept per retry count and created on first use;
+        ``requests.Session`` is safe to share across threads as long as its
+        adapters are not remounted.
+        """
+        retries = self.retries if retries is None else retries
+        session = self._sessions.get(retries)
+        if session is None:
+            with self._session_lock:
+                session = self._sessions.get(retries)
+                if session is None:
+                    session = self._sessions[retries] = self._build_session(retries)
+        return session
+
+    @property
+    def session(self) -> Session:
+        return self._pooled_session()
+
+    def close(self):
+        """Close the pooled sessions and release their connections."""
+        with self._session_lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Connection pool usage per host, for monitoring.
+        ``connections`` is how many sockets were ever opened, ``idle`` how many
+        are parked in the pool right now.
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        adapters = {
+            adapter
+            for session in list(self._sessions.values())
+            for adapter in session.adapters.values()
+        }
+        for adapter in adapters:
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                queue = pool.pool
+                host = stats.setdefault(
+                    f"{pool.scheme}://{pool.host}:{pool.port}",
+                    {"connections": 0, "requests": 0, "idle": 0, "maxsize": 0},
+                )
+                host["connections"] += pool.num_connections
+                host["requests"] += pool.num_requests
+                if queue is not None:
+                    # urllib3 pre-fills the queue with None placeholders
+                    host["idle"] += sum(1 for conn in list(queue.queue) if conn is not None)
+                    host["maxsize"] += queue.maxsize
+        return stats
+
+    def _collect_pool_metrics(self, metrics: NullMetrics):
+        for host, usage in self.pool_stats().items():
+            metrics.set_gauge("http_pool_connections", usage["connections"], host=host)
+            metrics.set_gauge("http_pool_idle_connections", usage["idle"], host=host)
+            metrics.set_gauge("http_pool_maxsize", usage["maxsize"], host=host)
+            metrics.set_gauge("http_pool_requests", usage["requests"], host=host)
+
+    def _send(self, method: str, *a, session: Optional[Session] = None, **kw):
+        """Send one request through ``session`` (the pooled one by default)."""
+        if self.metrics.enabled:
+            return self._send_measured(method, *a, session=session, **kw)
+        return self._send_unmeasured(method, *a, session=session, **kw)
+
+    def _send_unmeasured(self, method: str, *a, session: Optional[Session] = None, **kw):
+        send = getattr(session or self.session, method)
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter
+        if breaker is None and limiter is None:
+            return send(*a, **kw)
+
+        # an open circuit fails fast without taking a token
+        if breaker is not None:
+            breaker.before_request()
+        success = None
+        try:
+            if limiter is not None:
+                limiter.acquire(self.resource, method.upper())
+            resp = send(*a, **kw)
+            success = resp.status_code < 500
+        except RequestException:
+            success = False
+            raise
+        finally:
+            # anything else (a bug, KeyboardInterrupt) says nothing about the
+            # backend, but must not keep a half-open trial slot forever
+            if breaker is not None:
+                if success is None:
+                    breaker.release()
+                else:
+                    breaker.record(success)
+        if limiter is not None:
+            limiter.record(self.resource, method.upper(), resp.status_code)
+        return resp
+
+    def _send_measured(self, method: str, *a, session: Optional[Session] = None, **kw):
+        metrics = self.metrics
+        labels = {"method": method.upper(), "resource": self.resource}
+        started = perf_counter()
+        try:
+            resp = self._send_unmeasured(method, *a, session=session, **kw)
+        except Exception as e:
+            metrics.observe("http_request_duration_seconds", perf_counter() - started, status="error", **labels)
+            metrics.increment("http_request_errors_total", error=type(e).__name__, **labels)
+            raise
+
+        metrics.observe("http_request_duration_seconds", perf_counter() - started, status=resp.status_code, **labels)
+        body = getattr(resp.request, "body", None)
+        if body:
+            metrics.increment("http_request_bytes_total", len(body), **labels)
+        if kw.get("stream"):
+            length = resp.headers.get("Content-Length")
+            if length:
+                metrics.increment("http_response_bytes_total", int(length), **labels)
+        else:
+            self._record_response_size(resp, labels)
+        return resp
+
+    def _record_response_size(self, resp, labels: Dict[str, str]):
+        """Bytes on the wire and, for compressed responses, after decompression."""
+        metrics = self.metrics
+        decoded = len(resp.content or b"")
+        wire = resp.headers.get("Content-Length")
+        if wire is None:
+            # urllib3 counts the (compressed) bytes it read
+            tell = getattr(resp.raw, "tell", None)
+            wire = tell() if callable(tell) else None
+        wire = int(wire) if isinstance(wire, (int, str)) else decoded
+        if wire:
+            metrics.increment("http_response_bytes_total", wire, **labels)
+
+        encoding = resp.headers.get("Content-Encoding")
+        if encoding and encoding != "identity":
+            metrics.increment("http_response_decoded_bytes_total", decoded, encoding=encoding, **labels)
+            if wire:
+                metrics.observe(
+                    "http_response_compression_ratio",
+                    decoded / wire,
+                    buckets=COMPRESSION_BUCKETS,
+                    encoding=encoding,
+                    **labels,
+                )
+
     def _delete(self, *a, **kw):
-        return self._retry_session().delete(*a, **kw)
+        return self._send("delete", *a, **kw)
+
+    def _coalesce(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run ``func``, sharing the call with concurrent ones for ``key`` when single-flight is on."""
+        if self.single_flight is None:
+            return func()
+        return self.single_flight.do(key, func)
+
+    def _send_retrying(self, method: str, *a, **kw):
+        """
+        Send an idempotent request, retrying up to ``retries`` times on the
+        statuses ``retry_policy`` allows for the method, within its budget.
+        Every attempt goes through :meth:`_send` (breaker, limiter, metrics).
+        """
+        policy = self.retry_policy
+        name = method.upper()
+
+        for attempt in range(1, self.retries + 2):
+            resp = self._send(method, *a, **kw)
+            policy.record_request()
+            if attempt > self.retries or not policy.is_retryable(name, resp.status_code) or not policy.can_retry():
+                return resp
+
+            logger.warning("Request failed: %s %s (attempt %d)", resp, resp.reason, attempt)
+            if self.metrics.enabled:
+                self.metrics.increment("http_retries_total", method=name, resource=self.resource, status=resp.status_code)
+            resp.close()
+            sleep(policy.backoff(attempt))
+
+    def _get(self, url: str, **kw):
+        # a streamed body can only be read once, so it is never shared
+        if self.single_flight is None or kw.get("stream"):
+            return self._send_retrying("get", url, **kw)
 
-    def _get(self, *a, **kw):
-        return self._retry_session().get(*a, **kw)
+        # same URL, params and headers (other than the token) -> same response
+        request = PreparedRequest()
+        request.prepare_url(url, kw.get("params"))
+        headers = tuple(sorted(
+            (name, value) for name, value in (kw.get("headers") or {}).items()
+            if name.lower() != "authorization"
+        ))
+        return self._coalesce(("GET", request.url, headers), lambda: self._send_retrying("get", url, **kw))
 
     def _patch(self, *a, **kw):
-        return self._retry_session().patch(*a, **kw)
+        return self._send("patch", *a, **kw)
 
     def _post(self, *a, **kw):
-        return self._retry_session().post(*a, **kw)
+        return self._send("post", *a, **kw)
 
     def _put(self, *a, **kw):
-        return self._retry_session().put(*a, **kw)
+        return self._send("put", *a, **kw)
 
     def _require_auth(self):
         if not hasattr(self, "auth_handler") or not self.auth_handler:
@@ -0,0 +1,246 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+import httpx
+from .exceptions import ApiRestException, MissingConfigurationException
+from .retry import CircuitBreaker, RetryPolicy
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEveApiRest:
+    """
+    asyncio counterpart of :class:`rest_clients.eve_rest.EveApiRest`.
+    Every request goes through one pooled ``httpx.AsyncClient`` and backoff
+    never blocks the event loop.
+    """
+
+    DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+    DEFAULT_TIMEOUT = 5
+    BASE_HEADERS = {
+        "Cache-Control": "no-cache",
+    }
+
+    def __init__(
+        self,
+        url: str,
+        auth_handler=None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retries: int = 3,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        if not url:
+            raise MissingConfigurationException("Missing required parameter 'url'")
+
+        self.url = url
+        self.auth_handler = auth_handler
+        self.retries = retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                retries=self.retries,
+                limits=self.limits,
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                limits=self.limits,
+                timeout=self.DEFAULT_TIMEOUT,
+            )
+        return self._client
+
+    async def aclose(self):
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _require_auth(self):
+        if not self.auth_handler:
+            raise MissingConfigurationException("Auth property must be set")
+
+    def _auth_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        self._require_auth()
+        extra = extra or {}
+        return {"Authorization": self.auth_handler.get_token(), **extra}
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self.client.request(method, url, **kwargs)
+
+        breaker.before_request()
+        success = None
+        try:
+            resp = await self.client.request(method, url, **kwargs)
+            success = resp.status_code < 500
+        except httpx.HTTPError:
+            success = False
+            raise
+        finally:
+            # a cancelled call (e.g. by asyncio.wait_for) must not keep a half-open trial slot
+            if success is None:
+                breaker.release()
+            else:
+                breaker.record(success)
+        return resp
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an idempotent request, retrying up to ``retries`` times on the
+        statuses ``retry_policy`` allows for the method, within its budget.
+        """
+        policy = self.retry_policy
+
+        for attempt in range(1, self.retries + 2):
+            resp = await self._request(method, url, **kwargs)
+            policy.record_request()
+            if attempt > self.retries or not policy.is_retryable(method, resp.status_code) or not policy.can_retry():
+                return resp
+
+            logger.warning("Request failed: %s %s (attempt %d)", resp, resp.reason_phrase, attempt)
+            await asyncio.sleep(policy.backoff(attempt))
+
+        raise ApiRestException("Unexpected retry logic failure")
+
+    async def _retry_operation(self, tries: int, method: str, url: str, **kwargs) -> httpx.Response:
+        policy = self.retry_policy
+
+        for attempt in range(1, tries + 1):
+            resp = await self._request(method, url, **kwargs)
+            policy.record_request()
+
+            if resp.is_success:
+                return resp
+
+            if resp.status_code == 403:
+                logger.debug("403 received, refreshing token...")
+                self.auth_handler.update_token()
+                kwargs["headers"] = {**kwargs.get("headers", {}), **self._auth_headers()}
+                continue
+
+            logger.warning(
+                "Request failed: %s %s (attempt %d)",
+                resp,
+                resp.reason_phrase,
+                attempt,
+            )
+
+            if attempt == tries or not policy.is_retryable(method, resp.status_code) or not policy.can_retry():
+                resp.raise_for_status()
+
+            await asyncio.sleep(policy.backoff(attempt))
+
+        raise ApiRestException("Unexpected retry logic failure")
+
+    @property
+    def status_url(self) -> str:
+        return f"{self.url}/status"
+
+    async def status(self) -> Dict[str, Any]:
+        resp = await self._request("GET", self.status_url)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def get(self, resource_id: str) -> Dict[str, Any]:
+        resp = await self._send("GET", f"{self.url}/{resource_id}", headers=self.BASE_HEADERS)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def get_items_by_id(self, ids: List[str], ordered: bool = False) -> Dict[str, Any]:
+        where = json.dumps({"_id": {"$in": ids}})
+        resp = await self._send("GET", self.url, params={"where": where})
+        resp.raise_for_status()
+
+        result = resp.json()
+        if ordered:
+            position = {_id: index for index, _id in enumerate(ids)}
+            result["_items"] = sorted(result["_items"], key=lambda x: position[x["_id"]])
+
+        return result
+
+    async def post(
+        self,
+        payload: Dict[str, Any],
+        return_resource: bool = False,
+        exception=ApiRestException,
+    ):
+        self._require_auth()
+
+        try:
+            resp = await self._retry_operation(
+                2,
+                "POST",
+                self.url,
+                json=payload,
+                headers=self._auth_headers(),
+            )
+        except Exception as e:
+            raise exception(f"Failed to POST to {self.url}: {e}") from e
+
+        if return_resource:
+            resource_id = resp.json().get("_id")
+            return await self.get(resource_id)
+
+        return resp
+
+    async def patch(
+        self,
+        resource_id: str,
+        payload: Dict[str, Any],
+        exception=ApiRestException,
+    ):
+        self._require_auth()
+        url = f"{self.url}/{resource_id}"
+
+        try:
+            data = await self.get(resource_id)
+            resp = await self._retry_operation(
+                3,
+                "PATCH",
+                url,
+                json=payload,
+                headers=self._auth_headers({"If-match": data["_etag"]}),
+            )
+        except Exception as e:
+            raise exception(f"Failed to PATCH {url}: {e}") from e
+
+        logger.info("Patched successfully: %s", url)
+        return resp
+
+    async def delete(self, resource_id: str, exception=ApiRestException):
+        self._require_auth()
+        url = f"{self.url}/{resource_id}"
+
+        try:
+            data = await self.get(resource_id)
+            resp = await self._retry_operation(
+                3,
+                "DELETE",
+                url,
+                headers=self._auth_headers({"If-match": data["_etag"]}),
+            )
+        except Exception as e:
+            raise exception(f"Failed to DELETE {url}: {e}") from e
+
+        logger.info("Deleted successfully: %s", url)
+        return resp
@@ -0,0 +1,177 @@
+import asyncio
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Union
+from redis.asyncio import ConnectionPool, StrictRedis
+from redis.asyncio.sentinel import Sentinel
+from redis.sentinel import MasterNotFoundError
+from .metrics import NULL_METRICS
+from .redis_client import RedisClient, RedisPipeline, _chunks, _RedisCommands
+
+
+class AsyncRedisPipeline(RedisPipeline):
+    """
+    asyncio flavour of :class:`rest_clients.redis_client.RedisPipeline`.
+    Commands are queued synchronously; use ``async with`` or ``await execute()``.
+    """
+
+    def __init__(self, owner: "AsyncRedisClient", transaction: bool = False):
+        super().__init__(owner.redis_client, transaction=transaction, metrics=owner.metrics)
+        self._owner = owner
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                await self.execute()
+        finally:
+            await self.redis_client.reset()
+
+    async def execute(self) -> List[Any]:
+        await self._owner.connect()
+        if self.metrics.enabled:
+            started = perf_counter()
+            replies = await self.redis_client.execute()
+            self._observe(started)
+        else:
+            replies = await self.redis_client.execute()
+        transforms, self._transforms = self._transforms, []
+        self.results = [
+            transform(reply) if transform else reply
+            for transform, reply in zip(transforms, replies)
+        ]
+        return self.results
+
+
+class AsyncRedisClient(_RedisCommands):
+    """
+    asyncio counterpart of :class:`rest_clients.redis_client.RedisClient`,
+    with the same configuration format. Every key/hash method returns an
+    awaitable. The master check runs on the first command (or an explicit
+    ``await connect()``) and all coroutines share one connection pool.
+    """
+
+    BATCH_SIZE = RedisClient.BATCH_SIZE
+    DEFAULT_MAX_CONNECTIONS = 50
+
+    def __init__(self, config: Dict[str, Any]):
+        if not isinstance(config, dict):
+            raise ValueError(f"Invalid connection parameters: {config}")
+
+        self.redis_properties = config
+        self.connection_params = RedisClient._build_connection_params(config)
+        self.max_connections = config.get("max_connections", self.DEFAULT_MAX_CONNECTIONS)
+        self.metrics = config.get("metrics") or NULL_METRICS
+        self.redis_client = self._connect()
+        self._verified = False
+        self._verify_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _connect(self):
+        """
+        Build the client for Redis or Sentinel; no I/O happens until the first command.
+        """
+        if "cluster" in self.connection_params:
+            sentinel = Sentinel(
+                self.connection_params["cluster"],
+                socket_timeout=self.connection_params["socket_timeout"]
+            )
+            return sentinel.master_for(
+                self.connection_params["service_name"],
+                max_connections=self.max_connections,
+            )
+
+        pool = ConnectionPool(
+            host=self.connection_params["host"],
+            port=self.connection_params["port"],
+            password=self.connection_params.get("password"),
+            socket_timeout=self.connection_params["socket_timeout"],
+            max_connections=self.max_connections,
+        )
+        return StrictRedis(connection_pool=pool)
+
+    async def connect(self):
+        """
+        Ensure the node is a master, once.
+        """
+        if self._verified:
+            return
+
+        # created lazily so it binds to the running loop
+        if self._verify_lock is None:
+            self._verify_lock = asyncio.Lock()
+
+        async with self._verify_lock:
+            if self._verified:
+                return
+
+            info = await self.redis_client.info()
+            if info.get("role") != "master":
+                raise MasterNotFoundError(f"Expected master but connected to: {info.get('role')}")
+            self._verified = True
+
+    async def close(self):
+        await self.redis_client.aclose()
+
+    async def _run(self, command: str, *args, transform: Optional[Callable[[Any], Any]] = None, **kwargs) -> Any:
+        await self.connect()
+        if not self.metrics.enabled:
+            reply = await getattr(self.redis_client, command)(*args, **kwargs)
+            return transform(reply) if transform else reply
+
+        started = perf_counter()
+        try:
+            reply = await getattr(self.redis_client, command)(*args, **kwargs)
+        except Exception as e:
+            self.metrics.increment("redis_command_errors_total", command=command, error=type(e).__name__)
+            raise
+        finally:
+            self.metrics.observe("redis_command_duration_seconds", perf_counter() - started, command=command)
+        return transform(reply) if transform else reply
+
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        # MGET and DEL need at least one key
+        if not keys:
+            return []
+        return await super().get_many(keys)
+
+    async def delete_many(self, keys: List[str]) -> int:
+        if not keys:
+            return 0
+        return await super().delete_many(keys)
+
+    def pipeline(self, transaction: bool = False) -> AsyncRedisPipeline:
+        """Pipelined (and with ``transaction`` MULTI/EXEC) view of this client."""
+        return AsyncRedisPipeline(self, transaction=transaction)
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ex: Optional[Union[int, Dict[str, int]]] = None,
+        batch_size: int = BATCH_SIZE,
+    ):
+        """
+        Set several keys, ``batch_size`` commands per round trip. ``ex`` is
+        either one expiration for every key or a per-key mapping.
+        """
+        for chunk in _chunks(list(mapping.items()), batch_size):
+            async with self.pipeline() as pipe:
+                for key, value in chunk:
+                    pipe.set_value(key, value, ex=ex.get(key) if isinstance(ex, dict) else ex)
+
+    async def hash_get_many(self, hash_keys: List[str], batch_size: int = BATCH_SIZE) -> Dict[str, Dict[bytes, bytes]]:
+        """HGETALL several hashes, ``batch_size`` commands per round trip."""
+        result: Dict[str, Dict[bytes, bytes]] = {}
+        for chunk in _chunks(hash_keys, batch_size):
+            async with self.pipeline() as pipe:
+                for hash_key in chunk:
+                    pipe.hash_get_all(hash_key)
+            result.update(zip(chunk, pipe.results))
+        return result
@@ -0,0 +1,94 @@
+import logging
+import threading
+from time import monotonic
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenManager:
+    """
+    Thread-safe wrapper around an ``auth_handler`` (anything exposing
+    ``get_token()`` and ``update_token()``) that can be used in its place.
+
+    The token is cached instead of asked for on every request. With ``ttl``
+    (the token lifetime in seconds) it is refreshed in the background once
+    ``refresh_ratio`` of the lifetime has passed, so requests never wait for
+    a rotation. Concurrent ``update_token()`` calls caused by 403s on the
+    same token result in a single refresh.
+    """
+
+    BACKGROUND_RETRY_INTERVAL = 5.0
+
+    def __init__(self, auth_handler, ttl: Optional[float] = None, refresh_ratio: float = 0.8):
+        if not 0 < refresh_ratio <= 1:
+            raise ValueError(f"Invalid refresh ratio: {refresh_ratio}")
+
+        self.auth_handler = auth_handler
+        self.ttl = ttl
+        self.refresh_ratio = refresh_ratio
+        self.refreshes = 0
+        self._token: Optional[str] = None
+        self._issued_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._retry_after = 0.0
+        # token each thread last used, to tell stale 403s from fresh ones
+        self._local = threading.local()
+
+    def _age(self) -> float:
+        return monotonic() - self._issued_at
+
+    def _expired(self) -> bool:
+        return self._token is None or (self.ttl is not None and self._age() >= self.ttl)
+
+    def get_token(self) -> str:
+        if self._expired():
+            with self._lock:
+                if self._expired():
+                    self._refresh(initial=self._token is None)
+        elif self.ttl is not None and self._age() >= self.ttl * self.refresh_ratio:
+            self._refresh_in_background()
+
+        token = self._token
+        self._local.token = token
+        return token
+
+    def update_token(self):
+        """
+        Refresh after a 403. If another thread already replaced the token this
+        thread was using, the new one is kept and no refresh happens.
+        """
+        seen = getattr(self._local, "token", None)
+        with self._lock:
+            if seen is not None and seen != self._token:
+                return
+            self._refresh()
+
+    def _refresh(self, initial: bool = False):
+        if not initial:
+            self.auth_handler.update_token()
+            self.refreshes += 1
+        self._token = self.auth_handler.get_token()
+        self._issued_at = monotonic()
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing or monotonic() < self._retry_after:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                with self._lock:
+                    if self.ttl is None or self._age() >= self.ttl * self.refresh_ratio:
+                        self._refresh()
+            except Exception as e:
+                # the current token is still valid; try again a bit later
+                self._retry_after = monotonic() + self.BACKGROUND_RETRY_INTERVAL
+                logger.warning("Background token refresh failed: %s", e)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=refresh, name="token-refresh", daemon=True).start()
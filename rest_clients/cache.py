@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with optional per-entry time to live.
+
+    ``maxsize`` bounds the total weight of the entries; by default every entry
+    weighs 1, so it is an entry count. Pass ``weigher`` to bound by something
+    else (e.g. payload bytes).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        weigher: Optional[Callable[[Any], int]] = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError(f"Invalid cache size: {maxsize}")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weigher = weigher
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.weight = 0
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = monotonic() + ttl if ttl is not None else None
+        weight = self.weigher(value) if self.weigher else 1
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if weight > self.maxsize:
+                return
+
+            self._data[key] = (value, expires, weight)
+            self.weight += weight
+            while self.weight > self.maxsize:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            return self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.weight = 0
+
+    def _remove(self, key: Hashable) -> Any:
+        value, _, weight = self._data.pop(key)
+        self.weight -= weight
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "weight": self.weight,
+            "maxsize": self.maxsize,
+        }
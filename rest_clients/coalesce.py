@@ -0,0 +1,111 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls: while a call for ``key`` is running, other
+    callers asking for the same key wait for it and get the same result (or
+    exception) instead of running their own.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+class _Batch:
+    def __init__(self):
+        self.futures: Dict[Hashable, Future] = {}
+        self.full = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Groups keys submitted from different threads within ``window`` seconds
+    (or until ``max_batch`` distinct keys) into one ``loader(keys)`` call,
+    which returns ``{key: value}``. Keys missing from the result resolve to
+    ``default``. The first caller of a batch waits for the window and runs
+    the loader; the others block until it is done.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        window: float = 0.005,
+        max_batch: int = 100,
+        default: Any = None,
+    ):
+        self.loader = loader
+        self.window = window
+        self.max_batch = max_batch
+        self.default = default
+        self.batches = 0
+        self.keys = 0
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+
+    def submit(self, key: Hashable) -> Any:
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = Future()
+            if len(batch.futures) >= self.max_batch:
+                # close the batch so later keys start a new one
+                self._batch = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._load(batch)
+
+        return future.result()
+
+    def _load(self, batch: _Batch):
+        keys = list(batch.futures)
+        self.batches += 1
+        self.keys += len(keys)
+        try:
+            results = self.loader(keys)
+        except BaseException as e:
+            for future in batch.futures.values():
+                future.set_exception(e)
+            return
+
+        for key, future in batch.futures.items():
+            future.set_result(results.get(key, self.default))
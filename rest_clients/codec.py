@@ -0,0 +1,211 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+class JsonCodec:
+    """Standard library JSON; the other codecs expose the same interface."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode()
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> str:
+        return self._ujson.dumps(obj, ensure_ascii=False)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode()
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return self._ujson.loads(bytes(data) if isinstance(data, bytearray) else data)
+
+
+CODECS = {"json": JsonCodec, "orjson": OrjsonCodec, "ujson": UjsonCodec}
+# fastest first
+AUTO_ORDER = ("orjson", "ujson", "json")
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    Resolve a codec: an instance is returned as is, a name ("json",
+    "orjson", "ujson") is instantiated, and "auto" picks the fastest one
+    installed. ``None`` means the standard library.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        return JsonCodec()
+    if codec == "auto":
+        for name in AUTO_ORDER:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {codec}")
+    return CODECS[codec]()
+
+
+# a complete string, an unterminated one (lone quote) or a bracket
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{}]')
+_SEPARATORS = re.compile(r"[\s,]*")
+_WHITESPACE = re.compile(r"\s*")
+_OPEN = frozenset(b"[{")
+_QUOTE = 0x22
+
+
+class ItemStream:
+    """
+    Incrementally parse the ``key`` array of a JSON object read as byte
+    chunks (e.g. ``resp.iter_content()``), yielding its elements one at a
+    time so only the element being read is buffered. The rest of the object
+    (``_links``, ``_meta``...) is available in ``envelope`` once the stream
+    has been consumed, with ``key`` mapped to an empty list.
+
+    Elements are decoded by the standard library's C scanner
+    (``JSONDecoder.raw_decode``), which finds where each one ends without a
+    separate tokenizing pass; ``codec`` decodes the envelope.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], codec: Optional[JsonCodec] = None, key: str = "_items"):
+        self.chunks = chunks
+        self.codec = codec or JsonCodec()
+        self.key = json.dumps(key).encode()
+        self.envelope: Optional[Dict[str, Any]] = None
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        chunks = iter(self.chunks)
+        envelope: List[bytes] = []
+        rest = self._find_array(chunks, envelope)
+        if rest is not None:
+            tail = yield from self._parse_array(chunks, rest)
+            envelope.append(tail)
+        envelope.extend(chunks)
+        self.envelope = self.codec.loads(b"".join(envelope))
+
+    def _find_array(self, chunks: Iterator[bytes], envelope: List[bytes]) -> Optional[bytes]:
+        """
+        Copy bytes to ``envelope`` up to and including the ``[`` opening the
+        key's array and return what follows it, or None if there is no such array.
+        """
+        buf = bytearray()
+        pos = 0
+        depth = 0
+        last_string = None
+
+        for chunk in chunks:
+            buf += chunk
+            while True:
+                match = _TOKEN.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                token = match.group()
+                if token == b'"':
+                    # string continues in the next chunk
+                    pos = match.start()
+                    break
+                pos = match.end()
+
+                if token[0] == _QUOTE:
+                    if depth == 1:
+                        last_string = token
+                elif token[0] in _OPEN:
+                    depth += 1
+                    if depth == 2 and token == b"[" and last_string == self.key:
+                        envelope.append(bytes(buf[:pos]))
+                        return bytes(buf[pos:])
+                else:
+                    depth -= 1
+
+            envelope.append(bytes(buf[:pos]))
+            del buf[:pos]
+            pos = 0
+
+        envelope.append(bytes(buf))
+        return None
+
+    def _parse_array(self, chunks: Iterator[bytes], rest: bytes):
+        """Yield the array elements; return the bytes after them, starting at ``]``."""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        raw_decode = json.JSONDecoder().raw_decode
+        pending = [decoder.decode(rest)]
+        size = len(pending[0])
+        # after an incomplete parse wait for the buffer to double, so a huge
+        # element is not re-parsed on every chunk
+        retry_at = 0
+        exhausted = False
+
+        while True:
+            if exhausted or size >= retry_at:
+                text = "".join(pending)
+                index = 0
+                retry_at = 0
+                while True:
+                    index = _SEPARATORS.match(text, index).end()
+                    if index == len(text):
+                        break
+                    if text[index] == "]":
+                        # plus the bytes of a character split across chunks
+                        return text[index:].encode() + decoder.getstate()[0]
+                    try:
+                        item, end = raw_decode(text, index)
+                    except json.JSONDecodeError:
+                        retry_at = 2 * (len(text) - index)
+                        break
+                    follow = _WHITESPACE.match(text, end).end()
+                    if not exhausted and (follow == len(text) or text[follow] not in ",]"):
+                        # a number ("12", "1.", "-") may continue in the next chunk
+                        break
+                    index = end
+                    self.count += 1
+                    yield item
+
+                if exhausted:
+                    raise json.JSONDecodeError("Unterminated array", text, index)
+                pending = [text[index:]]
+                size = len(pending[0])
+
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+            else:
+                piece = decoder.decode(chunk)
+                pending.append(piece)
+                size += len(piece)
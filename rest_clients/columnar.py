@@ -0,0 +1,148 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# typecodes whose missing values become NaN instead of 0
+_FLOAT_TYPECODES = frozenset("fd")
+
+_record_types: Dict[Tuple[str, ...], type] = {}
+
+
+def _slot_name(field: str) -> str:
+    name = field.replace(".", "_")
+    if not name.isidentifier():
+        raise ValueError(f"Invalid record field: {field}")
+    return name
+
+
+def _record_init(self, *values):
+    for slot, value in zip(self.__slots__, values):
+        setattr(self, slot, value)
+
+
+def _record_repr(self) -> str:
+    values = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+    return f"{type(self).__name__}({values})"
+
+
+def _record_eq(self, other: Any) -> bool:
+    if type(other) is not type(self):
+        return NotImplemented
+    return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+
+def _record_asdict(self) -> Dict[str, Any]:
+    return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+def record_type(fields: Sequence[str]) -> type:
+    """
+    A class with ``__slots__`` for ``fields`` (dots in nested fields become
+    underscores), so each record costs a fixed few bytes per field instead
+    of a dict. Classes are cached per field list.
+    """
+    key = tuple(fields)
+    cls = _record_types.get(key)
+    if cls is None:
+        cls = _record_types[key] = type("Record", (), {
+            "__slots__": tuple(_slot_name(field) for field in key),
+            "__init__": _record_init,
+            "__repr__": _record_repr,
+            "__eq__": _record_eq,
+            "__hash__": None,
+            "_asdict": _record_asdict,
+        })
+    return cls
+
+
+class Columns:
+    """
+    Selected ``fields`` of many documents, stored column by column: fields
+    listed in ``types`` go to an ``array.array`` of that typecode (``"q"``,
+    ``"d"``, ``"b"``...), 8 bytes or less per value, the others to a plain
+    list. Nested fields use dots (``"owner.name"``). A missing value is
+    ``None`` in a list, NaN in a float array and 0 in an integer array.
+
+    Documents are added with :meth:`append`/:meth:`extend`, e.g. straight
+    from ``EveApiRest.iter_items(stream=True)``, and can be read back as
+    columns (``columns["price"]``), ``__slots__`` records or NumPy arrays.
+    """
+
+    def __init__(self, fields: Sequence[str], types: Optional[Dict[str, str]] = None):
+        self.fields = tuple(fields)
+        self.types = dict(types or {})
+        unknown = set(self.types) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Types given for unknown fields: {sorted(unknown)}")
+
+        self.columns: Dict[str, Union[array, List[Any]]] = {
+            field: array(self.types[field]) if field in self.types else [] for field in self.fields
+        }
+        self._length = 0
+        # (append, top-level key, nested path or None, missing value) per field
+        self._appenders = []
+        for field in self.fields:
+            path = field.split(".")
+            typecode = self.types.get(field)
+            missing = None if typecode is None else float("nan") if typecode in _FLOAT_TYPECODES else 0
+            self._appenders.append((self.columns[field].append, path[0], path[1:] or None, missing))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, field: str) -> Union[array, List[Any]]:
+        return self.columns[field]
+
+    def __repr__(self) -> str:
+        return f"Columns(fields={list(self.fields)}, length={self._length})"
+
+    def append(self, document: Dict[str, Any]):
+        done = 0
+        try:
+            for append, key, path, missing in self._appenders:
+                value = document.get(key)
+                if path is not None:
+                    for part in path:
+                        value = value.get(part) if isinstance(value, dict) else None
+                append(missing if value is None else value)
+                done += 1
+        except (TypeError, OverflowError):
+            # e.g. a string in a numeric column: drop the partial row
+            for field in self.fields[:done]:
+                self.columns[field].pop()
+            raise
+        self._length += 1
+
+    def extend(self, documents: Iterable[Dict[str, Any]]) -> "Columns":
+        for document in documents:
+            self.append(document)
+        return self
+
+    def merge(self, other: "Columns") -> "Columns":
+        """Append the rows of ``other``, which must have the same fields and types."""
+        if other.fields != self.fields or other.types != self.types:
+            raise ValueError("Cannot merge columns with different fields or types")
+        for field in self.fields:
+            self.columns[field].extend(other.columns[field])
+        self._length += other._length
+        return self
+
+    def records(self) -> Iterator[Any]:
+        """Yield the rows as ``__slots__`` records (see :func:`record_type`), built on demand."""
+        cls = record_type(self.fields)
+        for values in zip(*self.columns.values()):
+            yield cls(*values)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        The columns as NumPy arrays (requires ``numpy``). Typed columns are
+        shared with the underlying ``array`` rather than copied, so no rows
+        can be appended while they are in use; the others become object arrays.
+        """
+        import numpy
+
+        return {
+            field: numpy.frombuffer(column, dtype=column.typecode)
+            if isinstance(column, array) else numpy.fromiter(column, dtype=object, count=len(column))
+            for field, column in self.columns.items()
+        }
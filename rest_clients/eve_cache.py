@@ -0,0 +1,126 @@
+import logging
+import uuid
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, List, Optional, Union
+from redis.exceptions import RedisError
+from .codec import JsonCodec, get_codec
+from .redis_client import RedisClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisDocumentCache:
+    """
+    Read-through cache of Eve documents shared by every process pointing at
+    the same Redis. Documents are stored as JSON under
+    ``<prefix>:<namespace>:<_id>`` with a TTL.
+
+    Misses on a single document are recomputed by one process only: the
+    first one takes a short lock and the others wait for its result instead
+    of all hitting Eve at once. Redis failures never break reads, the
+    document is simply loaded from Eve.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        namespace: str,
+        ttl: int = 300,
+        prefix: str = "eve",
+        lock_timeout: float = 5.0,
+        poll_interval: float = 0.05,
+        codec: Union[str, JsonCodec, None] = None,
+    ):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.ttl = ttl
+        self.prefix = prefix
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.codec = get_codec(codec)
+
+    def _key(self, resource_id: str) -> str:
+        return f"{self.prefix}:{self.namespace}:{resource_id}"
+
+    def _lock_key(self, resource_id: str) -> str:
+        return f"{self._key(resource_id)}:lock"
+
+    def get(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = self.redis.get_value(self._key(resource_id))
+        except RedisError as e:
+            logger.warning("Shared cache read failed for %s: %s", resource_id, e)
+            return None
+        return self.codec.loads(raw) if raw is not None else None
+
+    def get_many(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not ids:
+            return {}
+        try:
+            values = self.redis.get_many([self._key(_id) for _id in ids])
+        except RedisError as e:
+            logger.warning("Shared cache read failed for %d ids: %s", len(ids), e)
+            return {}
+        return {_id: self.codec.loads(raw) for _id, raw in zip(ids, values) if raw is not None}
+
+    def set(self, resource_id: str, document: Dict[str, Any]):
+        self.set_many({resource_id: document})
+
+    def set_many(self, documents: Dict[str, Dict[str, Any]]):
+        if not documents:
+            return
+        try:
+            self.redis.set_many(
+                {self._key(resource_id): self.codec.dumps(document) for resource_id, document in documents.items()},
+                ex=self.ttl,
+            )
+        except RedisError as e:
+            logger.warning("Shared cache write failed: %s", e)
+
+    def invalidate(self, *ids: str):
+        if not ids:
+            return
+        try:
+            self.redis.delete_many([self._key(_id) for _id in ids])
+        except RedisError as e:
+            logger.warning("Shared cache invalidation failed for %s: %s", ids, e)
+
+    def fetch(self, resource_id: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached document, or load it under a stampede lock."""
+        document = self.get(resource_id)
+        if document is not None:
+            return document
+
+        token = uuid.uuid4().hex
+        try:
+            locked = self.redis.set_if_absent(
+                self._lock_key(resource_id), token, px=int(self.lock_timeout * 1000)
+            )
+        except RedisError:
+            locked = True
+
+        if not locked:
+            deadline = monotonic() + self.lock_timeout
+            while monotonic() < deadline:
+                sleep(self.poll_interval)
+                document = self.get(resource_id)
+                if document is not None:
+                    return document
+            logger.debug("Timed out waiting for %s to be cached, loading it", resource_id)
+
+        try:
+            document = loader()
+            self.set(resource_id, document)
+            return document
+        finally:
+            if locked:
+                self._release(resource_id, token)
+
+    def _release(self, resource_id: str, token: str):
+        # only drop the lock if it is still ours (it may have expired meanwhile)
+        try:
+            if self.redis.get_value(self._lock_key(resource_id)) in (token, token.encode()):
+                self.redis.delete_key(self._lock_key(resource_id))
+        except RedisError:
+            pass
@@ -1,14 +1,18 @@
+from .auth import TokenManager
 from .eve_rest import EveApiRest
 from .exceptions import MissingConfigurationException
 
 
 class EveClient(EveApiRest):
 
-    def __init__(self, url, auth_handler = None):
+    def __init__(self, url, auth_handler = None, token_ttl = None, **kwargs):
         if not url:
             raise MissingConfigurationException(
                 f'Missing required parameter url: {url}, auth_handler: {auth_handler}'
             )
 
+        super().__init__(url, **kwargs)
+        # concurrent 403s refresh the token once, with or without a known lifetime
+        if auth_handler is not None and not isinstance(auth_handler, TokenManager):
+            auth_handler = TokenManager(auth_handler, ttl=token_ttl)
         self.auth_handler = auth_handler
-        self.url = url
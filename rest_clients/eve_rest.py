@@ -1,32 +1,153 @@
 import json
 import logging
-from time import sleep
-from typing import Any, Dict, List, Optional
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from time import monotonic, sleep
+from urllib.parse import urlencode
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from requests import HTTPError
+from .cache import LRUCache
+from .codec import ItemStream, JsonCodec, get_codec
+from .columnar import Columns
+from .coalesce import MicroBatcher
 from .exceptions import ApiRestException
+from .rate_limit import RateLimiter
 from rest_clients._generic_rest import RestClient
 
+if TYPE_CHECKING:
+    from .eve_cache import RedisDocumentCache
+
 
 logger = logging.getLogger(__name__)
 
+_END_OF_PAGES = object()
+_NOT_BATCHED = object()
+
+# {"field": 1, "other": 0} or just the fields to include
+Projection = Union[Dict[str, int], Sequence[str]]
+
 
 class EveApiRest(RestClient):
     DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+    # Eve's default PAGINATION_LIMIT: a larger $in chunk needs a second page
+    DEFAULT_ID_CHUNK_SIZE = 50
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_ETAG_CACHE_SIZE = 1024
+    DEFAULT_ETAG_CACHE_TTL = 300
+    DEFAULT_GET_BATCH_SIZE = 100
+    DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+    DEFAULT_CHANGES_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        url: str,
+        etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE,
+        etag_cache_ttl: Optional[float] = DEFAULT_ETAG_CACHE_TTL,
+        response_cache_bytes: int = 0,
+        response_cache_ttl: Optional[float] = None,
+        shared_cache: Optional["RedisDocumentCache"] = None,
+        get_batch_window: Optional[float] = None,
+        get_batch_size: int = DEFAULT_GET_BATCH_SIZE,
+        codec: Union[str, JsonCodec, None] = None,
+        projection: Optional[Projection] = None,
+        embedded: Optional[Projection] = None,
+        **kwargs,
+    ):
+        super().__init__(url, **kwargs)
+        # default shape of every document read by this client
+        self.projection = projection
+        self.embedded = embedded
+        # None keeps requests' own (stdlib) JSON handling
+        self.codec = get_codec(codec) if codec is not None else None
+        self.etag_cache = LRUCache(etag_cache_size, ttl=etag_cache_ttl) if etag_cache_size else None
+        # item url -> {query: (etag, document, payload size)}, bounded by total
+        # payload bytes; every shape of a document goes when it is written
+        self.response_cache = LRUCache(
+            response_cache_bytes,
+            ttl=response_cache_ttl,
+            weigher=lambda variants: sum(entry[2] for entry in variants.values()),
+        ) if response_cache_bytes else None
+        self.shared_cache = shared_cache
+        # concurrent single-id gets within the window become one $in query
+        self.get_batcher = MicroBatcher(
+            self._load_batch,
+            window=get_batch_window,
+            max_batch=get_batch_size,
+            default=_NOT_BATCHED,
+        ) if get_batch_window else None
+
+    def _remember_etag(self, document: Any):
+        if self.etag_cache is None or not isinstance(document, dict):
+            return
+        if document.get("_id") and document.get("_etag"):
+            self.etag_cache.set(document["_id"], document["_etag"])
 
     def _auth_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         self._require_auth()
         extra = extra or {}
+        if self.codec is not None:
+            # bodies are sent pre-encoded as data=, so requests does not set it
+            extra = {"Content-Type": "application/json", **extra}
         return {"Authorization": self.auth_handler.get_token(), **extra}
 
+    def _dumps(self, obj: Any) -> str:
+        return json.dumps(obj) if self.codec is None else self.codec.dumps(obj)
+
+    def _decode(self, resp) -> Any:
+        return resp.json() if self.codec is None else self.codec.loads(resp.content)
+
+    def _written_document(self, resp) -> Optional[Dict[str, Any]]:
+        """The document a write answered with, or None when the body is not JSON."""
+        try:
+            document = self._decode(resp)
+        except ValueError:
+            return None
+        return document if isinstance(document, dict) else None
+
+    def _read_params(
+        self,
+        projection: Optional[Projection] = None,
+        embedded: Optional[Projection] = None,
+    ) -> Dict[str, str]:
+        """``projection``/``embedded`` query parameters; None falls back to the client defaults."""
+        params = {}
+        for name, value, default in (
+            ("projection", projection, self.projection),
+            ("embedded", embedded, self.embedded),
+        ):
+            value = default if value is None else value
+            if value:
+                params[name] = self._dumps(value if isinstance(value, dict) else {field: 1 for field in value})
+        return params
+
+    def _json_body(self, payload: Any) -> Dict[str, Any]:
+        """``requests`` keyword arguments sending ``payload`` as JSON."""
+        if self.codec is None:
+            return {"json": payload}
+        return {"data": self.codec.dumps_bytes(payload)}
+
     def _retry_operation(self, tries: int, func, *args, **kwargs):
+        # _post -> POST, to look up the retryable statuses of the method
+        method = getattr(func, "__name__", "").lstrip("_").upper()
+        policy = self.retry_policy
+
         for attempt in range(1, tries + 1):
             resp = func(*args, **kwargs)
+            policy.record_request()
 
             if resp.ok:
                 return resp
 
             if resp.status_code == 403:
                 logger.debug("403 received, refreshing token...")
+                if self.metrics.enabled:
+                    self.metrics.increment("http_token_refreshes_total", resource=self.resource)
                 self.auth_handler.update_token()
+                if "Authorization" in kwargs.get("headers", {}):
+                    kwargs["headers"] = {**kwargs["headers"], "Authorization": self.auth_handler.get_token()}
                 continue
 
             logger.warning(
@@ -36,10 +157,17 @@ class EveApiRest(RestClient):
                 attempt,
             )
 
-            if attempt == tries:
+            if attempt == tries or not policy.is_retryable(method, resp.status_code) or not policy.can_retry():
                 resp.raise_for_status()
 
-            sleep(attempt)
+            if self.metrics.enabled:
+                self.metrics.increment(
+                    "http_retries_total",
+                    method=method,
+                    resource=self.resource,
+                    status=resp.status_code,
+                )
+            sleep(policy.backoff(attempt))
 
         raise ApiRestException("Unexpected retry logic failure")
 
@@ -48,26 +176,375 @@ class EveApiRest(RestClient):
         return f"{self.url}/status"
 
     def status(self) -> Dict[str, Any]:
-        resp = self._retry_session(retries=1).get(self.status_url)
+        session = self._pooled_session(retries=1)
+        resp = self._coalesce(("status", self.status_url), lambda: self._send("get", self.status_url, session=session))
         resp.raise_for_status()
-        return resp.json()
+        return self._decode(resp)
 
-    def get(self, resource_id: str) -> Dict[str, Any]:
-        resp = self._get(f"{self.url}/{resource_id}", headers=self.BASE_HEADERS)
-        resp.raise_for_status()
-        return resp.json()
+    def get(
+        self,
+        resource_id: str,
+        projection: Optional[Projection] = None,
+        embedded: Optional[Projection] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch one document. With the response cache enabled the request is
+        revalidated with ``If-None-Match`` and a 304 returns the cached
+        document itself, so callers must not mutate it. With a shared cache
+        the document is read through Redis first. With ``get_batch_window``
+        concurrent calls are fetched together by one ``$in`` query.
+        ``projection``/``embedded`` override the client defaults; such reads
+        skip the shared cache and the batching, which hold default-shaped
+        documents.
+        """
+        if projection is not None or embedded is not None:
+            return self._get_document(resource_id, self._read_params(projection, embedded))
+        if self.shared_cache is not None:
+            return self.shared_cache.fetch(resource_id, lambda: self._load_document(resource_id))
+        return self._load_document(resource_id)
+
+    def _load_document(self, resource_id: str) -> Dict[str, Any]:
+        if self.get_batcher is not None:
+            document = self.get_batcher.submit(resource_id)
+            if document is not _NOT_BATCHED:
+                return document
+            # not found by the batch: a plain GET reports the error
+        return self._get_document(resource_id, self._read_params())
+
+    def _load_batch(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        pages = self._fetch_ids(ids, self._read_params())
+        documents = {item["_id"]: item for page in pages for item in page.get("_items", [])}
+        for document in documents.values():
+            self._remember_etag(document)
+        return documents
+
+    def _get_document(self, resource_id: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        url = f"{self.url}/{resource_id}"
+        kwargs: Dict[str, Any] = {"params": params} if params else {}
+        # documents of different shapes are cached apart, under the same item
+        query = urlencode(sorted(params.items())) if params else ""
+        headers = self.BASE_HEADERS
+        variants = self.response_cache.get(url, {}) if self.response_cache is not None else {}
+        cached = variants.get(query)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        resp = self._get(url, headers=headers, **kwargs)
+        if cached is not None and resp.status_code == 304:
+            return cached[1]
 
-    def get_items_by_id(self, ids: List[str], ordered: bool = False) -> Dict[str, Any]:
-        where = json.dumps({"_id": {"$in": ids}})
-        resp = self._get(self.url, params={"where": where})
         resp.raise_for_status()
+        document = self._decode(resp)
+        self._remember_etag(document)
+
+        if self.response_cache is not None:
+            etag = resp.headers.get("ETag") or document.get("_etag")
+            if etag:
+                self.response_cache.set(url, {**variants, query: (etag, document, len(resp.content))})
+
+        return document
+
+    def _fetch_ids(
+        self,
+        ids: List[str],
+        params: Optional[Dict[str, str]] = None,
+        max_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        return list(self._walk_pages(self._ids_params(ids, params, max_results)))
+
+    def _ids_params(
+        self,
+        ids: List[str],
+        params: Optional[Dict[str, str]] = None,
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        page_size = min(len(ids), max_results) if max_results else len(ids)
+        return {"where": self._dumps({"_id": {"$in": ids}}), "max_results": page_size, **(params or {})}
+
+    def get_items_by_id(
+        self,
+        ids: List[str],
+        ordered: bool = False,
+        chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        return_missing: bool = False,
+        projection: Optional[Projection] = None,
+        embedded: Optional[Projection] = None,
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch documents by ``_id``. Large id lists are split into chunks of
+        ``chunk_size`` fetched concurrently (each chunk following pagination)
+        and merged; keep it at most the server's ``PAGINATION_LIMIT`` so every
+        chunk is a single request. ``return_missing`` adds the ids that were not found under
+        ``_missing``. ``max_results`` caps the page size of each request;
+        ``projection``/``embedded`` work as in :meth:`get`.
+        """
+        params = self._read_params(projection, embedded)
+        shared_cache = self.shared_cache if projection is None and embedded is None else None
+
+        unique_ids = list(dict.fromkeys(ids))
+        cached = shared_cache.get_many(unique_ids) if shared_cache is not None else {}
+        missing = [_id for _id in unique_ids if _id not in cached]
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+
+        def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            return self._fetch_ids(chunk, params, max_results)
+
+        if len(chunks) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                pages = [page for chunk_pages in executor.map(fetch, chunks) for page in chunk_pages]
+        else:
+            pages = [page for chunk in chunks for page in fetch(chunk)]
+
+        items = [item for page in pages for item in page.get("_items", [])]
+        if shared_cache is not None:
+            shared_cache.set_many({item["_id"]: item for item in items})
+            items = list(cached.values()) + items
+
+        result = pages[0] if len(pages) == 1 and not cached else {"_meta": {"total": len(items)}}
+        result["_items"] = items
 
-        result = resp.json()
         if ordered:
-            result["_items"] = sorted(result["_items"], key=lambda x: ids.index(x["_id"]))
+            position: Dict[str, int] = {}
+            for index, _id in enumerate(ids):
+                position.setdefault(_id, index)
+            items.sort(key=lambda x: position.get(x["_id"], len(ids)))
+
+        if return_missing:
+            found = {item["_id"] for item in items}
+            result["_missing"] = [_id for _id in unique_ids if _id not in found]
+
+        return result
+
+    def get_columns_by_id(
+        self,
+        ids: List[str],
+        fields: Sequence[str],
+        types: Optional[Dict[str, str]] = None,
+        chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        embedded: Optional[Projection] = None,
+        max_results: Optional[int] = None,
+        stream: bool = False,
+    ) -> Columns:
+        """
+        Like :meth:`get_items_by_id`, but only ``fields`` are requested (as
+        the projection) and each page is unpacked into compact
+        :class:`~rest_clients.columnar.Columns` as it arrives, instead of
+        keeping one dict per document; ``types`` maps fields to ``array``
+        typecodes. ``_id`` is always the first column and rows come in server
+        order. With ``stream`` documents are read one by one off the socket.
+        """
+        fields = ["_id", *(field for field in fields if field != "_id")]
+        params = self._read_params(fields, embedded)
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+
+        def fetch(chunk: List[str]) -> Columns:
+            query = self._ids_params(chunk, params, max_results)
+            columns = Columns(fields, types)
+            if stream:
+                return columns.extend(self._stream_items(query, self.DEFAULT_STREAM_CHUNK_SIZE))
+            for page in self._walk_pages(query):
+                columns.extend(page.get("_items", []))
+            return columns
 
+        result = Columns(fields, types)
+        if len(chunks) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                for columns in executor.map(fetch, chunks):
+                    result.merge(columns)
+        else:
+            for chunk in chunks:
+                result.merge(fetch(chunk))
         return result
 
+    def _collection_params(
+        self,
+        where: Optional[Union[str, Dict[str, Any]]] = None,
+        sort: Optional[Union[str, Sequence[Tuple[str, int]]]] = None,
+        max_results: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if where:
+            params["where"] = where if isinstance(where, str) else self._dumps(where)
+        if sort:
+            if not isinstance(sort, str):
+                sort = ",".join(f"-{field}" if direction < 0 else field for field, direction in sort)
+            params["sort"] = sort
+        if max_results:
+            params["max_results"] = max_results
+        return params
+
+    def _walk_pages(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Follow Eve pagination (``_links.next``) one page at a time."""
+        page = params.get("page", 1)
+
+        while True:
+            resp = self._get(self.url, params={**params, "page": page}, headers=self.BASE_HEADERS)
+            resp.raise_for_status()
+            result = self._decode(resp)
+            yield result
+
+            # resources paginated for speed send "next" even past the last page
+            if "next" not in result.get("_links", {}) or not result.get("_items"):
+                return
+            page += 1
+
+    def _prefetch_pages(self, params: Dict[str, Any], prefetch: int) -> Iterator[Dict[str, Any]]:
+        """
+        Walk the pages on a background thread so page N+1 is downloaded while
+        the caller consumes page N. At most ``prefetch`` pages wait in memory.
+        """
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for page in self._walk_pages(params):
+                    if not put(page):
+                        return
+                put(_END_OF_PAGES)
+            except Exception as e:
+                put(e)
+
+        worker = threading.Thread(target=produce, name="eve-prefetch", daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                item = pages.get()
+                if item is _END_OF_PAGES:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def _stream_items(self, params: Dict[str, Any], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """Like :meth:`_walk_pages`, but parse each page's ``_items`` as it downloads."""
+        page = params.get("page", 1)
+
+        while True:
+            resp = self._get(self.url, params={**params, "page": page}, headers=self.BASE_HEADERS, stream=True)
+            try:
+                resp.raise_for_status()
+                items = ItemStream(resp.iter_content(chunk_size=chunk_size), codec=self.codec)
+                yield from items
+            finally:
+                resp.close()
+
+            if "next" not in items.envelope.get("_links", {}) or not items.count:
+                return
+            page += 1
+
+    def iter_items(
+        self,
+        where: Optional[Union[str, Dict[str, Any]]] = None,
+        sort: Optional[Union[str, Sequence[Tuple[str, int]]]] = None,
+        max_results: Optional[int] = None,
+        prefetch: int = 1,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        projection: Optional[Projection] = None,
+        embedded: Optional[Projection] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield every document of the resource, following pagination.
+        With ``prefetch`` > 0 the next pages are fetched in the background;
+        ``prefetch=0`` fetches each page only when the previous one is consumed.
+        ``stream`` (off by default) parses documents one by one while the
+        page downloads, so a large page is never held in memory at once
+        (``prefetch`` is then ignored). It costs about as much CPU as a full
+        parse and gives up prefetching, so only use it when pages are too
+        large to hold.
+        """
+        params = {**self._collection_params(where, sort, max_results), **self._read_params(projection, embedded)}
+        if stream:
+            yield from self._stream_items(params, chunk_size)
+            return
+
+        pages = self._prefetch_pages(params, prefetch) if prefetch > 0 else self._walk_pages(params)
+
+        try:
+            for page in pages:
+                yield from page.get("_items", [])
+        finally:
+            pages.close()
+
+    def format_date(self, value: Union[datetime, str]) -> str:
+        """``value`` in Eve's ``DATE_FORMAT``; aware datetimes are converted to UTC."""
+        if isinstance(value, str):
+            try:
+                datetime.strptime(value, self.DATE_FORMAT)
+            except ValueError:
+                raise ValueError(f"Invalid date {value!r}, expected e.g. 'Mon, 05 Jan 2026 10:00:00 GMT'") from None
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(self.DATE_FORMAT)
+
+    def changes_since(
+        self,
+        since: Union[datetime, str, None] = None,
+        where: Optional[Union[str, Dict[str, Any]]] = None,
+        max_results: int = DEFAULT_CHANGES_PAGE_SIZE,
+        projection: Optional[Projection] = None,
+        embedded: Optional[Projection] = None,
+        seen: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the documents updated at or after ``since`` (every document
+        when None), ordered by ``_updated`` then ``_id``. Each request
+        continues after the last document returned instead of asking for the
+        next page number, so documents updated during the walk can not shift
+        unread ones out of it. Eve's dates have second precision, so
+        documents already processed at ``since`` are passed in ``seen``
+        (``{_id: _etag}``) and skipped.
+        """
+        where = json.loads(where) if isinstance(where, str) else where
+        since = self.format_date(since) if since is not None else None
+        seen = seen or {}
+        params = {
+            **self._collection_params(sort=[("_updated", 1), ("_id", 1)], max_results=max_results),
+            **self._read_params(projection, embedded),
+        }
+        cursor = {"_updated": {"$gte": since}} if since else None
+
+        while True:
+            filters = [f for f in (where, cursor) if f]
+            query = dict(params)
+            if filters:
+                query["where"] = self._dumps(filters[0] if len(filters) == 1 else {"$and": filters})
+            resp = self._get(self.url, params=query, headers=self.BASE_HEADERS)
+            resp.raise_for_status()
+            page = self._decode(resp)
+
+            items = page.get("_items", [])
+            for item in items:
+                if item.get("_updated") == since and seen.get(item["_id"]) == item.get("_etag"):
+                    continue
+                yield item
+
+            if not items or "next" not in page.get("_links", {}):
+                return
+            last = items[-1]
+            cursor = {"$or": [
+                {"_updated": {"$gt": last["_updated"]}},
+                {"_updated": last["_updated"], "_id": {"$gt": last["_id"]}},
+            ]}
+
     def post(
         self,
         payload: Dict[str, Any],
@@ -81,19 +558,122 @@ class EveApiRest(RestClient):
                 tries=2,
                 func=self._post,
                 url=self.url,
-                json=payload,
                 headers=self._auth_headers(),
                 timeout=self.DEFAULT_TIMEOUT,
+                **self._json_body(payload),
             )
         except Exception as e:
             raise exception(f"Failed to POST to {self.url}: {e}") from e
 
+        created = None
+        # the body is only read when something needs it, and may not be JSON
+        if return_resource or self.etag_cache is not None or self.shared_cache is not None:
+            created = self._written_document(resp)
+        if created is not None:
+            self._remember_etag(created)
+            if self.shared_cache is not None and created.get("_id"):
+                self.shared_cache.invalidate(created["_id"])
+
         if return_resource:
-            resource_id = resp.json().get("_id")
-            return self.get(resource_id)
+            if created is None or not created.get("_id"):
+                raise exception(f"POST to {self.url} did not return the created document")
+            return self.get(created["_id"])
 
         return resp
 
+    def _post_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        try:
+            resp = self._retry_operation(
+                tries=2,
+                func=self._post,
+                url=self.url,
+                headers=self._auth_headers(),
+                timeout=self.DEFAULT_TIMEOUT,
+                **self._json_body(batch),
+            )
+        except HTTPError as e:
+            body = {}
+            if e.response is not None:
+                try:
+                    body = self._decode(e.response)
+                except ValueError:
+                    pass
+            # a batch of one is answered like a single POST, without _items
+            if isinstance(body, dict) and body:
+                items = body["_items"] if "_items" in body else [body]
+            else:
+                items = [{} for _ in batch]
+            # Eve rejects the whole batch when any document is invalid
+            return [
+                {**item, "_status": "ERR", "_issues": item.get("_issues", {"_batch": str(e)})}
+                for item in items
+            ]
+        except Exception as e:
+            return [{"_status": "ERR", "_issues": {"_batch": str(e)}} for _ in batch]
+
+        body = self._decode(resp)
+        items = body.get("_items", [body])
+        for item in items:
+            self._remember_etag(item)
+        return items
+
+    def post_many(
+        self,
+        documents: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Insert documents with Eve bulk POSTs of ``batch_size`` documents.
+        Each batch is retried on its own; the result has one entry per input
+        document with its ``_status`` and either ``_id`` or ``_issues``.
+        """
+        self._require_auth()
+        batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+
+        if len(batches) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                results = list(executor.map(self._post_batch, batches))
+        else:
+            results = [self._post_batch(batch) for batch in batches]
+
+        return [item for batch_result in results for item in batch_result]
+
+    def _conditional_write(self, resource_id: str, func, **kwargs):
+        """
+        Send a write guarded by ``If-Match``. The ETag comes from the caches
+        when possible; a 412 on a cached ETag means it went stale, so the
+        document is fetched again from Eve and the write retried once.
+        """
+        etag = self.etag_cache.get(resource_id) if self.etag_cache is not None else None
+        cached = etag is not None or self.shared_cache is not None
+        if etag is None:
+            etag = self.get(resource_id)["_etag"]
+
+        try:
+            return self._retry_operation(
+                tries=3,
+                func=func,
+                headers=self._auth_headers({"If-match": etag}),
+                **kwargs,
+            )
+        except HTTPError as e:
+            if not cached or e.response is None or e.response.status_code != 412:
+                raise
+
+        logger.debug("Stale ETag for %s, refetching", resource_id)
+        if self.etag_cache is not None:
+            self.etag_cache.pop(resource_id)
+        if self.shared_cache is not None:
+            self.shared_cache.invalidate(resource_id)
+        etag = self._get_document(resource_id)["_etag"]
+        return self._retry_operation(
+            tries=3,
+            func=func,
+            headers=self._auth_headers({"If-match": etag}),
+            **kwargs,
+        )
+
     def patch(
         self,
         resource_id: str,
@@ -104,19 +684,16 @@ class EveApiRest(RestClient):
         url = f"{self.url}/{resource_id}"
 
         try:
-            data = self.get(resource_id)
-            headers = self._auth_headers({"If-match": data["_etag"]})
-
-            resp = self._retry_operation(
-                tries=3,
-                func=self._patch,
-                url=url,
-                json=payload,
-                headers=headers,
-            )
+            resp = self._conditional_write(resource_id, self._patch, url=url, **self._json_body(payload))
         except Exception as e:
             raise exception(f"Failed to PATCH {url}: {e}") from e
 
+        if self.etag_cache is not None:
+            self._remember_etag(self._written_document(resp))
+        if self.response_cache is not None:
+            self.response_cache.pop(url)
+        if self.shared_cache is not None:
+            self.shared_cache.invalidate(resource_id)
         logger.info("Patched successfully: %s", url)
         return resp
 
@@ -125,17 +702,92 @@ class EveApiRest(RestClient):
         url = f"{self.url}/{resource_id}"
 
         try:
-            data = self.get(resource_id)
-            headers = self._auth_headers({"If-match": data["_etag"]})
-
-            resp = self._retry_operation(
-                tries=3,
-                func=self._delete,
-                url=url,
-                headers=headers,
-            )
+            resp = self._conditional_write(resource_id, self._delete, url=url)
         except Exception as e:
             raise exception(f"Failed to DELETE {url}: {e}") from e
+        finally:
+            if self.etag_cache is not None:
+                self.etag_cache.pop(resource_id)
+            if self.response_cache is not None:
+                self.response_cache.pop(url)
+            if self.shared_cache is not None:
+                self.shared_cache.invalidate(resource_id)
 
         logger.info("Deleted successfully: %s", url)
         return resp
+
+    def _run_bulk(
+        self,
+        func: Callable[..., Any],
+        calls: Iterable[Tuple[str, tuple]],
+        max_workers: int,
+        rate: Optional[float],
+    ) -> Dict[str, Any]:
+        """
+        Run ``func(resource_id, *args)`` for every call on a bounded thread
+        pool, never queueing more than twice ``max_workers`` calls at once.
+        Failures are collected per id instead of aborting the batch.
+        """
+        limiter = RateLimiter(rate) if rate else None
+        succeeded: Dict[str, int] = {}
+        failed: Dict[str, Exception] = {}
+
+        def call(resource_id: str, args: tuple):
+            if limiter is not None:
+                limiter.acquire()
+            return func(resource_id, *args)
+
+        def collect(done):
+            for future in done:
+                resource_id = pending.pop(future)
+                try:
+                    succeeded[resource_id] = future.result().status_code
+                except Exception as e:
+                    failed[resource_id] = e
+
+        started = monotonic()
+        pending: Dict[Any, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for resource_id, args in calls:
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(call, resource_id, args)] = resource_id
+            collect(wait(pending)[0])
+
+        elapsed = monotonic() - started
+        total = len(succeeded) + len(failed)
+        return {
+            "succeeded": succeeded,
+            "failed": failed,
+            "elapsed": elapsed,
+            "throughput": total / elapsed if elapsed else 0.0,
+        }
+
+    def patch_many(
+        self,
+        payloads: Dict[str, Dict[str, Any]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        PATCH many documents concurrently (``{resource_id: payload}``), at most
+        ``rate`` requests per second. Returns the status code per succeeded
+        id, the exception per failed id, elapsed seconds and throughput.
+        Keep ``pool_maxsize`` >= ``max_workers`` so every worker reuses a
+        pooled connection.
+        """
+        self._require_auth()
+        calls = ((resource_id, (payload,)) for resource_id, payload in payloads.items())
+        return self._run_bulk(self.patch, calls, max_workers, rate)
+
+    def delete_many(
+        self,
+        ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """DELETE many documents concurrently; same result shape as :meth:`patch_many`."""
+        self._require_auth()
+        calls = ((resource_id, ()) for resource_id in dict.fromkeys(ids))
+        return self._run_bulk(self.delete, calls, max_workers, rate)
@@ -6,3 +6,7 @@ class ApiRestException(Exception):
 
 class MissingConfigurationException(ValueError):
     pass
+
+
+class CircuitOpenException(ApiRestException):
+    pass
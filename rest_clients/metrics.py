@@ -0,0 +1,179 @@
+import bisect
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+COMPRESSION_BUCKETS = (1, 1.5, 2, 3, 4, 6, 8, 12, 16, 32)
+
+
+def _labels(labels: Dict[str, Any]) -> LabelSet:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_labels(labels: LabelSet, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class NullMetrics:
+    """
+    Metrics sink that drops everything. Instrumented code checks ``enabled``
+    first, so with this sink the hot paths do not even read the clock.
+    """
+
+    enabled = False
+
+    def increment(self, name: str, value: float = 1, **labels):
+        pass
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS, **labels):
+        pass
+
+    def set_gauge(self, name: str, value: float, **labels):
+        pass
+
+    def add_collector(self, func: Callable[["NullMetrics"], None]):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsCollector(NullMetrics):
+    """
+    Thread-safe in-memory collector of counters, gauges and histograms keyed
+    by name and labels. ``snapshot()`` returns plain data and
+    ``to_prometheus()`` the Prometheus text exposition format. Callbacks added
+    with ``add_collector`` run before each export to refresh sampled gauges;
+    bound methods are held weakly so clients can still be garbage collected.
+    """
+
+    enabled = True
+
+    def __init__(self, prefix: str = "rest_clients"):
+        self.prefix = f"{prefix}_" if prefix else ""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._gauges: Dict[str, Dict[LabelSet, float]] = {}
+        self._histograms: Dict[str, Dict[LabelSet, _Histogram]] = {}
+        self._collectors: List[Callable[[], Optional[Callable]]] = []
+
+    def increment(self, name: str, value: float = 1, **labels):
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS, **labels):
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_labels(labels)] = value
+
+    def add_collector(self, func: Callable[["MetricsCollector"], None]):
+        ref = weakref.WeakMethod(func) if hasattr(func, "__self__") else (lambda: func)
+        with self._lock:
+            self._collectors.append(ref)
+
+    def _collect(self):
+        with self._lock:
+            self._collectors = [ref for ref in self._collectors if ref() is not None]
+            funcs = [ref() for ref in self._collectors]
+        for func in funcs:
+            if func is not None:
+                func(self)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._collect()
+        with self._lock:
+            return {
+                "counters": {
+                    name: {labels: value for labels, value in series.items()}
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: {labels: value for labels, value in series.items()}
+                    for name, series in self._gauges.items()
+                },
+                "histograms": {
+                    name: {
+                        labels: {
+                            "buckets": dict(zip(h.buckets, h.counts)),
+                            "sum": h.sum,
+                            "count": h.count,
+                        }
+                        for labels, h in series.items()
+                    }
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        self._collect()
+        lines: List[str] = []
+        with self._lock:
+            for kind, metrics in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, series in sorted(metrics.items()):
+                    full_name = self.prefix + name
+                    lines.append(f"# TYPE {full_name} {kind}")
+                    for labels, value in sorted(series.items()):
+                        lines.append(f"{full_name}{_format_labels(labels)} {_format_value(value)}")
+
+            for name, series in sorted(self._histograms.items()):
+                full_name = self.prefix + name
+                lines.append(f"# TYPE {full_name} histogram")
+                for labels, h in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(h.buckets, h.counts):
+                        cumulative += count
+                        lines.append(f"{full_name}_bucket{_format_labels(labels, ('le', _format_value(bound)))} {cumulative}")
+                    lines.append(f"{full_name}_bucket{_format_labels(labels, ('le', '+Inf'))} {h.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(labels)} {_format_value(h.sum)}")
+                    lines.append(f"{full_name}_count{_format_labels(labels)} {h.count}")
+
+        return "\n".join(lines) + "\n"
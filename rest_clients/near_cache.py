@@ -0,0 +1,198 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from redis.exceptions import RedisError
+from .cache import LRUCache
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _as_str(key: Union[str, bytes]) -> str:
+    return key.decode() if isinstance(key, bytes) else key
+
+
+class NearCache:
+    """
+    In-process cache in front of a :class:`rest_clients.redis_client.RedisClient`.
+
+    Coherence relies on Redis client-side caching: a dedicated connection
+    subscribes to ``__redis__:invalidate`` and a second one turns on
+    ``CLIENT TRACKING ... BCAST`` redirected to it, so every write to a
+    tracked key (limited by ``prefixes``) evicts it here. When tracking can not
+    be enabled, or the tracking connections drop, entries fall back to a
+    short ``fallback_ttl``.
+    """
+
+    INVALIDATION_CHANNEL = "__redis__:invalidate"
+    KINDS = ("value", "hash")
+
+    def __init__(
+        self,
+        redis_client,
+        maxsize: int = 10000,
+        ttl: Optional[float] = None,
+        fallback_ttl: float = 1.0,
+        prefixes: Iterable[str] = (),
+        poll_interval: float = 0.5,
+        health_interval: float = 5.0,
+    ):
+        self.redis = redis_client
+        self.cache = LRUCache(maxsize)
+        self.ttl = ttl
+        self.fallback_ttl = fallback_ttl
+        self.prefixes = list(prefixes)
+        self.poll_interval = poll_interval
+        self.health_interval = health_interval
+        self.tracking = False
+        self.invalidations = 0
+        self._lock = threading.Lock()
+        # keys being loaded -> [loaders, invalidations seen], to drop loads that raced a write
+        self._inflight: Dict[str, List[int]] = {}
+        self._stop = threading.Event()
+        self._listener = None
+        self._tracker = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """Enable server-assisted invalidation; returns whether it is active."""
+        try:
+            self._enable_tracking()
+        except (RedisError, OSError) as e:
+            logger.warning("Client tracking unavailable, near cache falls back to TTL: %s", e)
+            self._disconnect()
+            return False
+
+        self.tracking = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="redis-near-cache", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 2)
+            self._thread = None
+        self._disconnect()
+        self.tracking = False
+        self.cache.clear()
+
+    def _enable_tracking(self):
+        pool = self.redis.redis_client.connection_pool
+
+        self._listener = pool.make_connection()
+        self._listener.send_command("CLIENT", "ID")
+        client_id = self._listener.read_response()
+        self._listener.send_command("SUBSCRIBE", self.INVALIDATION_CHANNEL)
+        self._listener.read_response()
+
+        args: List[Any] = ["CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST"]
+        for prefix in self.prefixes:
+            args.extend(("PREFIX", prefix))
+        self._tracker = pool.make_connection()
+        self._tracker.send_command(*args)
+        self._tracker.read_response()
+
+    def _disconnect(self):
+        for conn in (self._listener, self._tracker):
+            if conn is not None:
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
+        self._listener = self._tracker = None
+
+    def _listen(self):
+        idle = 0.0
+        while not self._stop.is_set():
+            try:
+                if self._listener.can_read(timeout=self.poll_interval):
+                    self._on_message(self._listener.read_response())
+                    continue
+
+                idle += self.poll_interval
+                if idle >= self.health_interval:
+                    idle = 0.0
+                    self._tracker.send_command("PING")
+                    self._tracker.read_response()
+            except (RedisError, OSError, AttributeError) as e:
+                if not self._stop.is_set():
+                    logger.warning("Lost client tracking connection, near cache falls back to TTL: %s", e)
+                    self._tracking_lost()
+                return
+
+    def _tracking_lost(self):
+        self.tracking = False
+        self._disconnect()
+        # invalidations may have been missed
+        self.invalidate_all()
+
+    def _on_message(self, message: Any):
+        if not isinstance(message, list) or len(message) < 3 or _as_str(message[0]) != "message":
+            return
+        keys = message[2]
+        if keys is None:
+            self.invalidate_all()
+        else:
+            self.invalidate(*keys)
+
+    def _ttl(self) -> Optional[float]:
+        return self.ttl if self.tracking else self.fallback_ttl
+
+    def get(self, kind: str, key: Union[str, bytes], loader: Callable[[], Any]) -> Any:
+        """Return the cached ``kind`` view of ``key`` (e.g. GET or HGETALL) or load it."""
+        key = _as_str(key)
+        value = self.cache.get((kind, key), _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            entry = self._inflight.setdefault(key, [0, 0])
+            entry[0] += 1
+            seen = entry[1]
+
+        try:
+            value = loader()
+        except BaseException:
+            with self._lock:
+                self._release(key)
+            raise
+
+        with self._lock:
+            if self._release(key) == seen:
+                self.cache.set((kind, key), value, ttl=self._ttl())
+        return value
+
+    def _release(self, key: str) -> int:
+        entry = self._inflight[key]
+        entry[0] -= 1
+        if entry[0] == 0:
+            del self._inflight[key]
+        return entry[1]
+
+    def invalidate(self, *keys: Union[str, bytes]):
+        with self._lock:
+            for key in keys:
+                key = _as_str(key)
+                self.invalidations += 1
+                if key in self._inflight:
+                    self._inflight[key][1] += 1
+                for kind in self.KINDS:
+                    self.cache.pop((kind, key))
+
+    def invalidate_all(self):
+        with self._lock:
+            self.invalidations += 1
+            for entry in self._inflight.values():
+                entry[1] += 1
+            self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.cache.stats(),
+            "tracking": self.tracking,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,178 @@
+import logging
+import threading
+from time import monotonic, sleep
+from typing import Dict, Optional, Tuple
+from .metrics import NULL_METRICS, NullMetrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    In-process token bucket: ``rate`` operations per second on average, with
+    bursts of up to ``burst`` operations. ``acquire`` blocks until allowed.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take ``tokens`` (possibly going negative) and return how long to wait."""
+        with self._lock:
+            now = monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0):
+        wait = self._reserve(tokens)
+        if wait:
+            sleep(wait)
+
+
+# KEYS[1]: bucket hash; ARGV: limit (tokens/s), burst, tokens, recovery
+# (tokens/s regained per second), ttl. Takes the tokens, possibly going
+# negative, and returns how long the caller must wait before using them.
+_ACQUIRE_SCRIPT = """
+redis.replicate_commands()
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local limit = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'rate')
+local elapsed = math.max(0, now - (tonumber(state[2]) or now))
+local rate = math.min(limit, (tonumber(state[3]) or limit) + tonumber(ARGV[4]) * elapsed)
+-- a slowed down bucket also allows smaller bursts
+local burst = tonumber(ARGV[2]) * rate / limit
+local tokens = math.min(burst, (tonumber(state[1]) or burst) + elapsed * rate) - tonumber(ARGV[3])
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now, 'rate', rate)
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+# KEYS[1]: bucket hash; ARGV: limit, decrease factor, minimum rate, cooldown,
+# ttl. Cuts the rate at most once per cooldown and returns the current rate.
+_DECREASE_SCRIPT = """
+redis.replicate_commands()
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'rate', 'cut')
+local rate = tonumber(state[1]) or tonumber(ARGV[1])
+if now - (tonumber(state[2]) or 0) < tonumber(ARGV[4]) then
+    return tostring(rate)
+end
+rate = math.max(tonumber(ARGV[3]), rate * tonumber(ARGV[2]))
+redis.call('HSET', KEYS[1], 'rate', rate, 'cut', now)
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return tostring(rate)
+"""
+
+
+class DistributedRateLimiter:
+    """
+    Token bucket shared by every process through Redis, so a fleet of
+    workers stays under ``rate`` requests per second in total. Buckets are
+    per resource; ``limits`` overrides the rate of a resource (``"things"``)
+    or of one method on it (``"things:POST"``, which then gets its own bucket).
+
+    The rate adapts (AIMD): a 429 or 5xx passed to :meth:`record` multiplies
+    it by ``decrease_factor`` (at most once per ``cooldown`` seconds, down to
+    ``min_fraction`` of the limit) and it then grows back by ``recovery`` of
+    the limit per second. State lives in Redis hashes updated by Lua scripts,
+    using the Redis clock. If Redis is unavailable requests are let through.
+    """
+
+    DEFAULT_NAMESPACE = "rate_limit"
+
+    def __init__(
+        self,
+        redis,
+        rate: float,
+        burst: Optional[float] = None,
+        limits: Optional[Dict[str, float]] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        decrease_factor: float = 0.5,
+        min_fraction: float = 0.05,
+        recovery: float = 0.1,
+        cooldown: float = 1.0,
+        metrics: Optional[NullMetrics] = None,
+    ):
+        from redis.exceptions import RedisError
+
+        for limit in (rate, *(limits or {}).values()):
+            if limit <= 0:
+                raise ValueError(f"Invalid rate: {limit}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"Invalid decrease factor: {decrease_factor}")
+        if recovery <= 0:
+            raise ValueError(f"Invalid recovery: {recovery}")
+
+        self.redis = redis
+        self.rate = rate
+        # seconds of traffic allowed at once
+        self.burst_seconds = burst / rate if burst is not None else 1.0
+        self.limits = dict(limits or {})
+        self.namespace = namespace
+        self.decrease_factor = decrease_factor
+        self.min_fraction = min_fraction
+        self.recovery = recovery
+        self.cooldown = cooldown
+        self.metrics = metrics or NULL_METRICS
+        # idle buckets expire once a cut rate would have fully recovered
+        self._ttl = int(cooldown + self.burst_seconds + 1 / recovery) + 1
+        self._errors = RedisError
+
+    def _bucket(self, resource: str, method: str) -> Tuple[str, float]:
+        """Redis key and configured rate of the bucket for ``method`` on ``resource``."""
+        specific = f"{resource}:{method}"
+        if specific in self.limits:
+            return f"{self.namespace}:{specific}", self.limits[specific]
+        return f"{self.namespace}:{resource}", self.limits.get(resource, self.rate)
+
+    def acquire(self, resource: str, method: str, tokens: float = 1.0):
+        key, limit = self._bucket(resource, method)
+        try:
+            wait = float(self.redis.run_script(
+                _ACQUIRE_SCRIPT,
+                keys=[key],
+                args=[limit, limit * self.burst_seconds, tokens, limit * self.recovery, self._ttl],
+            ))
+        except self._errors as e:
+            logger.warning("Rate limiter unavailable, not limiting: %s", e)
+            return
+
+        if self.metrics.enabled:
+            self.metrics.observe("rate_limit_wait_seconds", wait, resource=resource, method=method)
+        if wait:
+            sleep(wait)
+
+    def record(self, resource: str, method: str, status: int):
+        """Slow the bucket down when the backend signals overload."""
+        if status != 429 and status < 500:
+            return
+
+        key, limit = self._bucket(resource, method)
+        try:
+            rate = float(self.redis.run_script(
+                _DECREASE_SCRIPT,
+                keys=[key],
+                args=[limit, self.decrease_factor, limit * self.min_fraction, self.cooldown, self._ttl],
+            ))
+        except self._errors as e:
+            logger.warning("Rate limiter unavailable, not adapting: %s", e)
+            return
+
+        logger.debug("%s %s answered %s, rate now %.2f/s", method, resource, status, rate)
+        if self.metrics.enabled:
+            self.metrics.set_gauge("rate_limit_rate", rate, resource=resource, method=method)
@@ -1,21 +1,189 @@
-from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import logging
+import threading
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from redis import StrictRedis
+from redis.exceptions import ConnectionError, NoScriptError, ReadOnlyError, TimeoutError
 from redis.sentinel import Sentinel, MasterNotFoundError
+from .metrics import NULL_METRICS, SIZE_BUCKETS, NullMetrics
 
 
-class RedisClient:
+logger = logging.getLogger(__name__)
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class _RedisCommands:
+    """
+    Key and hash operations shared by :class:`RedisClient` and
+    :class:`RedisPipeline`. Subclasses decide how a command is run; every
+    method returns whatever ``_run`` returns, so an async ``_run`` makes
+    them all awaitable.
+    """
+
+    def _run(self, command: str, *args, transform: Optional[Callable[[Any], Any]] = None, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def ping(self) -> bool:
+        return self._run("ping")
+
+    def set_value(self, key: str, value: Any, ex: Optional[int] = None):
+        """Set value of a key with optional expiration time."""
+        return self._run("set", name=key, value=value, ex=ex)
+
+    def set_if_absent(self, key: str, value: Any, ex: Optional[int] = None, px: Optional[int] = None) -> bool:
+        """Set value of a key only if it does not exist yet (SET NX)."""
+        return self._run("set", name=key, value=value, ex=ex, px=px, nx=True, transform=bool)
+
+    def get_value(self, key: str) -> Any:
+        """Get the value of a key."""
+        return self._run("get", key)
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        """Get the values of several keys in one round trip (MGET)."""
+        return self._run("mget", keys)
+
+    def delete_key(self, key: str):
+        """Delete a key."""
+        return self._run("delete", key)
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys in one round trip, returning how many existed."""
+        return self._run("delete", *keys)
+
+    def key_exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return self._run("exists", key, transform=bool)
+
+    def expire_key(self, key: str, seconds: int):
+        """Set a timeout on a key."""
+        return self._run("expire", key, seconds)
+
+    def hash_set_value(self, hash_key: str, field: str, value: Any):
+        return self._run("hset", hash_key, field, value)
+
+    def hash_get_value(self, hash_key: str, field: str) -> Any:
+        return self._run("hget", hash_key, field)
+
+    def hash_get_all(self, hash_key: str) -> Dict[bytes, bytes]:
+        return self._run("hgetall", hash_key)
+
+    def hash_set_multiple(self, hash_key: str, mapping: Dict[str, Any]):
+        return self._run("hset", hash_key, mapping=mapping)
+
+    def hash_delete_field(self, hash_key: str, *fields: str):
+        return self._run("hdel", hash_key, *fields)
+
+    def list_push(self, key: str, *values: Any) -> int:
+        """Append values to a list (RPUSH), returning its new length."""
+        return self._run("rpush", key, *values)
+
+    def list_range(self, key: str, start: int = 0, end: int = -1) -> List[bytes]:
+        return self._run("lrange", key, start, end)
+
+    def list_trim(self, key: str, start: int, end: int = -1):
+        """Keep only the elements between ``start`` and ``end`` (LTRIM)."""
+        return self._run("ltrim", key, start, end)
+
+
+class RedisPipeline(_RedisCommands):
+    """
+    Queue wrapper commands and send them in a single round trip, optionally
+    inside MULTI/EXEC. Used as a context manager the queue is executed on a
+    clean exit and the replies are available in ``results``.
+    """
+
+    def __init__(self, client, transaction: bool = False, metrics: NullMetrics = NULL_METRICS):
+        self.redis_client = client.pipeline(transaction=transaction)
+        self.transaction = transaction
+        self.metrics = metrics
+        self.results: Optional[List[Any]] = None
+        self._transforms: List[Optional[Callable[[Any], Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._transforms)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.execute()
+        finally:
+            self.redis_client.reset()
+
+    def _run(self, command: str, *args, transform: Optional[Callable[[Any], Any]] = None, **kwargs):
+        getattr(self.redis_client, command)(*args, **kwargs)
+        self._transforms.append(transform)
+
+    def _observe(self, started: float):
+        labels = {"transaction": str(self.transaction).lower()}
+        self.metrics.observe("redis_pipeline_duration_seconds", perf_counter() - started, **labels)
+        self.metrics.observe("redis_pipeline_commands", len(self._transforms), buckets=SIZE_BUCKETS, **labels)
+
+    def execute(self) -> List[Any]:
+        if self.metrics.enabled:
+            started = perf_counter()
+            replies = self.redis_client.execute()
+            self._observe(started)
+        else:
+            replies = self.redis_client.execute()
+        transforms, self._transforms = self._transforms, []
+        self.results = [
+            transform(reply) if transform else reply
+            for transform, reply in zip(transforms, replies)
+        ]
+        return self.results
+
+
+class RedisClient(_RedisCommands):
     """
     A wrapper around Redis or Redis Sentinel that ensures connection to a master node
-    and provides common Redis operations.
+    and provides common Redis operations. With ``lazy_connect`` no connection
+    is opened until the first command, which checks the master role.
     """
 
+    BATCH_SIZE = 1000
+    DEFAULT_SERVICE_NAME = "mymaster"
+    WRITE_COMMANDS = frozenset({"set", "delete", "expire", "hset", "hdel"})
+    READ_COMMANDS = frozenset({"get", "mget", "exists", "hget", "hgetall"})
+    # safe to send again after a failover: a write may have been applied
+    RETRYABLE_COMMANDS = READ_COMMANDS | {"ping", "lrange"}
+    # errors after which the master may have moved
+    FAILOVER_ERRORS = (ConnectionError, TimeoutError, ReadOnlyError)
+
     def __init__(self, config: Dict[str, Any]):
         if not isinstance(config, dict):
             raise ValueError(f"Invalid connection parameters: {config}")
 
         self.redis_properties = config
         self.connection_params = self._build_connection_params(config)
-        self.redis_client = self._init_master_client()
+        # a standalone server has no other master to fail over to
+        self.failover_retries = config.get("failover_retries", 3 if "cluster" in self.connection_params else 0)
+        self.failover_backoff = config.get("failover_backoff", 0.5)
+        self.script_timeout = config.get("script_timeout", 0.05)
+        self.metrics = config.get("metrics") or NULL_METRICS
+        self.sentinel: Optional[Sentinel] = None
+        self._reconnect_lock = threading.Lock()
+        self.lazy_connect = config.get("lazy_connect", False)
+        self._verified = not self.lazy_connect
+        self.redis_client = self._connect() if self.lazy_connect else self._init_master_client()
+        self.replica_client = self._connect_replica() if config.get("read_from_replicas") else None
+        self._script_client = None
+        self.near_cache = None
+
+        if config.get("near_cache"):
+            from .near_cache import NearCache
+
+            options = config["near_cache"] if isinstance(config["near_cache"], dict) else {}
+            self.near_cache = NearCache(self, **options)
+            if not self.lazy_connect:
+                self.near_cache.start()
 
     @staticmethod
     def _build_connection_params(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -32,6 +200,7 @@ class RedisClient:
 
             return {
                 "cluster": cluster_nodes,
+                "service_name": config.get("service_name", RedisClient.DEFAULT_SERVICE_NAME),
                 "socket_timeout": timeout,
             }
 
@@ -47,11 +216,11 @@ class RedisClient:
         Connect to Redis or Sentinel depending on configuration.
         """
         if "cluster" in self.connection_params:
-            sentinel = Sentinel(
+            self.sentinel = Sentinel(
                 self.connection_params["cluster"],
                 socket_timeout=self.connection_params["socket_timeout"]
             )
-            return sentinel.master_for("mymaster")
+            return self.sentinel.master_for(self.connection_params["service_name"])
 
         return StrictRedis(
             host=self.connection_params["host"],
@@ -65,47 +234,212 @@ class RedisClient:
         Connect to Redis and ensure the node is a master.
         """
         client = self._connect()
-        info = client.info()
+        self._check_master(client)
+        return client
 
-        if info.get("role") != "master":
-            raise MasterNotFoundError(f"Expected master but connected to: {info.get('role')}")
+    @staticmethod
+    def _check_master(client):
+        """ROLE is a single short reply, unlike the full INFO dump."""
+        role = client.role()[0]
+        if isinstance(role, bytes):
+            role = role.decode()
 
-        return client
+        if role != "master":
+            raise MasterNotFoundError(f"Expected master but connected to: {role}")
 
-    def ping(self) -> bool:
-        return self.redis_client.ping()
+    def _ensure_master(self):
+        """First use in lazy mode: check the master and start the near cache."""
+        with self._reconnect_lock:
+            if self._verified:
+                return
+            self._check_master(self.redis_client)
+            self._verified = True
+            if self.near_cache is not None:
+                self.near_cache.start()
 
-    def set_value(self, key: str, value: Any, ex: Optional[int] = None):
-        """Set value of a key with optional expiration time."""
-        self.redis_client.set(name=key, value=value, ex=ex)
+    def _connect_replica(self):
+        """
+        Client that spreads reads over the replicas known to Sentinel.
+        Standalone Redis has no replicas to route to.
+        """
+        if self.sentinel is None:
+            return None
+        return self.sentinel.slave_for(self.connection_params["service_name"])
 
-    def get_value(self, key: str) -> Any:
-        """Get the value of a key."""
-        return self.redis_client.get(key)
+    def _connect_scripts(self):
+        """Client with the short ``script_timeout``, opened on the first script."""
+        if self._script_client is not None:
+            return self._script_client
 
-    def delete_key(self, key: str):
-        """Delete a key."""
-        self.redis_client.delete(key)
+        with self._reconnect_lock:
+            if self._script_client is None:
+                if self.sentinel is not None:
+                    self._script_client = self.sentinel.master_for(
+                        self.connection_params["service_name"],
+                        socket_timeout=self.script_timeout,
+                    )
+                else:
+                    self._script_client = StrictRedis(
+                        host=self.connection_params["host"],
+                        port=self.connection_params["port"],
+                        password=self.connection_params.get("password"),
+                        socket_timeout=self.script_timeout,
+                    )
+            return self._script_client
 
-    def key_exists(self, key: str) -> bool:
-        """Check if a key exists."""
-        return bool(self.redis_client.exists(key))
+    def _rediscover(self):
+        """
+        Reconnect after a failover: ask Sentinel for the current master again
+        and check it really is one.
+        """
+        with self._reconnect_lock:
+            previous = [self.redis_client]
+            self.redis_client = self._init_master_client()
+            self._verified = True
+            if self.replica_client is not None:
+                previous.append(self.replica_client)
+                self.replica_client = self._connect_replica()
+            if self.near_cache is not None:
+                # the tracking connections pointed at the old master; restarted
+                # under the lock so concurrent rediscoveries do not interleave
+                self.near_cache.stop()
+                self.near_cache.start()
 
-    def expire_key(self, key: str, seconds: int):
-        """Set a timeout on a key."""
-        self.redis_client.expire(key, seconds)
+        for client in previous:
+            try:
+                client.close()
+            except Exception:
+                pass
 
-    def hash_set_value(self, hash_key: str, field: str, value: Any):
-        self.redis_client.hset(hash_key, field, value)
+    def _execute(self, command: str, *args, **kwargs) -> Any:
+        if self.replica_client is not None and command in self.READ_COMMANDS:
+            if not self._verified:
+                # first command in lazy mode, even when it goes to a replica
+                self._ensure_master()
+            try:
+                return getattr(self.replica_client, command)(*args, **kwargs)
+            except (ConnectionError, TimeoutError) as e:
+                logger.warning("Replica read %s failed, using master: %s", command, e)
 
-    def hash_get_value(self, hash_key: str, field: str) -> Any:
-        return self.redis_client.hget(hash_key, field)
+        retries = self.failover_retries if command in self.RETRYABLE_COMMANDS else 0
+        for attempt in range(retries + 1):
+            try:
+                if attempt:
+                    self._rediscover()
+                elif not self._verified:
+                    self._ensure_master()
+                return getattr(self.redis_client, command)(*args, **kwargs)
+            except self.FAILOVER_ERRORS as e:
+                if attempt == retries:
+                    raise
+                logger.warning("Redis %s failed (attempt %d), rediscovering master: %s", command, attempt + 1, e)
+                sleep(self.failover_backoff * (attempt + 1))
+
+    def _measure(self, command: str, call: Callable[[], Any]) -> Any:
+        started = perf_counter()
+        try:
+            reply = call()
+        except Exception as e:
+            self.metrics.increment("redis_command_errors_total", command=command, error=type(e).__name__)
+            raise
+        finally:
+            self.metrics.observe("redis_command_duration_seconds", perf_counter() - started, command=command)
+        return reply
+
+    def _run(self, command: str, *args, transform: Optional[Callable[[Any], Any]] = None, **kwargs) -> Any:
+        if self.metrics.enabled:
+            reply = self._measure(command, lambda: self._execute(command, *args, **kwargs))
+        else:
+            reply = self._execute(command, *args, **kwargs)
+        if self.near_cache is not None and command in self.WRITE_COMMANDS:
+            # read-your-writes without waiting for the invalidation message
+            keys = args if command == "delete" else (kwargs["name"],) if "name" in kwargs else args[:1]
+            self.near_cache.invalidate(*keys)
+        return transform(reply) if transform else reply
+
+    def close(self):
+        """Stop the near cache and disconnect from Redis."""
+        if self.near_cache is not None:
+            self.near_cache.stop()
+        if self._script_client is not None:
+            self._script_client.close()
+        if self.replica_client is not None:
+            self.replica_client.close()
+        self.redis_client.close()
+
+    def get_value(self, key: str) -> Any:
+        """Get the value of a key, through the near cache when enabled."""
+        if self.near_cache is None:
+            return super().get_value(key)
+        return self.near_cache.get("value", key, lambda: super(RedisClient, self).get_value(key))
 
     def hash_get_all(self, hash_key: str) -> Dict[bytes, bytes]:
-        return self.redis_client.hgetall(hash_key)
+        if self.near_cache is None:
+            return super().hash_get_all(hash_key)
+        return self.near_cache.get("hash", hash_key, lambda: super(RedisClient, self).hash_get_all(hash_key))
 
-    def hash_set_multiple(self, hash_key: str, mapping: Dict[str, Any]):
-        self.redis_client.hset(hash_key, mapping=mapping)
+    def get_many(self, keys: List[str]) -> List[Any]:
+        # MGET and DEL need at least one key
+        if not keys:
+            return []
+        return super().get_many(keys)
 
-    def hash_delete_field(self, hash_key: str, *fields: str):
-        self.redis_client.hdel(hash_key, *fields)
+    def delete_many(self, keys: List[str]) -> int:
+        if not keys:
+            return 0
+        return super().delete_many(keys)
+
+    def run_script(self, script: str, keys: Sequence[str] = (), args: Sequence[Any] = ()) -> Any:
+        """
+        Run a Lua script with EVALSHA, sending its source (EVAL) only when
+        the server does not have it cached yet. Scripts are sent once, with
+        no failover retries, over a connection with the short
+        ``script_timeout``: callers on the request path (the rate limiter)
+        would rather fail fast and carry on without Redis.
+        """
+        if not self._verified:
+            self._ensure_master()
+        client = self._connect_scripts()
+        sha = hashlib.sha1(script.encode()).hexdigest()
+
+        def call():
+            try:
+                return client.evalsha(sha, len(keys), *keys, *args)
+            except NoScriptError:
+                return client.eval(script, len(keys), *keys, *args)
+
+        return self._measure("evalsha", call) if self.metrics.enabled else call()
+
+    def pipeline(self, transaction: bool = False) -> RedisPipeline:
+        """Pipelined (and with ``transaction`` MULTI/EXEC) view of this client."""
+        if not self._verified:
+            self._ensure_master()
+        return RedisPipeline(self.redis_client, transaction=transaction, metrics=self.metrics)
+
+    def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ex: Optional[Union[int, Dict[str, int]]] = None,
+        batch_size: int = BATCH_SIZE,
+    ):
+        """
+        Set several keys, ``batch_size`` commands per round trip. ``ex`` is
+        either one expiration for every key or a per-key mapping.
+        """
+        items = list(mapping.items())
+        for chunk in _chunks(items, batch_size):
+            with self.pipeline() as pipe:
+                for key, value in chunk:
+                    pipe.set_value(key, value, ex=ex.get(key) if isinstance(ex, dict) else ex)
+            if self.near_cache is not None:
+                self.near_cache.invalidate(*(key for key, _ in chunk))
+
+    def hash_get_many(self, hash_keys: List[str], batch_size: int = BATCH_SIZE) -> Dict[str, Dict[bytes, bytes]]:
+        """HGETALL several hashes, ``batch_size`` commands per round trip."""
+        result: Dict[str, Dict[bytes, bytes]] = {}
+        for chunk in _chunks(hash_keys, batch_size):
+            with self.pipeline() as pipe:
+                for hash_key in chunk:
+                    pipe.hash_get_all(hash_key)
+            result.update(zip(chunk, pipe.results))
+        return result
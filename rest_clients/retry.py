@@ -0,0 +1,178 @@
+import random
+import threading
+from collections import deque
+from time import monotonic
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+from .exceptions import CircuitOpenException
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the traffic: every request deposits
+    ``ratio`` tokens and every retry withdraws one. ``min_per_second``
+    tokens are added over time so low-traffic clients can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.rejected = 0
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, amount: float = 0.0):
+        now = monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + amount + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self):
+        with self._lock:
+            self._refill(self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                self.rejected += 1
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Which failed responses are retried and how long to wait in between.
+    Backoff is exponential with full jitter, so clients that failed together
+    do not retry together. ``method_statuses`` overrides the retryable
+    statuses for specific HTTP methods.
+    """
+
+    DEFAULT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        statuses: Iterable[int] = DEFAULT_STATUSES,
+        method_statuses: Optional[Dict[str, Iterable[int]]] = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        jitter: bool = True,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.statuses = frozenset(statuses)
+        self.method_statuses = {
+            method.upper(): frozenset(codes) for method, codes in (method_statuses or {}).items()
+        }
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.budget = budget
+
+    def is_retryable(self, method: str, status: int) -> bool:
+        return status in self.method_statuses.get(method.upper(), self.statuses)
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def record_request(self):
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def can_retry(self) -> bool:
+        return self.budget is None or self.budget.withdraw()
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the backend is unhealthy. The breaker opens when, within
+    the last ``window`` seconds and at least ``min_requests`` calls, the
+    failure rate reaches ``failure_threshold``. After ``reset_timeout`` a
+    limited number of trial calls go through (half-open); one success closes
+    it again, one failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        min_requests: int = 20,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.state = self.CLOSED
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._calls: Deque[Tuple[float, bool]] = deque()
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Raise :class:`CircuitOpenException` if the call must not be attempted."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if monotonic() - self._opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    raise CircuitOpenException("Circuit breaker is open", status=503)
+                self.state = self.HALF_OPEN
+                self._trials = 0
+
+            if self.state == self.HALF_OPEN:
+                if self._trials >= self.half_open_calls:
+                    self.rejected += 1
+                    raise CircuitOpenException("Circuit breaker is half-open", status=503)
+                self._trials += 1
+
+    def record(self, success: bool):
+        now = monotonic()
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                if success:
+                    self.state = self.CLOSED
+                    self._calls.clear()
+                else:
+                    self._open(now)
+                return
+
+            self._calls.append((now, success))
+            while self._calls and self._calls[0][0] < now - self.window:
+                self._calls.popleft()
+
+            if self.state == self.CLOSED and len(self._calls) >= self.min_requests:
+                failures = sum(1 for _, ok in self._calls if not ok)
+                if failures / len(self._calls) >= self.failure_threshold:
+                    self._open(now)
+
+    def release(self):
+        """Give back a half-open trial slot whose call ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def _open(self, now: float):
+        self.state = self.OPEN
+        self.opened += 1
+        self._opened_at = now
+        self._calls.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            failures = sum(1 for _, ok in self._calls if not ok)
+            return {
+                "state": self.state,
+                "requests": len(self._calls),
+                "failures": failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
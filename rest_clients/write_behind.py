@@ -0,0 +1,259 @@
+import logging
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+from .codec import get_codec
+from .metrics import SIZE_BUCKETS, NullMetrics
+
+if TYPE_CHECKING:
+    from .eve_rest import EveApiRest
+    from .redis_client import RedisClient
+
+
+logger = logging.getLogger(__name__)
+
+
+def merge_patch(target: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge ``payload`` into ``target`` like consecutive Eve PATCHes would:
+    later values win and nested documents are merged field by field.
+    """
+    for field, value in payload.items():
+        current = target.get(field)
+        if isinstance(value, dict) and isinstance(current, dict):
+            target[field] = merge_patch(dict(current), value)
+        else:
+            target[field] = value
+    return target
+
+
+class WriteBehindBuffer:
+    """
+    Buffer partial updates for an :class:`~rest_clients.eve_rest.EveApiRest`
+    and send them later, merged per ``resource_id``: N calls to :meth:`patch`
+    on the same document between two flushes cost one ETag lookup and one
+    PATCH. A background thread flushes every ``flush_interval`` seconds, or
+    as soon as ``max_pending`` documents are waiting, through ``patch_many``.
+
+    With ``redis`` every write is also appended to the ``journal_key`` list
+    before it is acknowledged and trimmed once flushed; writes a crashed
+    process left in the journal are queued again on construction, so each
+    producer process needs its own key. Reads through the client do not see
+    buffered writes; failed PATCHes are passed to ``on_error`` (by default
+    logged) and dropped.
+    """
+
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    DEFAULT_MAX_PENDING = 1000
+
+    def __init__(
+        self,
+        client: "EveApiRest",
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_workers: int = 4,
+        redis: Optional["RedisClient"] = None,
+        journal_key: Optional[str] = None,
+        on_error: Optional[Callable[[str, Dict[str, Any], Exception], None]] = None,
+        metrics: Optional[NullMetrics] = None,
+        start: bool = True,
+    ):
+        if flush_interval <= 0 or max_pending <= 0:
+            raise ValueError(f"Invalid flush thresholds: {flush_interval}s, {max_pending} documents")
+        if redis is not None and not journal_key:
+            raise ValueError("A journal_key is required to journal writes in Redis")
+
+        self.client = client
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_workers = max_workers
+        self.redis = redis
+        self.journal_key = journal_key
+        self.on_error = on_error or self._log_error
+        self.metrics = metrics or client.metrics
+        self.codec = client.codec or get_codec()
+        self.writes = 0
+        self.patches = 0
+        self.flushes = 0
+        self.failures = 0
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # writes merged into _pending, and the journal sequence numbers of those writes
+        self._pending_writes = 0
+        self._journaled: List[int] = []
+        # flushed writes still in the journal, behind writes that were not flushed yet
+        self._flushed: Set[int] = set()
+        self._sequence = 0
+        self._lock = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if redis is not None:
+            self._recover()
+        if start:
+            self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @staticmethod
+    def _log_error(resource_id: str, payload: Dict[str, Any], error: Exception):
+        logger.error("Dropping buffered PATCH of %s: %s", resource_id, error)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="eve-write-behind", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop the background thread and flush what is still pending."""
+        self._stop.set()
+        with self._lock:
+            self._lock.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def patch(self, resource_id: str, payload: Dict[str, Any]):
+        """
+        Queue a partial update of ``resource_id``, merged with the pending
+        ones. If the journal push fails the error is raised and nothing is queued.
+        """
+        sequence = None
+        if self.redis is not None:
+            with self._lock:
+                sequence = self._sequence
+                self._sequence += 1
+            # one RPUSH, outside the lock so a slow Redis holds up neither
+            # flushes nor the other producers
+            self.redis.list_push(self.journal_key, self.codec.dumps([sequence, resource_id, payload]))
+
+        with self._lock:
+            self._merge(resource_id, payload)
+            if sequence is not None:
+                self._journaled.append(sequence)
+            if len(self._pending) >= self.max_pending:
+                self._lock.notify()
+        if self.metrics.enabled:
+            self.metrics.increment("write_behind_writes_total", resource=self.client.resource)
+
+    def _merge(self, resource_id: str, payload: Dict[str, Any]):
+        pending = self._pending.get(resource_id)
+        self._pending[resource_id] = merge_patch(pending if pending is not None else {}, payload)
+        self._pending_writes += 1
+        self.writes += 1
+
+    def _recover(self):
+        """Queue the writes a previous process journaled but never flushed."""
+        entries = self.redis.list_range(self.journal_key)
+        for entry in entries:
+            sequence, resource_id, payload = self.codec.loads(entry)
+            self._merge(resource_id, payload)
+            self._journaled.append(sequence)
+        self._sequence = max(self._journaled, default=-1) + 1
+        if entries:
+            logger.info("Recovered %d buffered writes from %s", len(entries), self.journal_key)
+
+    def _restore(self, payloads: Dict[str, Dict[str, Any]], writes: int, journaled: List[int]):
+        """Put back a snapshot whose flush failed, under the writes queued since."""
+        for resource_id, payload in self._pending.items():
+            payloads[resource_id] = merge_patch(payloads.get(resource_id, {}), payload)
+        self._pending = payloads
+        self._pending_writes += writes
+        self._journaled = journaled + self._journaled
+
+    def _trim(self, journaled: List[int]):
+        """
+        Drop flushed writes from the head of the journal. Pushes may land out
+        of order, so only the leading run of flushed entries goes; the others
+        wait for a later flush (and are replayed if the process dies first).
+        """
+        self._flushed.update(journaled)
+        try:
+            head = self.redis.list_range(self.journal_key, 0, len(self._flushed) - 1)
+            trimmed = []
+            for entry in head:
+                sequence = self.codec.loads(entry)[0]
+                if sequence not in self._flushed:
+                    break
+                trimmed.append(sequence)
+            if trimmed:
+                self.redis.list_trim(self.journal_key, len(trimmed))
+        except Exception as e:
+            logger.warning("Could not trim the write-behind journal: %s", e)
+            return
+        self._flushed.difference_update(trimmed)
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                self._lock.wait_for(
+                    lambda: self._stop.is_set() or len(self._pending) >= self.max_pending,
+                    timeout=self.flush_interval,
+                )
+            if self._stop.is_set():
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Write-behind flush failed")
+
+    def flush(self) -> Dict[str, Any]:
+        """Send every pending update now; returns the ``patch_many`` result."""
+        with self._flush_lock:
+            with self._lock:
+                payloads, self._pending = self._pending, {}
+                writes, self._pending_writes = self._pending_writes, 0
+                journaled, self._journaled = self._journaled, []
+            if not payloads:
+                return {"succeeded": {}, "failed": {}, "elapsed": 0.0, "throughput": 0.0}
+
+            started = perf_counter()
+            try:
+                result = self.client.patch_many(payloads, max_workers=self.max_workers)
+            except Exception:
+                with self._lock:
+                    self._restore(payloads, writes, journaled)
+                raise
+            elapsed = perf_counter() - started
+
+            if journaled or self._flushed:
+                self._trim(journaled)
+            self.flushes += 1
+            self.patches += len(payloads)
+            self.failures += len(result["failed"])
+            for resource_id, error in result["failed"].items():
+                self.on_error(resource_id, payloads[resource_id], error)
+
+        if self.metrics.enabled:
+            labels = {"resource": self.client.resource}
+            self.metrics.observe("write_behind_flush_duration_seconds", elapsed, **labels)
+            self.metrics.observe("write_behind_flush_documents", len(payloads), buckets=SIZE_BUCKETS, **labels)
+            self.metrics.increment("write_behind_patches_total", len(payloads), **labels)
+            self.metrics.increment("write_behind_failures_total", len(result["failed"]), **labels)
+            self.metrics.observe(
+                "write_behind_coalescing_ratio",
+                writes / len(payloads),
+                buckets=SIZE_BUCKETS,
+                **labels,
+            )
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "writes": self.writes,
+            "patches": self.patches,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            # writes per PATCH sent
+            "coalescing_ratio": (self.writes - self._pending_writes) / self.patches if self.patches else 0.0,
+        }
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from rest_clients.async_eve_rest import AsyncEveApiRest
+from rest_clients.exceptions import ApiRestException, CircuitOpenException, MissingConfigurationException
+from rest_clients.retry import CircuitBreaker, RetryPolicy
+
+
+def make_client(handler, auth=True):
+    auth_handler = None
+    if auth:
+        auth_handler = MagicMock()
+        auth_handler.get_token.return_value = "TOKEN"
+    return AsyncEveApiRest(
+        "http://example.com/things",
+        auth_handler=auth_handler,
+        retry_policy=RetryPolicy(backoff_base=0),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_init_missing_url():
+    with pytest.raises(MissingConfigurationException):
+        AsyncEveApiRest("")
+
+
+def test_status():
+    def handler(request):
+        assert request.url.path == "/things/status"
+        return httpx.Response(200, json={"ok": True})
+
+    assert run(make_client(handler).status()) == {"ok": True}
+
+
+def test_get():
+    def handler(request):
+        assert request.url.path == "/things/123"
+        assert request.headers["Cache-Control"] == "no-cache"
+        return httpx.Response(200, json={"value": 10})
+
+    assert run(make_client(handler).get("123")) == {"value": 10}
+
+
+def test_get_retries_server_errors():
+    responses = [httpx.Response(503), httpx.Response(200, json={"value": 1})]
+
+    def handler(request):
+        return responses.pop(0)
+
+    assert run(make_client(handler).get("1")) == {"value": 1}
+
+
+def test_get_items_by_id_ordered():
+    def handler(request):
+        assert json.loads(request.url.params["where"]) == {"_id": {"$in": ["a", "b"]}}
+        return httpx.Response(200, json={"_items": [{"_id": "b"}, {"_id": "a"}]})
+
+    result = run(make_client(handler).get_items_by_id(["a", "b"], ordered=True))
+    assert result["_items"] == [{"_id": "a"}, {"_id": "b"}]
+
+
+def test_post_requires_auth():
+    client = make_client(lambda request: httpx.Response(201), auth=False)
+    with pytest.raises(MissingConfigurationException):
+        run(client.post({"a": 1}))
+
+
+def test_post_return_resource():
+    def handler(request):
+        if request.method == "POST":
+            assert request.headers["Authorization"] == "TOKEN"
+            return httpx.Response(201, json={"_id": "abc"})
+        return httpx.Response(200, json={"_id": "abc", "name": "Guilherme"})
+
+    result = run(make_client(handler).post({"x": 1}, return_resource=True))
+    assert result == {"_id": "abc", "name": "Guilherme"}
+
+
+def test_post_refreshes_token_on_403():
+    responses = [httpx.Response(403), httpx.Response(201, json={"_id": "abc"})]
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return responses.pop(0)
+
+    client = make_client(handler)
+    client.auth_handler.get_token.side_effect = ["OLD", "NEW"]
+
+    resp = run(client.post({"x": 1}))
+    assert resp.status_code == 201
+    assert seen == ["OLD", "NEW"]
+    client.auth_handler.update_token.assert_called_once()
+
+
+def test_post_exception():
+    client = make_client(lambda request: httpx.Response(500))
+    client.retry_policy = RetryPolicy(jitter=False, backoff_base=0.25)
+    with patch("rest_clients.async_eve_rest.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        with pytest.raises(ApiRestException):
+            run(client.post({"x": 1}))
+    mock_sleep.assert_awaited_once_with(0.25)
+
+
+def test_non_retryable_status_fails_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(422)
+
+    with patch("rest_clients.async_eve_rest.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        with pytest.raises(ApiRestException):
+            run(make_client(handler).post({"x": 1}))
+    assert len(calls) == 1
+    mock_sleep.assert_not_awaited()
+
+
+def test_circuit_breaker_fails_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    client = make_client(handler)
+    client.retries = 0
+    client.circuit_breaker = CircuitBreaker(min_requests=2, failure_threshold=0.5)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            run(client.get("1"))
+    with pytest.raises(CircuitOpenException):
+        run(client.get("1"))
+    assert len(calls) == 2
+
+
+def test_patch_sends_etag():
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, json={"_id": "id1", "_etag": "ET"})
+        assert request.method == "PATCH"
+        assert request.headers["If-Match"] == "ET"
+        return httpx.Response(200, json={"_status": "OK"})
+
+    resp = run(make_client(handler).patch("id1", {"a": "b"}))
+    assert resp.json() == {"_status": "OK"}
+
+
+def test_delete_wraps_errors():
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, json={"_id": "id1", "_etag": "ET"})
+        return httpx.Response(412)
+
+    with patch("rest_clients.async_eve_rest.asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(ApiRestException):
+            run(make_client(handler).delete("id1"))
+
+
+def test_context_manager_closes_client():
+    async def scenario():
+        async with make_client(lambda request: httpx.Response(200, json={})) as client:
+            inner = client.client
+            await client.get("1")
+        return inner
+
+    assert run(scenario()).is_closed
+
+
+def test_cancelled_trial_releases_half_open_slot():
+    async def handler(request):
+        if request.url.path.endswith("/slow"):
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    client.circuit_breaker = CircuitBreaker(reset_timeout=0)
+    client.circuit_breaker.state = CircuitBreaker.OPEN
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._request("GET", f"{client.url}/slow"), 0.01)
+        # the slot was given back, so the next trial can close the circuit
+        await client._request("GET", f"{client.url}/fast")
+
+    run(scenario())
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from redis.sentinel import MasterNotFoundError
+from rest_clients.async_redis_client import AsyncRedisClient
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def mock_master(role="master"):
+    client = MagicMock()
+    client.info = AsyncMock(return_value={"role": role})
+    for command in ("get", "set", "mget", "delete", "exists", "expire", "hset", "hget", "hgetall", "hdel", "aclose"):
+        setattr(client, command, AsyncMock())
+    pipe = client.pipeline.return_value
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.reset = AsyncMock()
+    return client
+
+
+def test_invalid_config_raises():
+    with pytest.raises(ValueError):
+        AsyncRedisClient("not-a-dict")
+
+
+@patch("rest_clients.async_redis_client.ConnectionPool")
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_standalone_uses_shared_pool(mock_redis, mock_pool):
+    client = AsyncRedisClient({"host": "h", "port": 1, "max_connections": 7})
+
+    mock_pool.assert_called_once_with(host="h", port=1, password=None, socket_timeout=0.1, max_connections=7)
+    mock_redis.assert_called_once_with(connection_pool=mock_pool.return_value)
+    assert client.redis_client is mock_redis.return_value
+
+
+@patch("rest_clients.async_redis_client.Sentinel")
+def test_sentinel_master_for(mock_sentinel):
+    master = mock_master()
+    mock_sentinel.return_value.master_for.return_value = master
+
+    client = AsyncRedisClient({"cluster": ["host1:26379"]})
+
+    mock_sentinel.assert_called_once_with([("host1", 26379)], socket_timeout=0.1)
+    mock_sentinel.return_value.master_for.assert_called_once_with("mymaster", max_connections=50)
+    assert client.redis_client is master
+
+
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_master_verified_once_on_first_command(mock_redis):
+    instance = mock_master()
+    instance.get.return_value = b"v"
+    instance.exists.return_value = 1
+    mock_redis.return_value = instance
+
+    async def scenario():
+        client = AsyncRedisClient({"host": "localhost"})
+        return await asyncio.gather(client.get_value("k"), client.key_exists("k"))
+
+    assert run(scenario()) == [b"v", True]
+    instance.info.assert_awaited_once()
+
+
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_non_master_raises(mock_redis):
+    mock_redis.return_value = mock_master("slave")
+
+    with pytest.raises(MasterNotFoundError):
+        run(AsyncRedisClient({"host": "localhost"}).get_value("k"))
+
+
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_key_and_hash_methods(mock_redis):
+    instance = mock_master()
+    instance.hgetall.return_value = {b"f": b"1"}
+    mock_redis.return_value = instance
+
+    async def scenario():
+        async with AsyncRedisClient({"host": "localhost"}) as client:
+            await client.set_value("k", "v", ex=5)
+            await client.delete_many(["a", "b"])
+            await client.hash_set_multiple("h", {"f": 1})
+            return await client.hash_get_all("h")
+
+    assert run(scenario()) == {b"f": b"1"}
+    instance.set.assert_awaited_once_with(name="k", value="v", ex=5)
+    instance.delete.assert_awaited_once_with("a", "b")
+    instance.hset.assert_awaited_once_with("h", mapping={"f": 1})
+    instance.aclose.assert_awaited_once()
+
+
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_many_commands_with_no_keys(mock_redis):
+    instance = mock_master()
+    mock_redis.return_value = instance
+
+    async def scenario():
+        async with AsyncRedisClient({"host": "localhost"}) as client:
+            return await client.get_many([]), await client.delete_many([])
+
+    assert run(scenario()) == ([], 0)
+    instance.mget.assert_not_called()
+    instance.delete.assert_not_called()
+
+
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_pipeline(mock_redis):
+    instance = mock_master()
+    pipe = instance.pipeline.return_value
+    pipe.execute.return_value = [True, 0]
+    mock_redis.return_value = instance
+
+    async def scenario():
+        client = AsyncRedisClient({"host": "localhost"})
+        async with client.pipeline(transaction=True) as p:
+            p.set_value("k", "v")
+            p.key_exists("x")
+        return p.results
+
+    assert run(scenario()) == [True, False]
+    instance.pipeline.assert_called_once_with(transaction=True)
+    pipe.reset.assert_awaited_once()
+
+
+@patch("rest_clients.async_redis_client.StrictRedis")
+def test_hash_get_many(mock_redis):
+    instance = mock_master()
+    instance.pipeline.return_value.execute.return_value = [{b"a": b"1"}, {}]
+    mock_redis.return_value = instance
+
+    result = run(AsyncRedisClient({"host": "localhost"}).hash_get_many(["h1", "h2"]))
+    assert result == {"h1": {b"a": b"1"}, "h2": {}}
@@ -0,0 +1,111 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from rest_clients.auth import TokenManager
+from rest_clients.eve_client import EveClient
+
+
+class CountingHandler:
+    def __init__(self):
+        self.version = 0
+        self.updates = 0
+
+    def get_token(self):
+        return f"T{self.version}"
+
+    def update_token(self):
+        time.sleep(0.01)
+        self.updates += 1
+        self.version += 1
+
+
+def test_invalid_refresh_ratio():
+    with pytest.raises(ValueError):
+        TokenManager(MagicMock(), refresh_ratio=0)
+
+
+def test_token_is_cached():
+    handler = MagicMock()
+    handler.get_token.return_value = "T"
+    manager = TokenManager(handler)
+
+    assert manager.get_token() == "T"
+    assert manager.get_token() == "T"
+    handler.get_token.assert_called_once()
+    handler.update_token.assert_not_called()
+
+
+def test_concurrent_403s_refresh_once():
+    handler = CountingHandler()
+    manager = TokenManager(handler)
+    barrier = threading.Barrier(16)
+
+    def worker():
+        manager.get_token()
+        barrier.wait()
+        manager.update_token()
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert handler.updates == 1
+    assert manager.get_token() == "T1"
+
+
+def test_update_with_current_token_refreshes_again():
+    handler = CountingHandler()
+    manager = TokenManager(handler)
+
+    manager.get_token()
+    manager.update_token()
+    manager.get_token()
+    manager.update_token()
+
+    assert handler.updates == 2
+
+
+@patch("rest_clients.auth.monotonic")
+def test_refreshes_in_background_before_expiry(mock_time):
+    handler = CountingHandler()
+    manager = TokenManager(handler, ttl=100, refresh_ratio=0.5)
+    mock_time.return_value = 1000
+    assert manager.get_token() == "T0"
+
+    mock_time.return_value = 1060
+    assert manager.get_token() == "T0"
+    for _ in range(100):
+        if manager.refreshes:
+            break
+        time.sleep(0.01)
+
+    assert manager.refreshes == 1
+    assert manager.get_token() == "T1"
+
+
+@patch("rest_clients.auth.monotonic")
+def test_expired_token_refreshes_synchronously(mock_time):
+    handler = CountingHandler()
+    manager = TokenManager(handler, ttl=10)
+    mock_time.return_value = 0
+    manager.get_token()
+
+    mock_time.return_value = 11
+    assert manager.get_token() == "T1"
+
+
+def test_eve_client_wraps_handler_in_token_manager():
+    handler = MagicMock()
+    client = EveClient("http://fake.url", handler, token_ttl=300)
+
+    assert isinstance(client.auth_handler, TokenManager)
+    assert client.auth_handler.auth_handler is handler
+    assert client.auth_handler.ttl == 300
+
+    without_ttl = EveClient("http://fake.url", handler).auth_handler
+    assert isinstance(without_ttl, TokenManager) and without_ttl.ttl is None
+    assert EveClient("http://fake.url", without_ttl).auth_handler is without_ttl
+    assert EveClient("http://fake.url").auth_handler is None
@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import patch
+from rest_clients.cache import LRUCache
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_get_set_and_stats():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+@patch("rest_clients.cache.monotonic")
+def test_entries_expire(mock_time):
+    mock_time.return_value = 100
+    cache = LRUCache(10, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+
+    mock_time.return_value = 106
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_weigher_bounds_total_weight():
+    cache = LRUCache(10, weigher=len)
+    cache.set("a", "xxxxxx")
+    cache.set("b", "yyyyyy")
+    cache.set("huge", "z" * 11)
+
+    assert "a" not in cache
+    assert "huge" not in cache
+    assert cache.weight == 6
+
+
+def test_pop_and_clear():
+    cache = LRUCache(10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    cache.clear()
+    assert len(cache) == 0 and cache.weight == 0
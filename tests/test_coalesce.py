@@ -0,0 +1,88 @@
+import threading
+import pytest
+from rest_clients.coalesce import MicroBatcher, SingleFlight
+
+
+def run_concurrently(func, args):
+    results = [None] * len(args)
+
+    def target(index, arg):
+        try:
+            results[index] = func(arg)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=target, args=(i, a)) for i, a in enumerate(args)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"ok": True}
+
+    def call(_):
+        return flight.do("key", slow)
+
+    threading.Timer(0.1, release.set).start()
+    results = run_concurrently(call, range(5))
+
+    assert calls == [1]
+    assert all(r is results[0] for r in results)
+    assert flight.calls == 1 and flight.shared == 4
+
+
+def test_single_flight_shares_errors_and_forgets_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_micro_batcher_groups_keys():
+    loads = []
+
+    def loader(keys):
+        loads.append(sorted(keys))
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    batcher = MicroBatcher(loader, window=0.2, default="default")
+    results = run_concurrently(batcher.submit, ["a", "b", "a", "missing"])
+
+    assert results == ["A", "B", "A", "default"]
+    assert loads == [["a", "b", "missing"]]
+    assert batcher.batches == 1
+
+
+def test_micro_batcher_closes_full_batch():
+    loads = []
+
+    def loader(keys):
+        loads.append(len(keys))
+        return {key: key for key in keys}
+
+    batcher = MicroBatcher(loader, window=5, max_batch=2)
+    assert run_concurrently(batcher.submit, ["a", "b"]) == ["a", "b"]
+    assert loads == [2]
+
+
+def test_micro_batcher_propagates_errors():
+    def loader(keys):
+        raise RuntimeError("down")
+
+    batcher = MicroBatcher(loader, window=0)
+    with pytest.raises(RuntimeError):
+        batcher.submit("a")
@@ -0,0 +1,83 @@
+import json
+import pytest
+from rest_clients.codec import ItemStream, JsonCodec, get_codec
+
+
+PAGE = {
+    "_items": [
+        {"_id": str(i), "text": 'br"ack]ets {[\\', "nested": [1, {"k": "]"}], "name": "ção"}
+        for i in range(20)
+    ],
+    "_links": {"next": {"href": "things?page=2"}},
+    "_meta": {"total": 20, "note": "_items"},
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_get_codec():
+    assert type(get_codec()) is JsonCodec
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+    assert get_codec("auto").loads(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("size", [1, 3, 16, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_item_stream_yields_items_and_envelope(size, indent):
+    data = json.dumps(PAGE, indent=indent, ensure_ascii=False).encode()
+    stream = ItemStream(chunked(data, size))
+
+    assert list(stream) == PAGE["_items"]
+    assert stream.count == 20
+    assert stream.envelope == {**PAGE, "_items": []}
+
+
+def test_item_stream_without_items():
+    stream = ItemStream([b'{"_meta": {"_items": [1]}, "_status": "ERR"}'])
+    assert list(stream) == []
+    assert stream.envelope == {"_meta": {"_items": [1]}, "_status": "ERR"}
+
+
+def test_item_stream_uses_codec():
+    class CountingCodec(JsonCodec):
+        calls = 0
+
+        def loads(self, data):
+            CountingCodec.calls += 1
+            return super().loads(data)
+
+    list(ItemStream([json.dumps(PAGE).encode()], codec=CountingCodec()))
+    # items go through the incremental scanner, the codec decodes the envelope
+    assert CountingCodec.calls == 1
+
+
+def test_item_stream_large_item_and_truncation():
+    data = json.dumps({"_items": [{"blob": "x" * 200000}, {"_id": "2"}], "_links": {}}).encode()
+    items = list(ItemStream(chunked(data, 1000)))
+    assert len(items[0]["blob"]) == 200000 and items[1] == {"_id": "2"}
+
+    with pytest.raises(json.JSONDecodeError):
+        list(ItemStream(chunked(data[:-20], 1000)))
+
+
+def test_item_stream_character_split_after_items():
+    data = '{"_items":[{"_id":"0"}],"_links":{"title":"ção"}}'.encode()
+    split = data.index("ç".encode()) + 1
+    stream = ItemStream([data[:split], data[split:]])
+
+    assert list(stream) == [{"_id": "0"}]
+    assert stream.envelope == {"_items": [], "_links": {"title": "ção"}}
+
+
+@pytest.mark.parametrize("chunks", [
+    [b'{"_items":[12', b'34, 5]}'],
+    [b'{"_items":[1.', b'5e', b'2, tr', b'ue, -', b'7]}'],
+])
+def test_item_stream_scalar_split_across_chunks(chunks):
+    expected = json.loads(b"".join(chunks))["_items"]
+    assert list(ItemStream(chunks)) == expected
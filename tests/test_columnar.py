@@ -0,0 +1,73 @@
+import math
+from array import array
+
+import pytest
+
+from rest_clients.columnar import Columns, record_type
+
+
+DOCS = [
+    {"_id": "a", "price": 1.5, "qty": 2, "owner": {"name": "ann"}},
+    {"_id": "b", "price": 2.0, "owner": {}},
+    {"_id": "c", "qty": 7, "owner": "not-a-dict"},
+]
+
+
+def test_columns_store_typed_and_object_fields():
+    columns = Columns(["_id", "price", "qty", "owner.name"], types={"price": "d", "qty": "q"}).extend(DOCS)
+
+    assert len(columns) == 3
+    assert columns["_id"] == ["a", "b", "c"]
+    assert isinstance(columns["price"], array)
+    assert columns["price"][:2].tolist() == [1.5, 2.0] and math.isnan(columns["price"][2])
+    assert columns["qty"].tolist() == [2, 0, 7]
+    assert columns["owner.name"] == ["ann", None, None]
+
+
+def test_invalid_value_does_not_leave_a_partial_row():
+    columns = Columns(["_id", "qty"], types={"qty": "q"})
+
+    with pytest.raises(TypeError):
+        columns.append({"_id": "a", "qty": "many"})
+
+    assert len(columns) == 0
+    assert columns["_id"] == []
+
+
+def test_types_must_name_known_fields():
+    with pytest.raises(ValueError):
+        Columns(["_id"], types={"price": "d"})
+
+
+def test_merge_appends_rows():
+    first = Columns(["_id", "qty"], types={"qty": "q"}).extend(DOCS[:1])
+    second = Columns(["_id", "qty"], types={"qty": "q"}).extend(DOCS[1:])
+
+    first.merge(second)
+
+    assert len(first) == 3
+    assert first["qty"].tolist() == [2, 0, 7]
+    with pytest.raises(ValueError):
+        first.merge(Columns(["_id"]))
+
+
+def test_records_use_slots():
+    columns = Columns(["_id", "owner.name"]).extend(DOCS[:2])
+
+    records = list(columns.records())
+
+    assert records[0].owner_name == "ann"
+    assert records[1]._asdict() == {"_id": "b", "owner_name": None}
+    assert not hasattr(records[0], "__dict__")
+    assert type(records[0]) is record_type(["_id", "owner.name"])
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    columns = Columns(["_id", "price"], types={"price": "d"}).extend(DOCS[:2])
+
+    arrays = columns.to_numpy()
+
+    assert arrays["price"].dtype == numpy.float64
+    assert arrays["price"].sum() == 3.5
+    assert arrays["_id"].dtype == object
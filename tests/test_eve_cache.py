@@ -0,0 +1,115 @@
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from redis.exceptions import ConnectionError
+from rest_clients.eve_cache import RedisDocumentCache
+from rest_clients.eve_rest import EveApiRest
+
+
+class FakeRedisClient:
+    """Minimal in-memory stand-in for RedisClient."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get_value(self, key):
+        return self.data.get(key)
+
+    def get_many(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def set_many(self, mapping, ex=None):
+        self.data.update({k: v.encode() for k, v in mapping.items()})
+
+    def delete_many(self, keys):
+        for k in keys:
+            self.data.pop(k, None)
+
+    def set_if_absent(self, key, value, ex=None, px=None):
+        if key in self.data:
+            return False
+        self.data[key] = value.encode()
+        return True
+
+    def delete_key(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedisClient()
+
+
+@pytest.fixture
+def cache(redis):
+    return RedisDocumentCache(redis, "things", ttl=60, lock_timeout=0.2, poll_interval=0.01)
+
+
+def test_fetch_loads_once_and_caches(cache, redis):
+    loader = MagicMock(return_value={"_id": "a", "v": 1})
+
+    assert cache.fetch("a", loader) == {"_id": "a", "v": 1}
+    assert cache.fetch("a", loader) == {"_id": "a", "v": 1}
+
+    loader.assert_called_once()
+    assert json.loads(redis.data["eve:things:a"]) == {"_id": "a", "v": 1}
+    assert "eve:things:a:lock" not in redis.data
+
+
+def test_fetch_waits_for_lock_holder(cache, redis):
+    redis.data["eve:things:a:lock"] = b"someone-else"
+    loader = MagicMock()
+
+    def fill(_):
+        redis.data["eve:things:a"] = b'{"_id": "a"}'
+
+    with patch("rest_clients.eve_cache.sleep", side_effect=fill):
+        assert cache.fetch("a", loader) == {"_id": "a"}
+    loader.assert_not_called()
+    assert redis.data["eve:things:a:lock"] == b"someone-else"
+
+
+def test_fetch_falls_back_when_redis_is_down(cache, redis):
+    redis.get_value = MagicMock(side_effect=ConnectionError("down"))
+    redis.set_if_absent = MagicMock(side_effect=ConnectionError("down"))
+    redis.set_many = MagicMock(side_effect=ConnectionError("down"))
+
+    assert cache.fetch("a", lambda: {"_id": "a"}) == {"_id": "a"}
+
+
+def test_get_many_and_invalidate(cache, redis):
+    cache.set_many({"a": {"_id": "a"}, "b": {"_id": "b"}})
+    assert cache.get_many(["a", "b", "c"]) == {"a": {"_id": "a"}, "b": {"_id": "b"}}
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+@patch.object(EveApiRest, "_get")
+def test_eve_get_items_by_id_reads_through(mock_get, cache):
+    cache.set("a", {"_id": "a"})
+    resp = MagicMock()
+    resp.json.return_value = {"_items": [{"_id": "b"}]}
+    mock_get.return_value = resp
+
+    client = EveApiRest("http://example.com", shared_cache=cache)
+    result = client.get_items_by_id(["b", "a"], ordered=True)
+
+    assert result["_items"] == [{"_id": "b"}, {"_id": "a"}]
+    assert json.loads(mock_get.call_args.kwargs["params"]["where"]) == {"_id": {"$in": ["b"]}}
+    assert cache.get("b") == {"_id": "b"}
+
+
+@patch.object(EveApiRest, "_retry_operation")
+@patch.object(EveApiRest, "_get")
+def test_eve_patch_invalidates(mock_get, mock_retry, cache):
+    cache.set("a", {"_id": "a", "_etag": "E1"})
+    mock_retry.return_value.json.return_value = {"_id": "a", "_etag": "E2"}
+
+    client = EveApiRest("http://example.com", shared_cache=cache)
+    client.auth_handler = MagicMock()
+    client.patch("a", {"v": 2})
+
+    mock_get.assert_not_called()
+    assert mock_retry.call_args.kwargs["headers"]["If-match"] == "E1"
+    assert cache.get("a") is None
@@ -1,7 +1,12 @@
+import json
+import threading
+import time
 import pytest
+from requests import HTTPError
 from unittest.mock import MagicMock, patch
 from rest_clients.eve_rest import EveApiRest
 from rest_clients.exceptions import ApiRestException, MissingConfigurationException
+from rest_clients.retry import RetryBudget, RetryPolicy
 
 
 @pytest.fixture
@@ -46,6 +51,22 @@ def test_status(mock_retry, client):
     sess.get.assert_called_once_with("http://example.com/status")
 
 
+@patch.object(EveApiRest, "_retry_session")
+def test_status_goes_through_breaker_and_limiter(mock_retry):
+    from rest_clients.exceptions import CircuitOpenException
+    from rest_clients.retry import CircuitBreaker
+
+    limiter = MagicMock()
+    mock_retry.return_value.get.return_value = MagicMock(status_code=503)
+    client = EveApiRest("http://example.com/things", circuit_breaker=CircuitBreaker(min_requests=1), rate_limiter=limiter)
+
+    client.status()
+    with pytest.raises(CircuitOpenException):
+        client.status()
+    limiter.acquire.assert_called_once_with("things", "GET")
+    limiter.record.assert_called_once_with("things", "GET", 503)
+
+
 @patch.object(EveApiRest, "_get")
 def test_get(mock_get, client):
     resp = MagicMock()
@@ -93,6 +114,19 @@ def test_post_return_resource(mock_get, mock_retry, client):
     assert result == {"_id": "abc", "name": "Guilherme"}
 
 
+@patch.object(EveApiRest, "_retry_operation")
+def test_writes_accept_non_json_responses(mock_retry, client):
+    resp = MagicMock(status_code=201)
+    resp.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
+    mock_retry.return_value = resp
+    client.etag_cache.set("xyz", "ET")
+
+    assert client.post({"a": 1}) is resp
+    assert client.patch("xyz", {"a": 1}) is resp
+    with pytest.raises(ApiRestException):
+        client.post({"a": 1}, return_resource=True)
+
+
 @patch.object(EveApiRest, "_retry_operation", side_effect=Exception("boom"))
 def test_post_exception(mock_retry, client):
     with pytest.raises(ApiRestException):
@@ -171,3 +205,544 @@ def test_retry_operation_fail_last_try(client):
     with patch("rest_clients.eve_rest.sleep"):
         with pytest.raises(Exception):
             client._retry_operation(tries=2, func=fn)
+
+
+def make_page(items, has_next):
+    resp = MagicMock()
+    body = {"_items": items, "_links": {"next": {"href": "x"}} if has_next else {}}
+    resp.json.return_value = body
+    return resp
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+@patch.object(EveApiRest, "_get")
+def test_iter_items_follows_pagination(mock_get, client, prefetch):
+    mock_get.side_effect = [
+        make_page([{"_id": "a"}, {"_id": "b"}], True),
+        make_page([{"_id": "c"}], False),
+    ]
+
+    items = list(client.iter_items(where={"x": 1}, sort=[("name", 1), ("age", -1)], max_results=2, prefetch=prefetch))
+
+    assert [i["_id"] for i in items] == ["a", "b", "c"]
+    pages = [c.kwargs["params"]["page"] for c in mock_get.call_args_list]
+    assert pages == [1, 2]
+    params = mock_get.call_args_list[0].kwargs["params"]
+    assert params["where"] == '{"x": 1}'
+    assert params["sort"] == "name,-age"
+    assert params["max_results"] == 2
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@patch.object(EveApiRest, "_get")
+def test_iter_items_stops_on_empty_page_with_next(mock_get, client, stream):
+    # optimize_pagination_for_speed: "next" on every page, even past the end
+    pages = {1: [{"_id": "a"}, {"_id": "b"}], 2: [{"_id": "c"}]}
+
+    def get(url, params, **kw):
+        body = json.dumps({"_items": pages.get(params["page"], []), "_links": {"next": {"href": "x"}}}).encode()
+        resp = MagicMock()
+        resp.json.return_value = json.loads(body)
+        resp.iter_content.return_value = [body]
+        return resp
+
+    mock_get.side_effect = get
+
+    items = list(client.iter_items(max_results=2, prefetch=0, stream=stream))
+
+    assert [i["_id"] for i in items] == ["a", "b", "c"]
+    assert mock_get.call_count == 3
+
+
+@patch.object(EveApiRest, "_get")
+def test_iter_items_propagates_errors(mock_get, client):
+    failing = MagicMock()
+    failing.raise_for_status.side_effect = Exception("boom")
+    mock_get.side_effect = [make_page([{"_id": "a"}], True), failing]
+
+    items = client.iter_items(prefetch=1)
+    assert next(items) == {"_id": "a"}
+    with pytest.raises(Exception, match="boom"):
+        next(items)
+
+
+@patch.object(EveApiRest, "_get")
+def test_iter_items_stops_prefetch_when_closed(mock_get, client):
+    mock_get.side_effect = lambda *a, **kw: make_page([{"_id": kw["params"]["page"]}], True)
+
+    items = client.iter_items(prefetch=1)
+    assert next(items) == {"_id": 1}
+    items.close()
+
+    calls = mock_get.call_count
+    time.sleep(0.3)
+    assert mock_get.call_count <= calls + 1
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_items_by_id_chunks_and_merges(mock_get, client):
+    def fake_get(url, params, **kw):
+        ids = json.loads(params["where"])["_id"]["$in"]
+        assert len(ids) <= 2
+        return make_page([{"_id": i} for i in reversed(ids) if i != "c"], False)
+
+    mock_get.side_effect = fake_get
+
+    res = client.get_items_by_id(["e", "a", "c", "b", "d", "a"], ordered=True, chunk_size=2, return_missing=True)
+
+    assert [i["_id"] for i in res["_items"]] == ["e", "a", "b", "d"]
+    assert res["_missing"] == ["c"]
+    assert res["_meta"]["total"] == 4
+    assert mock_get.call_count == 3
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_items_by_id_default_chunks_fit_eve_page_limit(mock_get, client):
+    def fake_get(url, params, **kw):
+        ids = json.loads(params["where"])["_id"]["$in"]
+        # Eve's default PAGINATION_LIMIT
+        assert len(ids) <= 50 and params["max_results"] <= 50
+        return make_page([{"_id": i} for i in ids], False)
+
+    mock_get.side_effect = fake_get
+
+    res = client.get_items_by_id([str(i) for i in range(120)])
+
+    assert len(res["_items"]) == 120
+    assert mock_get.call_count == 3
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_items_by_id_follows_pagination_within_chunk(mock_get, client):
+    mock_get.side_effect = [
+        make_page([{"_id": "a"}], True),
+        make_page([{"_id": "b"}], False),
+    ]
+
+    res = client.get_items_by_id(["a", "b"], max_workers=1)
+
+    assert res["_items"] == [{"_id": "a"}, {"_id": "b"}]
+    assert [c.kwargs["params"]["page"] for c in mock_get.call_args_list] == [1, 2]
+
+
+@patch.object(EveApiRest, "_retry_operation")
+def test_post_many_batches(mock_retry, client):
+    def fake_retry(tries, func, url, json, **kw):
+        resp = MagicMock()
+        resp.json.return_value = {
+            "_status": "OK",
+            "_items": [{"_id": doc["n"], "_status": "OK"} for doc in json],
+        }
+        return resp
+
+    mock_retry.side_effect = fake_retry
+    docs = [{"n": i} for i in range(5)]
+
+    result = client.post_many(docs, batch_size=2, max_workers=2)
+
+    assert [r["_id"] for r in result] == [0, 1, 2, 3, 4]
+    assert mock_retry.call_count == 3
+
+
+@patch.object(EveApiRest, "_retry_operation")
+def test_post_many_reports_failed_batches(mock_retry, client):
+    rejected = MagicMock()
+    rejected.json.return_value = {
+        "_status": "ERR",
+        "_items": [{"_status": "OK"}, {"_status": "ERR", "_issues": {"name": "required"}}],
+    }
+    ok = MagicMock()
+    ok.json.return_value = {"_items": [{"_id": "c", "_status": "OK"}, {"_id": "d", "_status": "OK"}]}
+    mock_retry.side_effect = [HTTPError("422", response=rejected), ok, Exception("down")]
+
+    result = client.post_many([{}, {}, {"name": "c"}, {"name": "d"}, {"name": "e"}], batch_size=2)
+
+    assert [r["_status"] for r in result] == ["ERR", "ERR", "OK", "OK", "ERR"]
+    assert result[1]["_issues"] == {"name": "required"}
+    assert "_batch" in result[0]["_issues"]
+    assert result[2]["_id"] == "c"
+    assert result[4]["_issues"] == {"_batch": "down"}
+
+
+@patch.object(EveApiRest, "_retry_operation")
+def test_post_many_single_document_validation_error(mock_retry, client):
+    rejected = MagicMock()
+    rejected.json.return_value = {
+        "_status": "ERR",
+        "_issues": {"name": "required field"},
+        "_error": {"code": 422, "message": "Insertion failure: 1 document(s) contain(s) error(s)"},
+    }
+    mock_retry.side_effect = [HTTPError("422", response=rejected)]
+
+    result = client.post_many([{}])
+
+    assert len(result) == 1
+    assert result[0]["_status"] == "ERR"
+    assert result[0]["_issues"] == {"name": "required field"}
+
+
+def make_response(status=200, body=None):
+    resp = MagicMock()
+    resp.ok = status < 400
+    resp.status_code = status
+    resp.json.return_value = body or {}
+    if status >= 400:
+        resp.raise_for_status.side_effect = HTTPError(str(status), response=resp)
+    return resp
+
+
+@patch.object(EveApiRest, "_patch")
+@patch.object(EveApiRest, "_get")
+def test_patch_uses_cached_etag(mock_get, mock_patch, client):
+    mock_get.return_value = make_response(body={"_id": "id1", "_etag": "E1"})
+    mock_patch.side_effect = [
+        make_response(body={"_id": "id1", "_etag": "E2"}),
+        make_response(body={"_id": "id1", "_etag": "E3"}),
+    ]
+
+    client.patch("id1", {"a": 1})
+    client.patch("id1", {"a": 2})
+
+    mock_get.assert_called_once()
+    assert [c.kwargs["headers"]["If-match"] for c in mock_patch.call_args_list] == ["E1", "E2"]
+    assert client.etag_cache.get("id1") == "E3"
+
+
+@patch.object(EveApiRest, "_patch")
+@patch.object(EveApiRest, "_get")
+def test_patch_refetches_on_stale_etag(mock_get, mock_patch, client):
+    client.etag_cache.set("id1", "STALE")
+    mock_get.return_value = make_response(body={"_id": "id1", "_etag": "FRESH"})
+    mock_patch.side_effect = [make_response(412), make_response(body={"_id": "id1", "_etag": "NEW"})]
+
+    client.patch("id1", {"a": 1})
+
+    assert [c.kwargs["headers"]["If-match"] for c in mock_patch.call_args_list] == ["STALE", "FRESH"]
+    assert client.etag_cache.stats()["hits"] == 1
+
+
+@patch.object(EveApiRest, "_delete")
+@patch.object(EveApiRest, "_get")
+def test_delete_uses_cached_etag_and_evicts(mock_get, mock_delete, client):
+    client.etag_cache.set("id1", "E1")
+    mock_delete.return_value = make_response(204)
+    mock_delete.return_value.ok = True
+
+    client.delete("id1")
+
+    mock_get.assert_not_called()
+    assert mock_delete.call_args.kwargs["headers"]["If-match"] == "E1"
+    assert "id1" not in client.etag_cache
+
+
+def test_etag_cache_can_be_disabled():
+    c = EveApiRest("http://example.com", etag_cache_size=0)
+    assert c.etag_cache is None
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_revalidates_cached_response(mock_get):
+    c = EveApiRest("http://example.com", response_cache_bytes=1024)
+    first = make_response(body={"_id": "id1", "_etag": "E1", "v": 1})
+    first.headers = {"ETag": '"E1"'}
+    first.content = b"x" * 100
+    not_modified = make_response(304)
+    not_modified.raise_for_status.side_effect = None
+    mock_get.side_effect = [first, not_modified]
+
+    assert c.get("id1")["v"] == 1
+    doc = c.get("id1")
+
+    assert doc is first.json.return_value
+    not_modified.json.assert_not_called()
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"E1"'
+    assert c.response_cache.weight == 100
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_replaces_cached_response_when_modified(mock_get):
+    c = EveApiRest("http://example.com", response_cache_bytes=1024)
+    first = make_response(body={"_id": "id1", "_etag": "E1", "v": 1})
+    first.headers = {}
+    first.content = b"{}"
+    second = make_response(body={"_id": "id1", "_etag": "E2", "v": 2})
+    second.headers = {}
+    second.content = b"{}"
+    mock_get.side_effect = [first, second]
+
+    c.get("id1")
+    assert c.get("id1")["v"] == 2
+    assert c.response_cache.get("http://example.com/id1")[""][0] == "E2"
+
+
+def test_retry_operation_resends_with_refreshed_token(client):
+    client.auth_handler.get_token.side_effect = ["NEW"]
+    r403 = make_response(403)
+    rok = make_response(200)
+    func = MagicMock(side_effect=[r403, rok])
+
+    client._retry_operation(tries=2, func=func, headers={"Authorization": "OLD", "If-match": "E"})
+
+    assert func.call_args.kwargs["headers"] == {"Authorization": "NEW", "If-match": "E"}
+
+
+def test_retry_operation_does_not_retry_client_errors(client):
+    func = MagicMock(side_effect=[make_response(404)])
+
+    with patch("rest_clients.eve_rest.sleep") as mock_sleep:
+        with pytest.raises(HTTPError):
+            client._retry_operation(tries=3, func=func)
+
+    func.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_retry_operation_uses_policy_backoff(client):
+    client.retry_policy = RetryPolicy(backoff_base=0.1, jitter=False)
+    func = MagicMock(side_effect=[make_response(503), make_response(503), make_response(200)])
+
+    with patch("rest_clients.eve_rest.sleep") as mock_sleep:
+        client._retry_operation(tries=3, func=func)
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+
+
+def test_retry_operation_respects_budget(client):
+    client.retry_policy = RetryPolicy(budget=RetryBudget(ratio=0, min_per_second=0, max_tokens=0))
+    func = MagicMock(side_effect=[make_response(503)])
+
+    with patch("rest_clients.eve_rest.sleep"):
+        with pytest.raises(HTTPError):
+            client._retry_operation(tries=3, func=func)
+    func.assert_called_once()
+
+
+def test_patch_many_collects_failures(client):
+    def fake_patch(resource_id, payload):
+        if resource_id == "bad":
+            raise ApiRestException("boom")
+        return make_response(200)
+
+    with patch.object(client, "patch", side_effect=fake_patch) as mock_patch:
+        result = client.patch_many({"a": {"x": 1}, "bad": {"x": 2}, "c": {"x": 3}}, max_workers=2)
+
+    assert mock_patch.call_count == 3
+    assert result["succeeded"] == {"a": 200, "c": 200}
+    assert list(result["failed"]) == ["bad"]
+    assert str(result["failed"]["bad"]) == "boom"
+    assert result["throughput"] > 0
+
+
+def test_delete_many_deduplicates_and_rate_limits(client):
+    with patch.object(client, "delete", return_value=make_response(204)) as mock_delete, \
+            patch("rest_clients.eve_rest.RateLimiter") as mock_limiter:
+        result = client.delete_many(["a", "b", "a"], rate=50)
+
+    assert sorted(c.args[0] for c in mock_delete.call_args_list) == ["a", "b"]
+    mock_limiter.assert_called_once_with(50)
+    assert mock_limiter.return_value.acquire.call_count == 2
+    assert result["succeeded"] == {"a": 204, "b": 204}
+    assert result["failed"] == {}
+
+
+def test_delete_many_requires_auth():
+    client = EveApiRest(url="https://api.test.com")
+    with pytest.raises(MissingConfigurationException):
+        client.delete_many(["a"])
+
+
+def test_get_batches_concurrent_ids():
+    client = EveApiRest(url="https://api.test.com", get_batch_window=5, get_batch_size=2)
+    docs = [{"_id": "a", "_etag": "Ea"}]
+
+    with patch.object(client, "_fetch_ids", return_value=[{"_items": docs}]) as mock_fetch, \
+            patch.object(client, "_get_document", side_effect=HTTPError("404")) as mock_get_doc:
+        results = []
+        threads = [threading.Thread(target=lambda i=i: results.append(_safe(client.get, i))) for i in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert sorted(mock_fetch.call_args.args[0]) == ["a", "b"]
+    mock_fetch.assert_called_once()
+    mock_get_doc.assert_called_once_with("b", {})
+    assert docs[0] in results
+    assert client.etag_cache.get("a") == "Ea"
+
+
+def _safe(func, *args):
+    try:
+        return func(*args)
+    except Exception as e:
+        return e
+
+
+def test_retry_operation_counts_retries_and_refreshes(client):
+    from rest_clients.metrics import MetricsCollector
+
+    client.metrics = MetricsCollector()
+    func = MagicMock(__name__="_patch", side_effect=[make_response(403), make_response(503), make_response(200)])
+
+    with patch("rest_clients.eve_rest.sleep"):
+        client._retry_operation(tries=3, func=func, headers={})
+
+    counters = client.metrics.snapshot()["counters"]
+    assert counters["http_token_refreshes_total"] == {(("resource", client.resource),): 1}
+    assert counters["http_retries_total"] == {
+        (("method", "PATCH"), ("resource", client.resource), ("status", "503")): 1,
+    }
+
+
+@patch.object(EveApiRest, "_get")
+def test_iter_items_stream(mock_get, client):
+    pages = [
+        {"_items": [{"_id": "1"}, {"_id": "2"}], "_links": {"next": {"href": "x"}}},
+        {"_items": [{"_id": "3"}], "_links": {}},
+    ]
+    responses = []
+    for page in pages:
+        resp = MagicMock()
+        data = json.dumps(page).encode()
+        resp.iter_content.return_value = [data[i:i + 4] for i in range(0, len(data), 4)]
+        responses.append(resp)
+    mock_get.side_effect = responses
+
+    items = list(client.iter_items(max_results=2, stream=True))
+
+    assert [i["_id"] for i in items] == ["1", "2", "3"]
+    assert mock_get.call_args_list[1].kwargs["params"] == {"max_results": 2, "page": 2}
+    assert all(c.kwargs["stream"] for c in mock_get.call_args_list)
+    assert all(r.close.called for r in responses)
+
+
+@patch.object(EveApiRest, "_retry_operation")
+def test_post_with_codec_sends_encoded_body(mock_retry):
+    client = EveApiRest(url="https://api.test.com", codec="json")
+    client.auth_handler = MagicMock(get_token=MagicMock(return_value="T"))
+    mock_retry.return_value = MagicMock(content=b'{"_id": "1", "_etag": "E"}')
+
+    client.post({"a": 1})
+
+    kwargs = mock_retry.call_args.kwargs
+    assert kwargs["data"] == b'{"a": 1}'
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert client.etag_cache.get("1") == "E"
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_with_projection_skips_shared_cache(mock_get):
+    client = EveApiRest(url="https://api.test.com", shared_cache=MagicMock(), projection=["a"])
+    mock_get.return_value = make_response(200, {"_id": "1", "_etag": "E", "b": 2})
+
+    client.get("1", projection={"b": 1}, embedded=["owner"])
+
+    client.shared_cache.fetch.assert_not_called()
+    assert mock_get.call_args.kwargs["params"] == {"projection": '{"b": 1}', "embedded": '{"owner": 1}'}
+
+
+@patch.object(EveApiRest, "_walk_pages")
+def test_default_projection_applies_to_reads(mock_walk):
+    client = EveApiRest(url="https://api.test.com", projection=["a", "b"])
+    mock_walk.return_value = iter([{"_items": [{"_id": "1", "a": 1}]}])
+
+    client.get_items_by_id(["1", "2", "3"], max_results=2)
+
+    params = mock_walk.call_args.args[0]
+    assert params["projection"] == '{"a": 1, "b": 1}'
+    assert params["max_results"] == 2
+
+    mock_walk.return_value = (page for page in [])
+    list(client.iter_items(prefetch=0, projection=[]))
+    assert "projection" not in mock_walk.call_args.args[0]
+
+
+@patch.object(EveApiRest, "_get")
+def test_response_cache_keys_include_projection(mock_get):
+    client = EveApiRest(url="https://api.test.com", response_cache_bytes=1024)
+    mock_get.return_value = make_response(200, {"_id": "1", "_etag": "E"})
+    mock_get.return_value.headers = {}
+    mock_get.return_value.content = b"{}"
+
+    client.get("1")
+    client.get("1", projection=["a"])
+
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+
+@patch.object(EveApiRest, "_retry_operation")
+@patch.object(EveApiRest, "_get")
+def test_write_evicts_every_cached_shape_of_a_document(mock_get, mock_retry):
+    client = EveApiRest("http://example.com", response_cache_bytes=1024)
+    client.auth_handler = MagicMock()
+    mock_get.return_value = make_response(200, {"_id": "1", "_etag": "E"})
+    mock_get.return_value.headers = {}
+    mock_get.return_value.content = b"{}"
+    mock_retry.return_value = make_response(200, {"_id": "1", "_etag": "E2"})
+
+    client.get("1")
+    client.get("1", projection=["a"])
+    assert len(client.response_cache.get("http://example.com/1")) == 2
+
+    client.patch("1", {"a": 1})
+
+    assert "http://example.com/1" not in client.response_cache
+    assert client.response_cache.weight == 0
+
+
+@patch.object(EveApiRest, "_get")
+def test_get_columns_by_id_projects_and_fills_columns(mock_get, client):
+    mock_get.side_effect = [
+        make_page([{"_id": "a", "price": 1.5}, {"_id": "b", "price": 2.5}], True),
+        make_page([{"_id": "c", "price": 3.0}], False),
+        make_page([{"_id": "d"}], False),
+    ]
+
+    columns = client.get_columns_by_id(["a", "b", "c", "a", "d"], ["price"], types={"price": "d"}, chunk_size=3, max_workers=1)
+
+    assert columns.fields == ("_id", "price")
+    assert columns["_id"] == ["a", "b", "c", "d"]
+    assert columns["price"][:3].tolist() == [1.5, 2.5, 3.0]
+    params = mock_get.call_args_list[0].kwargs["params"]
+    assert json.loads(params["projection"]) == {"_id": 1, "price": 1}
+    assert json.loads(params["where"]) == {"_id": {"$in": ["a", "b", "c"]}}
+
+
+@patch.object(EveApiRest, "_get")
+def test_changes_since_walks_by_key_and_skips_seen(mock_get, client):
+    t0, t1 = "Mon, 05 Jan 2026 10:00:00 GMT", "Mon, 05 Jan 2026 10:00:01 GMT"
+    mock_get.side_effect = [
+        make_page([
+            {"_id": "a", "_updated": t0, "_etag": "Ea"},
+            {"_id": "b", "_updated": t0, "_etag": "Eb2"},
+        ], True),
+        make_page([{"_id": "c", "_updated": t1, "_etag": "Ec"}], False),
+    ]
+
+    docs = list(client.changes_since(t0, where={"kind": "x"}, max_results=2, seen={"a": "Ea", "b": "Eb1"}))
+
+    assert [d["_id"] for d in docs] == ["b", "c"]
+    first, second = (c.kwargs for c in mock_get.call_args_list)
+    assert first["params"]["sort"] == "_updated,_id"
+    assert json.loads(first["params"]["where"]) == {"$and": [{"kind": "x"}, {"_updated": {"$gte": t0}}]}
+    assert json.loads(second["params"]["where"])["$and"][1] == {"$or": [
+        {"_updated": {"$gt": t0}},
+        {"_updated": t0, "_id": {"$gt": "b"}},
+    ]}
+
+
+@patch.object(EveApiRest, "_get")
+def test_changes_since_without_changes(mock_get, client):
+    from datetime import datetime, timezone
+
+    mock_get.return_value = make_page([], False)
+
+    assert list(client.changes_since(datetime(2026, 1, 5, 10, tzinfo=timezone.utc))) == []
+    params = mock_get.call_args.kwargs["params"]
+    assert json.loads(params["where"]) == {"_updated": {"$gte": "Mon, 05 Jan 2026 10:00:00 GMT"}}
+
+
+def test_changes_since_rejects_malformed_dates(client):
+    with pytest.raises(ValueError, match="Invalid date"):
+        next(client.changes_since("2026-01-05T10:00:00Z"))
@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from requests import ConnectionError as RequestsConnectionError
 from rest_clients._generic_rest import RestClient
-from rest_clients.exceptions import MissingConfigurationException
+from rest_clients.exceptions import CircuitOpenException, MissingConfigurationException
+from rest_clients.retry import CircuitBreaker, RetryPolicy
 
 
 def test_init_ok():
@@ -88,3 +90,242 @@ def test_require_auth_missing(rest_client):
 def test_require_auth_ok(rest_client):
     rest_client.auth_handler = MagicMock()
     rest_client._require_auth()
+
+
+@patch.object(RestClient, "_retry_session")
+def test_session_is_reused_between_calls(mock_session, rest_client):
+    rest_client._get("http://example.com/a")
+    rest_client._post("http://example.com/b")
+
+    mock_session.assert_called_once()
+    assert rest_client.session is mock_session.return_value
+
+
+@patch.object(RestClient, "_retry_session")
+def test_session_uses_pool_configuration(mock_session):
+    client = RestClient("http://example.com", pool_connections=4, pool_maxsize=32, retries=2)
+    client.session
+
+    kwargs = mock_session.call_args.kwargs
+    assert kwargs["pool_connections"] == 4
+    assert kwargs["pool_maxsize"] == 32
+    assert kwargs["retries"] == 2
+
+
+@patch.object(RestClient, "_retry_session")
+def test_close_releases_session(mock_session, rest_client):
+    first = MagicMock()
+    second = MagicMock()
+    mock_session.side_effect = [first, second]
+
+    with rest_client as client:
+        client._get("http://example.com")
+
+    first.close.assert_called_once()
+    assert rest_client.session is second
+
+
+def test_pool_stats_empty_before_first_request(rest_client):
+    assert rest_client.pool_stats() == {}
+
+
+def test_pool_stats_reports_pools(rest_client):
+    pool = MagicMock(scheme="http", host="example.com", port=80, num_connections=2, num_requests=7)
+    pool.pool.queue = [None, MagicMock()]
+    pool.pool.maxsize = 10
+
+    adapter = MagicMock()
+    adapter.poolmanager.pools.keys.return_value = ["key"]
+    adapter.poolmanager.pools.get.return_value = pool
+
+    session = MagicMock()
+    session.adapters = {"http://": adapter, "https://": adapter}
+    rest_client._sessions[3] = session
+
+    assert rest_client.pool_stats() == {
+        "http://example.com:80": {"connections": 2, "requests": 7, "idle": 1, "maxsize": 10}
+    }
+
+
+@patch.object(RestClient, "_retry_session")
+def test_circuit_breaker_opens_on_server_errors(mock_session):
+    mock_session.return_value.get.return_value = MagicMock(status_code=503)
+    client = RestClient("http://example.com", retries=0, circuit_breaker=CircuitBreaker(min_requests=2))
+
+    client._get("http://example.com/a")
+    client._get("http://example.com/a")
+
+    with pytest.raises(CircuitOpenException):
+        client._get("http://example.com/a")
+    assert mock_session.return_value.get.call_count == 2
+    assert client.circuit_breaker.stats()["state"] == "open"
+
+
+@patch.object(RestClient, "_retry_session")
+def test_circuit_breaker_counts_connection_errors(mock_session):
+    mock_session.return_value.get.side_effect = RequestsConnectionError("refused")
+    client = RestClient("http://example.com", circuit_breaker=CircuitBreaker(min_requests=1))
+
+    with pytest.raises(RequestsConnectionError):
+        client._get("http://example.com/a")
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+
+def test_single_flight_coalesces_identical_gets():
+    client = RestClient("http://example.com", single_flight=True)
+    seen = []
+
+    def fake_do(key, func):
+        seen.append(key)
+        return func()
+
+    with patch.object(client, "_send", return_value=MagicMock(status_code=200)) as mock_send, \
+            patch.object(client.single_flight, "do", side_effect=fake_do):
+        client._get("http://example.com/x", params={"b": 2, "a": 1}, headers={"Authorization": "T", "X": "1"})
+        client._get("http://example.com/x", params={"b": 2, "a": 1}, headers={"Authorization": "U", "X": "1"})
+
+    assert mock_send.call_count == 2
+    assert seen[0] == seen[1] == ("GET", "http://example.com/x?b=2&a=1", (("X", "1"),))
+
+
+def test_single_flight_disabled_by_default():
+    client = RestClient("http://example.com")
+    assert client.single_flight is None
+    assert client._coalesce("k", lambda: 1) == 1
+
+
+def test_send_records_metrics():
+    from rest_clients.metrics import MetricsCollector
+
+    metrics = MetricsCollector()
+    client = RestClient("http://example.com/things", metrics=metrics)
+    resp = MagicMock(status_code=200, headers={"Content-Length": "42"})
+    resp.request.body = b"{}"
+
+    with patch.object(client, "_pooled_session") as mock_session:
+        mock_session.return_value.post.return_value = resp
+        client._post("http://example.com/things", json={})
+        mock_session.return_value.get.side_effect = RequestsConnectionError("down")
+        with pytest.raises(RequestsConnectionError):
+            client._get("http://example.com/things/1")
+
+    snapshot = metrics.snapshot()
+    labels = (("method", "POST"), ("resource", "things"))
+    assert snapshot["counters"]["http_request_bytes_total"][labels] == 2
+    assert snapshot["counters"]["http_response_bytes_total"][labels] == 42
+    durations = snapshot["histograms"]["http_request_duration_seconds"]
+    assert durations[labels + (("status", "200"),)]["count"] == 1
+    assert durations[(("method", "GET"), ("resource", "things"), ("status", "error"))]["count"] == 1
+    errors = snapshot["counters"]["http_request_errors_total"]
+    assert errors[(("error", "ConnectionError"), ("method", "GET"), ("resource", "things"))] == 1
+
+
+@patch.object(RestClient, "_retry_session")
+def test_session_negotiates_compression(mock_retry_session):
+    mock_retry_session.return_value.headers = {}
+
+    assert "gzip" in RestClient("http://example.com").session.headers["Accept-Encoding"]
+    client = RestClient("http://example.com", accept_encoding="identity")
+    assert client._build_session(1).headers["Accept-Encoding"] == "identity"
+
+
+def test_send_records_decompressed_size():
+    from rest_clients.metrics import MetricsCollector
+
+    metrics = MetricsCollector()
+    client = RestClient("http://example.com/things", metrics=metrics)
+    resp = MagicMock(status_code=200, headers={"Content-Encoding": "gzip"}, content=b"x" * 400)
+    resp.raw.tell.return_value = 100
+    resp.request.body = None
+
+    with patch.object(client, "_pooled_session") as mock_session:
+        mock_session.return_value.get.return_value = resp
+        client._get("http://example.com/things")
+
+    snapshot = metrics.snapshot()
+    labels = (("method", "GET"), ("resource", "things"))
+    gzip_labels = (("encoding", "gzip"),) + labels
+    assert snapshot["counters"]["http_response_bytes_total"][labels] == 100
+    assert snapshot["counters"]["http_response_decoded_bytes_total"][gzip_labels] == 400
+    assert snapshot["histograms"]["http_response_compression_ratio"][gzip_labels]["sum"] == 4
+
+
+@patch.object(RestClient, "_retry_session")
+def test_rate_limiter_consulted_around_requests(mock_session):
+    mock_session.return_value.post.return_value = MagicMock(status_code=429)
+    limiter = MagicMock()
+    client = RestClient("http://example.com/things", rate_limiter=limiter)
+
+    client._post("http://example.com/things", json={})
+
+    limiter.acquire.assert_called_once_with("things", "POST")
+    limiter.record.assert_called_once_with("things", "POST", 429)
+
+
+def test_retry_session_only_retries_connections():
+    retry = RestClient._retry_session(retries=3).get_adapter("http://example.com").max_retries
+
+    assert retry.connect == 3
+    assert retry.read == 0 and retry.status == 0
+    assert not retry.status_forcelist
+
+
+@pytest.mark.parametrize("retries", [0, 2])
+def test_server_errors_retried_only_by_policy(retries):
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    hits = []
+
+    class Unavailable(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Unavailable)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with RestClient(
+            f"http://127.0.0.1:{server.server_address[1]}",
+            retries=retries,
+            retry_policy=RetryPolicy(backoff_base=0),
+        ) as client:
+            resp = client._get(f"{client.url}/a")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # one hit per policy attempt: the adapter adds none of its own
+    assert resp.status_code == 503
+    assert len(hits) == retries + 1
+
+
+@patch.object(RestClient, "_retry_session")
+@patch("rest_clients._generic_rest.sleep")
+def test_get_retries_within_budget(mock_sleep, mock_session):
+    from rest_clients.retry import RetryBudget
+
+    # room for a single retry
+    budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=1)
+    mock_session.return_value.get.return_value = MagicMock(status_code=502)
+    client = RestClient("http://example.com", retries=3, retry_policy=RetryPolicy(budget=budget))
+
+    assert client._get("http://example.com/a").status_code == 502
+    assert mock_session.return_value.get.call_count == 2
+
+
+@patch.object(RestClient, "_retry_session")
+def test_unexpected_error_releases_half_open_slot(mock_session):
+    mock_session.return_value.get.side_effect = [KeyError("bug"), MagicMock(status_code=200)]
+    client = RestClient("http://example.com", circuit_breaker=CircuitBreaker(reset_timeout=0))
+    client.circuit_breaker.state = CircuitBreaker.OPEN
+
+    with pytest.raises(KeyError):
+        client._get("http://example.com/a")
+    assert client._get("http://example.com/a").status_code == 200
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
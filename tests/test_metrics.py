@@ -0,0 +1,58 @@
+import gc
+from rest_clients.metrics import NULL_METRICS, MetricsCollector
+
+
+def test_null_metrics_is_disabled():
+    assert not NULL_METRICS.enabled
+    NULL_METRICS.increment("x")
+    NULL_METRICS.observe("y", 1.0)
+
+
+def test_collector_counts_and_histograms():
+    metrics = MetricsCollector()
+    metrics.increment("requests_total", method="GET")
+    metrics.increment("requests_total", 2, method="GET")
+    metrics.observe("latency_seconds", 0.003, buckets=(0.001, 0.01), method="GET")
+    metrics.observe("latency_seconds", 5, buckets=(0.001, 0.01), method="GET")
+    metrics.set_gauge("idle", 4, host="h")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["requests_total"] == {(("method", "GET"),): 3}
+    assert snapshot["gauges"]["idle"] == {(("host", "h"),): 4}
+    histogram = snapshot["histograms"]["latency_seconds"][(("method", "GET"),)]
+    assert histogram["buckets"] == {0.001: 0, 0.01: 1}
+    assert histogram["count"] == 2
+    assert histogram["sum"] == 5.003
+
+
+def test_prometheus_text_format():
+    metrics = MetricsCollector(prefix="app")
+    metrics.increment("requests_total", 1234567, path='a"b')
+    metrics.observe("latency_seconds", 0.5, buckets=(0.1, 1))
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE app_requests_total counter" in text
+    assert 'app_requests_total{path="a\\"b"} 1234567' in text
+    assert 'app_latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'app_latency_seconds_bucket{le="1"} 1' in text
+    assert 'app_latency_seconds_bucket{le="+Inf"} 1' in text
+    assert "app_latency_seconds_count 1" in text
+    assert text.endswith("\n")
+
+
+def test_collectors_run_on_export_and_are_weak():
+    metrics = MetricsCollector()
+
+    class Source:
+        def collect(self, sink):
+            sink.set_gauge("sampled", 7)
+
+    source = Source()
+    metrics.add_collector(source.collect)
+    assert metrics.snapshot()["gauges"]["sampled"] == {(): 7}
+
+    del source
+    gc.collect()
+    metrics.reset()
+    assert metrics.snapshot()["gauges"] == {}
@@ -0,0 +1,116 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from redis.exceptions import ConnectionError
+from rest_clients.near_cache import NearCache
+from rest_clients.redis_client import RedisClient
+
+
+def make_connection(responses):
+    conn = MagicMock()
+    conn.read_response.side_effect = list(responses)
+    conn.can_read.return_value = False
+    return conn
+
+
+@pytest.fixture
+def redis():
+    client = MagicMock()
+    listener = make_connection([42, [b"subscribe", b"__redis__:invalidate", 1]])
+    tracker = make_connection([b"OK"])
+    client.redis_client.connection_pool.make_connection.side_effect = [listener, tracker]
+    client.listener, client.tracker = listener, tracker
+    return client
+
+
+def test_start_enables_bcast_tracking(redis):
+    cache = NearCache(redis, prefixes=["cfg:"], poll_interval=0.01)
+    assert cache.start() is True
+
+    redis.listener.send_command.assert_any_call("SUBSCRIBE", "__redis__:invalidate")
+    redis.tracker.send_command.assert_called_once_with(
+        "CLIENT", "TRACKING", "ON", "REDIRECT", 42, "BCAST", "PREFIX", "cfg:"
+    )
+    cache.stop()
+    redis.listener.disconnect.assert_called_once()
+
+
+def test_falls_back_to_ttl_when_tracking_unavailable(redis):
+    redis.tracker.read_response.side_effect = ConnectionError("unknown command")
+    cache = NearCache(redis, ttl=60, fallback_ttl=0.5)
+
+    assert cache.start() is False
+    assert cache.tracking is False
+    assert cache._ttl() == 0.5
+
+
+def test_get_caches_until_invalidated():
+    cache = NearCache(MagicMock())
+    loader = MagicMock(side_effect=[b"1", b"2"])
+
+    assert cache.get("value", "k", loader) == b"1"
+    assert cache.get("value", b"k", loader) == b"1"
+    cache._on_message([b"message", b"__redis__:invalidate", [b"k"]])
+    assert cache.get("value", "k", loader) == b"2"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+def test_flush_message_clears_everything():
+    cache = NearCache(MagicMock())
+    cache.get("value", "a", lambda: 1)
+    cache.get("hash", "b", lambda: {})
+
+    cache._on_message([b"message", b"__redis__:invalidate", None])
+    assert len(cache.cache) == 0
+
+
+def test_load_racing_an_invalidation_is_not_cached():
+    cache = NearCache(MagicMock())
+
+    def loader():
+        cache.invalidate("k")
+        return b"old"
+
+    assert cache.get("value", "k", loader) == b"old"
+    assert cache.get("value", "k", lambda: b"new") == b"new"
+
+
+def test_lost_connection_disables_tracking(redis):
+    cache = NearCache(redis, poll_interval=0.01)
+    cache.start()
+    cache.get("value", "k", lambda: 1)
+
+    redis.listener.can_read.side_effect = ConnectionError("gone")
+    cache._thread.join(timeout=1)
+
+    assert cache.tracking is False
+    assert len(cache.cache) == 0
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+@patch("rest_clients.near_cache.NearCache.start")
+def test_redis_client_reads_through_near_cache(mock_start, mock_redis):
+    instance = MagicMock()
+    instance.role.return_value = [b"master", 0, []]
+    instance.get.return_value = b"v"
+    instance.hgetall.return_value = {b"f": b"1"}
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost", "near_cache": {"maxsize": 10}})
+    mock_start.assert_called_once()
+
+    assert client.get_value("k") == b"v"
+    assert client.get_value("k") == b"v"
+    assert client.hash_get_all("h") == {b"f": b"1"}
+    assert client.hash_get_all("h") == {b"f": b"1"}
+    instance.get.assert_called_once_with("k")
+    instance.hgetall.assert_called_once_with("h")
+
+    client.set_value("k", "w")
+    client.hash_delete_field("h", "f")
+    client.get_value("k")
+    client.hash_get_all("h")
+    assert instance.get.call_count == 2
+    assert instance.hgetall.call_count == 2
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+import rest_clients
+
+
+def test_import_does_not_load_backends():
+    code = (
+        "import sys, rest_clients; "
+        "print(','.join(m for m in ('requests', 'redis', 'httpx') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code]).decode().strip()
+
+    assert output == ""
+
+
+def test_lazy_attributes_resolve():
+    from rest_clients.eve_rest import EveApiRest
+    from rest_clients.redis_client import RedisClient
+
+    assert rest_clients.EveApiRest is EveApiRest
+    assert rest_clients.RedisClient is RedisClient
+    assert "EveClient" in dir(rest_clients)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        rest_clients.NotAClient
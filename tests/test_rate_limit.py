@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_clients.rate_limit import DistributedRateLimiter, RateLimiter
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+@patch("rest_clients.rate_limit.sleep")
+@patch("rest_clients.rate_limit.monotonic", return_value=0)
+def test_limiter_allows_burst_then_waits(mock_time, mock_sleep):
+    limiter = RateLimiter(rate=10, burst=2)
+
+    limiter.acquire()
+    limiter.acquire()
+    mock_sleep.assert_not_called()
+
+    limiter.acquire()
+    limiter.acquire()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    mock_time.return_value = 1
+    mock_sleep.reset_mock()
+    limiter.acquire()
+    mock_sleep.assert_not_called()
+
+
+def make_redis(*replies):
+    redis = MagicMock()
+    redis.run_script.side_effect = list(replies)
+    return redis
+
+
+@patch("rest_clients.rate_limit.sleep")
+def test_distributed_limiter_waits_for_reserved_tokens(mock_sleep):
+    redis = make_redis(b"0", b"0.25")
+    limiter = DistributedRateLimiter(redis, rate=10, limits={"things": 4, "things:POST": 2})
+
+    limiter.acquire("things", "GET")
+    mock_sleep.assert_not_called()
+    limiter.acquire("things", "POST")
+    mock_sleep.assert_called_once_with(0.25)
+
+    keys = [c.kwargs["keys"] for c in redis.run_script.call_args_list]
+    assert keys == [["rate_limit:things"], ["rate_limit:things:POST"]]
+    limit, burst = redis.run_script.call_args_list[0].kwargs["args"][:2]
+    assert (limit, burst) == (4, 4)
+
+
+def test_distributed_limiter_default_rate_for_other_resources():
+    redis = make_redis(b"0")
+    limiter = DistributedRateLimiter(redis, rate=10, burst=20, namespace="eve")
+
+    limiter.acquire("other", "GET")
+
+    call = redis.run_script.call_args
+    assert call.kwargs["keys"] == ["eve:other"]
+    assert call.kwargs["args"][:3] == [10, 20, 1.0]
+
+
+def test_distributed_limiter_decreases_only_on_overload():
+    redis = make_redis(b"5", b"2.5")
+    limiter = DistributedRateLimiter(redis, rate=10)
+
+    limiter.record("things", "GET", 200)
+    limiter.record("things", "GET", 404)
+    redis.run_script.assert_not_called()
+
+    limiter.record("things", "GET", 429)
+    limiter.record("things", "GET", 503)
+
+    assert redis.run_script.call_count == 2
+    limit, factor, minimum = redis.run_script.call_args.kwargs["args"][:3]
+    assert (limit, factor, minimum) == (10, 0.5, pytest.approx(0.5))
+
+
+@patch("rest_clients.rate_limit.sleep")
+def test_distributed_limiter_fails_open(mock_sleep):
+    redis = make_redis(RedisConnectionError("down"), RedisConnectionError("down"))
+    limiter = DistributedRateLimiter(redis, rate=10)
+
+    limiter.acquire("things", "GET")
+    limiter.record("things", "GET", 503)
+
+    mock_sleep.assert_not_called()
+
+
+def test_distributed_limiter_records_metrics():
+    from rest_clients.metrics import MetricsCollector
+
+    metrics = MetricsCollector()
+    limiter = DistributedRateLimiter(make_redis(b"0", b"5"), rate=10, metrics=metrics)
+
+    limiter.acquire("things", "GET")
+    limiter.record("things", "GET", 503)
+
+    snapshot = metrics.snapshot()
+    labels = (("method", "GET"), ("resource", "things"))
+    assert snapshot["histograms"]["rate_limit_wait_seconds"][labels]["count"] == 1
+    assert snapshot["gauges"]["rate_limit_rate"][labels] == 5
+
+
+@pytest.mark.parametrize("options", [{"rate": 0}, {"rate": 1, "limits": {"x": -1}}, {"rate": 1, "decrease_factor": 1}])
+def test_distributed_limiter_invalid_options(options):
+    with pytest.raises(ValueError):
+        DistributedRateLimiter(MagicMock(), **options)
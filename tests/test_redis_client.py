@@ -1,13 +1,14 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from redis.exceptions import ConnectionError, ReadOnlyError
 from redis.sentinel import MasterNotFoundError
 from rest_clients.redis_client import RedisClient
 
 
 def mock_master(role="master"):
-    """Creates a mock Redis client with a fake INFO role."""
+    """Creates a mock Redis client with a fake ROLE reply."""
     client = MagicMock()
-    client.info.return_value = {"role": role}
+    client.role.return_value = [role.encode(), 0, []]
     return client
 
 
@@ -178,3 +179,370 @@ def test_hash_delete_field(mock_redis):
     client.hash_delete_field("hash", "a", "b")
 
     instance.hdel.assert_called_once_with("hash", "a", "b")
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_set_if_absent(mock_redis):
+    instance = mock_master()
+    instance.set.return_value = None
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    assert client.set_if_absent("lock", "me", px=500) is False
+
+    instance.set.assert_called_once_with(name="lock", value="me", ex=None, px=500, nx=True)
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_get_many(mock_redis):
+    instance = mock_master()
+    instance.mget.return_value = [b"1", None]
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    assert client.get_many(["a", "b"]) == [b"1", None]
+    instance.mget.assert_called_once_with(["a", "b"])
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_delete_many(mock_redis):
+    instance = mock_master()
+    instance.delete.return_value = 2
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    assert client.delete_many(["a", "b"]) == 2
+    instance.delete.assert_called_once_with("a", "b")
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_many_commands_with_no_keys(mock_redis):
+    instance = mock_master()
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    assert client.get_many([]) == []
+    assert client.delete_many([]) == 0
+    instance.mget.assert_not_called()
+    instance.delete.assert_not_called()
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_set_many_uses_pipelines_with_per_key_ttl(mock_redis):
+    instance = mock_master()
+    pipe = instance.pipeline.return_value
+    pipe.execute.return_value = [True, True]
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    client.set_many({"a": 1, "b": 2, "c": 3}, ex={"a": 10}, batch_size=2)
+
+    instance.pipeline.assert_called_with(transaction=False)
+    assert pipe.execute.call_count == 2
+    pipe.set.assert_any_call(name="a", value=1, ex=10)
+    pipe.set.assert_any_call(name="b", value=2, ex=None)
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_hash_get_many(mock_redis):
+    instance = mock_master()
+    pipe = instance.pipeline.return_value
+    pipe.execute.return_value = [{b"f": b"1"}, {}]
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    assert client.hash_get_many(["h1", "h2"]) == {"h1": {b"f": b"1"}, "h2": {}}
+    pipe.hgetall.assert_any_call("h2")
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_pipeline_context_manager(mock_redis):
+    instance = mock_master()
+    pipe = instance.pipeline.return_value
+    pipe.execute.return_value = [True, 1, b"v"]
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    with client.pipeline(transaction=True) as p:
+        p.set_value("k", "v", ex=5)
+        p.key_exists("k")
+        p.get_value("k")
+        assert len(p) == 3
+
+    instance.pipeline.assert_called_once_with(transaction=True)
+    assert p.results == [True, True, b"v"]
+    pipe.reset.assert_called_once()
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_pipeline_discarded_on_error(mock_redis):
+    instance = mock_master()
+    pipe = instance.pipeline.return_value
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    with pytest.raises(RuntimeError):
+        with client.pipeline() as p:
+            p.set_value("k", "v")
+            raise RuntimeError("abort")
+
+    pipe.execute.assert_not_called()
+    pipe.reset.assert_called_once()
+
+
+@patch("rest_clients.redis_client.Sentinel")
+def test_sentinel_custom_service_name(mock_sentinel):
+    sentinel_instance = MagicMock()
+    sentinel_instance.master_for.return_value = mock_master("master")
+    mock_sentinel.return_value = sentinel_instance
+
+    RedisClient({"cluster": ["host1:26379"], "service_name": "cache"})
+
+    sentinel_instance.master_for.assert_called_once_with("cache")
+
+
+@patch("rest_clients.redis_client.Sentinel")
+def test_reads_routed_to_replicas(mock_sentinel):
+    master = mock_master("master")
+    replica = MagicMock()
+    replica.get.return_value = b"from-replica"
+    sentinel_instance = MagicMock()
+    sentinel_instance.master_for.return_value = master
+    sentinel_instance.slave_for.return_value = replica
+    mock_sentinel.return_value = sentinel_instance
+
+    client = RedisClient({"cluster": ["host1:26379"], "read_from_replicas": True})
+
+    assert client.get_value("k") == b"from-replica"
+    client.set_value("k", "v")
+    sentinel_instance.slave_for.assert_called_once_with("mymaster")
+    master.get.assert_not_called()
+    master.set.assert_called_once()
+
+
+@patch("rest_clients.redis_client.Sentinel")
+def test_replica_client_closed_on_rediscover_and_close(mock_sentinel):
+    old_replica, new_replica = MagicMock(), MagicMock()
+    mock_sentinel.return_value.master_for.return_value = mock_master("master")
+    mock_sentinel.return_value.slave_for.side_effect = [old_replica, new_replica]
+
+    client = RedisClient({"cluster": ["host1:26379"], "read_from_replicas": True})
+    client._rediscover()
+    old_replica.close.assert_called_once()
+
+    client.close()
+    new_replica.close.assert_called_once()
+
+
+@patch("rest_clients.redis_client.Sentinel")
+def test_replica_failure_falls_back_to_master(mock_sentinel):
+    master = mock_master("master")
+    master.hgetall.return_value = {b"f": b"1"}
+    replica = MagicMock()
+    replica.hgetall.side_effect = ConnectionError("replica down")
+    sentinel_instance = MagicMock()
+    sentinel_instance.master_for.return_value = master
+    sentinel_instance.slave_for.return_value = replica
+    mock_sentinel.return_value = sentinel_instance
+
+    client = RedisClient({"cluster": ["host1:26379"], "read_from_replicas": True})
+    assert client.hash_get_all("h") == {b"f": b"1"}
+
+
+@patch("rest_clients.redis_client.sleep")
+@patch("rest_clients.redis_client.Sentinel")
+def test_failover_rediscovers_master_and_retries(mock_sentinel, mock_sleep):
+    old_master = mock_master("master")
+    old_master.get.side_effect = ConnectionError("gone")
+    new_master = mock_master("master")
+    new_master.get.return_value = b"v"
+    sentinel_instance = MagicMock()
+    sentinel_instance.master_for.side_effect = [old_master, new_master]
+    mock_sentinel.return_value = sentinel_instance
+
+    client = RedisClient({"cluster": ["host1:26379"], "failover_backoff": 0})
+
+    assert client.get_value("k") == b"v"
+    assert client.redis_client is new_master
+    old_master.close.assert_called_once()
+
+
+@patch("rest_clients.redis_client.sleep")
+@patch("rest_clients.redis_client.Sentinel")
+def test_failover_does_not_resend_writes(mock_sentinel, mock_sleep):
+    master = mock_master("master")
+    master.set.side_effect = ReadOnlyError("demoted")
+    mock_sentinel.return_value.master_for.return_value = master
+
+    client = RedisClient({"cluster": ["host1:26379"]})
+    with pytest.raises(ReadOnlyError):
+        client.set_value("k", "v")
+
+    master.set.assert_called_once()
+    mock_sentinel.return_value.master_for.assert_called_once()
+
+
+@patch("rest_clients.redis_client.sleep")
+@patch("rest_clients.redis_client.StrictRedis")
+def test_standalone_has_no_failover_retries_by_default(mock_redis, mock_sleep):
+    instance = mock_master()
+    instance.get.side_effect = ConnectionError("down")
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost"})
+    with pytest.raises(ConnectionError):
+        client.get_value("k")
+
+    assert instance.get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("rest_clients.redis_client.Sentinel")
+def test_rediscover_restarts_near_cache_under_lock(mock_sentinel):
+    mock_sentinel.return_value.master_for.return_value = mock_master("master")
+    client = RedisClient({"cluster": ["host1:26379"]})
+    client.near_cache = MagicMock()
+    held = []
+    client.near_cache.stop.side_effect = lambda: held.append(client._reconnect_lock.locked())
+    client.near_cache.start.side_effect = lambda: held.append(client._reconnect_lock.locked())
+
+    client._rediscover()
+
+    assert held == [True, True]
+
+
+@patch("rest_clients.redis_client.sleep")
+@patch("rest_clients.redis_client.StrictRedis")
+def test_failover_gives_up_after_retries(mock_redis, mock_sleep):
+    instance = mock_master()
+    instance.get.side_effect = ConnectionError("down")
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost", "failover_retries": 2})
+    with pytest.raises(ConnectionError):
+        client.get_value("k")
+
+    assert instance.get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_metrics_record_commands_and_pipelines(mock_redis):
+    from rest_clients.metrics import MetricsCollector
+
+    metrics = MetricsCollector()
+    instance = mock_master()
+    instance.get.side_effect = [b"v", ConnectionError("down")]
+    mock_redis.return_value = instance
+    client = RedisClient({"host": "localhost", "failover_retries": 0, "metrics": metrics})
+
+    client.get_value("k")
+    with pytest.raises(ConnectionError):
+        client.get_value("k")
+    client.set_many({"a": 1, "b": 2, "c": 3})
+
+    snapshot = metrics.snapshot()
+    assert snapshot["histograms"]["redis_command_duration_seconds"][(("command", "get"),)]["count"] == 2
+    assert snapshot["counters"]["redis_command_errors_total"][(("command", "get"), ("error", "ConnectionError"))] == 1
+    sizes = snapshot["histograms"]["redis_pipeline_commands"][(("transaction", "false"),)]
+    assert sizes["count"] == 1 and sizes["sum"] == 3
+
+
+@patch("rest_clients.near_cache.NearCache.start")
+@patch("rest_clients.redis_client.StrictRedis")
+def test_lazy_connect_checks_master_on_first_command(mock_redis, mock_start):
+    instance = mock_master()
+    instance.get.return_value = b"v"
+    mock_redis.return_value = instance
+
+    client = RedisClient({"host": "localhost", "lazy_connect": True, "near_cache": True})
+
+    instance.role.assert_not_called()
+    mock_start.assert_not_called()
+
+    assert client.get_value("k") == b"v"
+    client.get_value("k")
+
+    instance.role.assert_called_once()
+    mock_start.assert_called_once()
+
+
+@patch("rest_clients.near_cache.NearCache.start")
+@patch("rest_clients.redis_client.Sentinel")
+def test_lazy_connect_checks_master_on_replica_read(mock_sentinel, mock_start):
+    master = mock_master("master")
+    mock_sentinel.return_value.master_for.return_value = master
+    mock_sentinel.return_value.slave_for.return_value.get.return_value = b"from-replica"
+
+    client = RedisClient(
+        {"cluster": ["host1:26379"], "read_from_replicas": True, "lazy_connect": True, "near_cache": True}
+    )
+    master.role.assert_not_called()
+
+    assert client.get_value("k") == b"from-replica"
+    master.role.assert_called_once()
+    master.get.assert_not_called()
+    mock_start.assert_called_once()
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_lazy_connect_non_master_raises_on_first_command(mock_redis):
+    mock_redis.return_value = mock_master("slave")
+
+    client = RedisClient({"host": "localhost", "lazy_connect": True, "failover_retries": 0})
+
+    with pytest.raises(MasterNotFoundError):
+        client.get_value("k")
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_run_script_loads_script_on_noscript(mock_redis):
+    from redis.exceptions import NoScriptError
+
+    instance = mock_master()
+    instance.evalsha.side_effect = [NoScriptError("NOSCRIPT"), b"2"]
+    instance.eval.return_value = b"1"
+    mock_redis.return_value = instance
+    client = RedisClient({"host": "localhost"})
+
+    assert client.run_script("return 1", keys=["k"], args=[5]) == b"1"
+    assert client.run_script("return 1", keys=["k"], args=[5]) == b"2"
+
+    sha = instance.evalsha.call_args.args[0]
+    assert len(sha) == 40 and instance.evalsha.call_args.args[1:] == (1, "k", 5)
+    instance.eval.assert_called_once_with("return 1", 1, "k", 5)
+
+
+@patch("rest_clients.redis_client.sleep")
+@patch("rest_clients.redis_client.StrictRedis")
+def test_run_script_fails_fast_without_failover(mock_redis, mock_sleep):
+    master, scripts = mock_master(), MagicMock()
+    scripts.evalsha.side_effect = ConnectionError("down")
+    mock_redis.side_effect = [master, scripts]
+    client = RedisClient({"host": "localhost", "script_timeout": 0.02})
+
+    with pytest.raises(ConnectionError):
+        client.run_script("return 1", keys=["k"])
+
+    scripts.evalsha.assert_called_once()
+    scripts.eval.assert_not_called()
+    mock_sleep.assert_not_called()
+    assert mock_redis.call_count == 2
+    assert mock_redis.call_args.kwargs["socket_timeout"] == 0.02
+
+
+@patch("rest_clients.redis_client.StrictRedis")
+def test_list_commands(mock_redis):
+    instance = mock_master()
+    instance.rpush.return_value = 2
+    instance.lrange.return_value = [b"a", b"b"]
+    mock_redis.return_value = instance
+    client = RedisClient({"host": "localhost"})
+
+    assert client.list_push("l", "a", "b") == 2
+    assert client.list_range("l") == [b"a", b"b"]
+    client.list_trim("l", 1)
+
+    instance.rpush.assert_called_once_with("l", "a", "b")
+    instance.lrange.assert_called_once_with("l", 0, -1)
+    instance.ltrim.assert_called_once_with("l", 1, -1)
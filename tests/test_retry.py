@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import patch
+from rest_clients.exceptions import CircuitOpenException
+from rest_clients.retry import CircuitBreaker, RetryBudget, RetryPolicy
+
+
+def test_policy_statuses_per_method():
+    policy = RetryPolicy(method_statuses={"post": [503]})
+
+    assert policy.is_retryable("GET", 500)
+    assert not policy.is_retryable("GET", 404)
+    assert policy.is_retryable("POST", 503)
+    assert not policy.is_retryable("POST", 500)
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+    assert [policy.backoff(a) for a in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_backoff_jitter_stays_in_range():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    delays = [policy.backoff(3) for _ in range(200)]
+    assert all(0 <= d <= 4 for d in delays)
+    assert len(set(delays)) > 1
+
+
+@patch("rest_clients.retry.monotonic", return_value=0)
+def test_budget_limits_retries(mock_time):
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+    policy = RetryPolicy(budget=budget)
+
+    assert policy.can_retry() and policy.can_retry()
+    assert not policy.can_retry()
+
+    policy.record_request()
+    policy.record_request()
+    assert policy.can_retry()
+    assert budget.rejected == 1
+
+
+@patch("rest_clients.retry.monotonic")
+def test_circuit_breaker_lifecycle(mock_time):
+    mock_time.return_value = 0
+    breaker = CircuitBreaker(failure_threshold=0.5, min_requests=4, window=10, reset_timeout=5)
+
+    for ok in (True, False, True, False):
+        breaker.before_request()
+        breaker.record(ok)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenException):
+        breaker.before_request()
+
+    mock_time.return_value = 6
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.before_request()
+
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["opened"] == 1
+    assert breaker.stats()["rejected"] == 2
+
+
+@patch("rest_clients.retry.monotonic")
+def test_circuit_breaker_forgets_old_failures(mock_time):
+    breaker = CircuitBreaker(failure_threshold=0.6, min_requests=2, window=10)
+    mock_time.return_value = 0
+    breaker.record(False)
+    mock_time.return_value = 20
+    breaker.record(True)
+    breaker.record(False)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["requests"] == 2
+
+
+def test_circuit_breaker_release_frees_trial():
+    breaker = CircuitBreaker(reset_timeout=0)
+    breaker.state = CircuitBreaker.OPEN
+
+    breaker.before_request()
+    with pytest.raises(CircuitOpenException):
+        breaker.before_request()
+    breaker.release()
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
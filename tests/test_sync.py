@@ -0,0 +1,67 @@
+import json
+
+from unittest.mock import MagicMock
+
+from rest_clients.eve_rest import EveApiRest
+from rest_clients.sync import ChangeSync
+
+
+T0 = "Mon, 05 Jan 2026 10:00:00 GMT"
+T1 = "Mon, 05 Jan 2026 10:00:01 GMT"
+
+
+def make_client(*cycles):
+    client = EveApiRest(url="https://api.test.com/things")
+    client.changes_since = MagicMock(side_effect=[(doc for doc in docs) for docs in cycles])
+    return client
+
+
+def test_cycles_resume_from_checkpoint():
+    client = make_client(
+        [{"_id": "a", "_updated": T0, "_etag": "Ea"}, {"_id": "b", "_updated": T1, "_etag": "Eb"}],
+        [],
+    )
+    sync = ChangeSync(client)
+
+    assert [d["_id"] for d in sync.changes()] == ["a", "b"]
+    assert list(sync.changes()) == []
+
+    first, second = client.changes_since.call_args_list
+    assert first.args[0] is None
+    assert second.args[0] == T1
+    assert second.kwargs["seen"] == {"b": "Eb"}
+    assert sync.synced == 2
+
+
+def test_checkpoint_saved_to_redis_and_loaded():
+    redis = MagicMock()
+    redis.get_value.return_value = json.dumps({"updated": T0, "etags": {"a": "Ea"}}).encode()
+    client = make_client([{"_id": "b", "_updated": T0, "_etag": "Eb"}])
+
+    sync = ChangeSync(client, redis=redis, key="sync:things")
+    list(sync.changes())
+
+    assert client.changes_since.call_args.args[0] == T0
+    assert client.changes_since.call_args.kwargs["seen"] == {"a": "Ea"}
+    key, value = redis.set_value.call_args.args
+    assert key == "sync:things"
+    assert json.loads(value) == {"updated": T0, "etags": {"a": "Ea", "b": "Eb"}}
+
+
+def test_document_counts_only_once_consumer_moves_on():
+    redis = MagicMock()
+    redis.get_value.return_value = None
+    client = make_client([
+        {"_id": "a", "_updated": T0, "_etag": "Ea"},
+        {"_id": "b", "_updated": T1, "_etag": "Eb"},
+    ])
+    sync = ChangeSync(client, redis=redis)
+
+    changes = sync.changes()
+    next(changes)
+    next(changes)
+    changes.close()
+
+    assert sync.checkpoint == {"updated": T0, "etags": {"a": "Ea"}}
+    assert json.loads(redis.set_value.call_args.args[1])["updated"] == T0
+    assert redis.set_value.call_args.args[0] == "eve_sync:things"
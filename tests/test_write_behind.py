@@ -0,0 +1,163 @@
+import json
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from rest_clients.exceptions import ApiRestException, MissingConfigurationException
+from rest_clients.metrics import NULL_METRICS, MetricsCollector
+from rest_clients.write_behind import WriteBehindBuffer, merge_patch
+
+
+def make_client(failed=None):
+    client = MagicMock()
+    client.resource = "things"
+    client.codec = None
+    client.metrics = NULL_METRICS
+
+    def patch_many(payloads, max_workers):
+        errors = {_id: error for _id, error in (failed or {}).items() if _id in payloads}
+        ok = {_id: 200 for _id in payloads if _id not in errors}
+        return {"succeeded": ok, "failed": errors, "elapsed": 0.0, "throughput": 0.0}
+
+    client.patch_many.side_effect = patch_many
+    return client
+
+
+def test_merge_patch_merges_nested_documents():
+    target = {"a": 1, "nested": {"x": 1, "y": 1}}
+
+    merge_patch(target, {"b": 2, "nested": {"y": 2}, "a": None})
+
+    assert target == {"a": None, "b": 2, "nested": {"x": 1, "y": 2}}
+
+
+def test_patches_are_coalesced_per_document():
+    client = make_client()
+    buffer = WriteBehindBuffer(client, start=False)
+
+    buffer.patch("a", {"x": 1})
+    buffer.patch("a", {"y": 2})
+    buffer.patch("b", {"x": 3})
+    buffer.patch("a", {"x": 4})
+    result = buffer.flush()
+
+    client.patch_many.assert_called_once_with({"a": {"x": 4, "y": 2}, "b": {"x": 3}}, max_workers=4)
+    assert result["succeeded"] == {"a": 200, "b": 200}
+    assert buffer.stats() == {
+        "pending": 0, "writes": 4, "patches": 2, "flushes": 1, "failures": 0, "coalescing_ratio": 2.0,
+    }
+    buffer.flush()
+    client.patch_many.assert_called_once()
+
+
+def test_background_flush_when_max_pending_reached():
+    client = make_client()
+    flushed = threading.Event()
+    client.patch_many.side_effect = lambda payloads, max_workers: flushed.set() or {"succeeded": {}, "failed": {}}
+
+    with WriteBehindBuffer(client, flush_interval=60, max_pending=2) as buffer:
+        buffer.patch("a", {"x": 1})
+        buffer.patch("b", {"x": 1})
+        assert flushed.wait(timeout=5)
+
+
+def test_failed_patches_reported_and_dropped():
+    error = ApiRestException("412")
+    on_error = MagicMock()
+    buffer = WriteBehindBuffer(make_client(failed={"a": error}), on_error=on_error, start=False)
+
+    buffer.patch("a", {"x": 1})
+    buffer.patch("b", {"x": 1})
+    buffer.flush()
+
+    on_error.assert_called_once_with("a", {"x": 1}, error)
+    assert buffer.stats()["failures"] == 1
+    assert len(buffer) == 0
+
+
+def test_failed_flush_keeps_writes_pending():
+    client = make_client()
+    buffer = WriteBehindBuffer(client, start=False)
+    buffer.patch("a", {"x": 1, "nested": {"y": 1}})
+    client.patch_many.side_effect = MissingConfigurationException("no auth")
+
+    with pytest.raises(MissingConfigurationException):
+        buffer.flush()
+
+    client.patch_many.side_effect = None
+    client.patch_many.return_value = {"succeeded": {"a": 200}, "failed": {}}
+    buffer.patch("a", {"nested": {"z": 2}})
+    buffer.flush()
+
+    assert client.patch_many.call_args.args[0] == {"a": {"x": 1, "nested": {"y": 1, "z": 2}}}
+
+
+def test_journal_in_redis_is_replayed_and_trimmed():
+    redis = MagicMock()
+    journal = [json.dumps([7, "a", {"x": 1}]).encode()]
+    redis.list_range.side_effect = lambda key, start=0, end=-1: journal[start:None if end == -1 else end + 1]
+    redis.list_push.side_effect = lambda key, value: journal.append(value.encode())
+    client = make_client()
+
+    buffer = WriteBehindBuffer(client, redis=redis, journal_key="wb:things:worker-1", start=False)
+    assert len(buffer) == 1
+
+    buffer.patch("a", {"y": 2})
+    redis.list_push.assert_called_once_with("wb:things:worker-1", json.dumps([8, "a", {"y": 2}]))
+    buffer.flush()
+
+    client.patch_many.assert_called_once_with({"a": {"x": 1, "y": 2}}, max_workers=4)
+    redis.list_trim.assert_called_once_with("wb:things:worker-1", 2)
+
+
+def test_journal_keeps_writes_pushed_ahead_of_flushed_ones():
+    journal, pushed, resume = [], threading.Event(), threading.Event()
+
+    def list_push(key, value):
+        journal.append(value.encode())
+        if json.loads(value)[1] == "b":
+            # pushed, but not merged into the buffer yet
+            pushed.set()
+            resume.wait()
+
+    redis = MagicMock()
+    redis.list_range.side_effect = lambda key, start=0, end=-1: journal[start:None if end == -1 else end + 1]
+    redis.list_push.side_effect = list_push
+    redis.list_trim.side_effect = lambda key, start: journal.__delitem__(slice(0, start))
+    client = make_client()
+    buffer = WriteBehindBuffer(client, redis=redis, journal_key="wb", start=False)
+
+    producer = threading.Thread(target=buffer.patch, args=("b", {"y": 1}))
+    producer.start()
+    pushed.wait()
+    buffer.patch("a", {"x": 1})
+    buffer.flush()
+    # "b" is ahead in the journal and not flushed, so nothing can be trimmed
+    redis.list_trim.assert_not_called()
+
+    resume.set()
+    producer.join()
+    buffer.flush()
+    assert journal == []
+
+
+def test_journal_requires_key():
+    with pytest.raises(ValueError):
+        WriteBehindBuffer(make_client(), redis=MagicMock(), start=False)
+
+
+def test_flush_metrics():
+    metrics = MetricsCollector()
+    buffer = WriteBehindBuffer(make_client(), metrics=metrics, start=False)
+
+    for i in range(3):
+        buffer.patch("a", {"i": i})
+    buffer.flush()
+
+    snapshot = metrics.snapshot()
+    labels = (("resource", "things"),)
+    assert snapshot["counters"]["write_behind_writes_total"][labels] == 3
+    assert snapshot["counters"]["write_behind_patches_total"][labels] == 1
+    assert snapshot["histograms"]["write_behind_coalescing_ratio"][labels]["sum"] == 3
+    assert snapshot["histograms"]["write_behind_flush_duration_seconds"][labels]["count"] == 1